@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import io
+import json
+import os
+import traceback
+from contextlib import redirect_stdout
+
+from ansible.module_utils import basic
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action.normal import ActionModule as NormalActionModule
+from ansible.utils.display import Display
+
+display = Display()
+
+# Set this variable to true to run the modules of the collection in the controller process.
+CONTROLLER_EXECUTION_VAR = 'ibm_cloud_controller_execution'
+MODULES_PACKAGE = 'ansible_collections.ibm.cloud.plugins.modules.'
+
+
+class ActionModule(NormalActionModule):
+    """Run the modules of the collection in the worker process of the controller.
+
+    The modules only call the IBM Cloud APIs, so when a task runs on the
+    controller anyway, with a local connection, the module is imported and its
+    `main()` is called in the worker process, instead of building an AnsiballZ
+    payload and starting a new interpreter for it. The SDK clients, the HTTP
+    sessions and the IAM token are then shared by the items of a loop, and the
+    on-disk caches share the tokens and catalog lookups across tasks.
+
+    This mode is enabled by the `ibm_cloud_controller_execution` variable.
+    Otherwise, and for remote or async tasks, the module runs as usual.
+    """
+
+    def run(self, tmp=None, task_vars=None):
+        task_vars = task_vars or {}
+        if not self._runs_in_controller(task_vars):
+            return super(ActionModule, self).run(tmp, task_vars)
+
+        # Skip the run of the normal action, it's the one that executes the module.
+        result = super(NormalActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_name = (getattr(self._task, 'resolved_action', None) or self._task.action).split('.')[-1]
+        module_args = self._task.args.copy()
+        self._update_module_args(module_name, module_args, task_vars)
+
+        environment = {}
+        self._compute_environment_string(environment)
+
+        display.vvv('Running %s in the controller process' % module_name, host=task_vars.get('inventory_hostname'))
+        result.update(self._run_in_controller(module_name, module_args, environment))
+        return result
+
+    def _runs_in_controller(self, task_vars):
+        enabled = self._templar.template(task_vars.get(CONTROLLER_EXECUTION_VAR, False))
+        return boolean(enabled, strict=False) and self._connection.transport == 'local' and not self._task.async_val
+
+    def _run_in_controller(self, module_name, module_args, environment):
+        """Call the `main()` of a module with its arguments and environment, and return its result."""
+        saved_environ = os.environ.copy()
+        saved_args = basic._ANSIBLE_ARGS
+        output = io.StringIO()
+        try:
+            module = importlib.import_module(MODULES_PACKAGE + module_name)
+            os.environ.update((key, str(value)) for key, value in environment.items())
+            basic._ANSIBLE_ARGS = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': module_args}))
+            if hasattr(basic, '_ANSIBLE_PROFILE'):
+                basic._ANSIBLE_PROFILE = 'legacy'
+            with redirect_stdout(output):
+                module.main()
+        except SystemExit:
+            pass
+        except Exception as ex:
+            return dict(failed=True, msg='MODULE FAILURE: %s' % ex, exception=traceback.format_exc(),
+                        module_stdout=output.getvalue())
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            basic._ANSIBLE_ARGS = saved_args
+
+        try:
+            return json.loads(output.getvalue())
+        except ValueError:
+            return dict(failed=True, msg='MODULE FAILURE: the module did not return a JSON result',
+                        module_stdout=output.getvalue())
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  fields:
+    description:
+      - Only return these fields of the result, to keep large results out of the registered variables.
+      - Each field is a path of keys separated by dots, for example C(resources.id). When a key holds a list,
+        the rest of the path is applied to every item of the list.
+      - The whole result is returned if omitted.
+    type: list
+    elements: str
+'''
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+name: resource_instances
+short_description: IBM Cloud resource instances inventory source
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - Get the resource instances of an account from the IBM Cloud Resource Controller.
+  - Each instance is added as a host named after the instance, with the fields of the instance as host variables.
+  - The hosts are grouped by resource group (C(resource_group_<name>)), service (C(service_<name>)),
+    region (C(region_<name>)) and user tag (C(tag_<tag>)).
+  - Uses a YAML configuration file that ends with C(resource_instances.yml) or C(resource_instances.yaml).
+requirements:
+  - "ResourceControllerV2"
+  - "ResourceManagerV2"
+  - "GlobalTaggingV1"
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description:
+      - The name of this plugin, it should always be set to C(ibm.cloud.resource_instances) for this plugin to recognize it as its own.
+    type: str
+    required: true
+    choices: ['ibm.cloud.resource_instances']
+  resource_group_id:
+    description:
+      - Only return the instances of this resource group.
+    type: str
+  resource_id:
+    description:
+      - Only return the instances of this service, by the unique ID of the offering in the global catalog.
+    type: str
+  state:
+    description:
+      - Only return the instances in this state.
+    type: str
+    default: active
+    choices: [active, provisioning, failed, removed, pending_reclamation]
+  hostname:
+    description:
+      - The field of the instance that is used as its inventory hostname.
+      - Instance names aren't unique within an account, use C(guid) or C(crn) if names are reused.
+    type: str
+    default: name
+    choices: [name, guid, crn]
+  include_tags:
+    description:
+      - Fetch the user tags of each instance into the C(tags) host variable, and group the instances by tag.
+      - This takes one Global Tagging request for each instance.
+    type: bool
+    default: true
+  parallelism:
+    description:
+      - The maximum number of tag requests that run at the same time.
+    type: int
+    default: 5
+notes:
+  - "Authenticate this plugin by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable."
+  - "With I(cache=true), the instances are kept in the inventory cache for I(cache_timeout) seconds, so repeated runs
+    don't list the account again. Use C(--flush-cache) to list it again."
+'''
+
+EXAMPLES = r'''
+# resource_instances.yml
+plugin: ibm.cloud.resource_instances
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/ibm_cloud/inventory
+cache_timeout: 600
+
+# Only the active instances of a resource group, named by GUID
+plugin: ibm.cloud.resource_instances
+resource_group_id: 6bb7ed8d1dc34b6a8e3a5d7d0c7e8f9a
+hostname: guid
+include_tags: false
+keyed_groups:
+  - key: resource_plan_id
+    prefix: plan
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+try:
+    from ..module_utils import config
+    from ..module_utils import pagination
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def get_service_name(crn):
+    """Return the service name segment of a CRN, for example `cloud-object-storage`."""
+    segments = (crn or '').split(':')
+    return segments[4] if len(segments) > 4 else None
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ibm.cloud.resource_instances'
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(('resource_instances.yml', 'resource_instances.yaml'))
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+
+        if MISSING_IMPORT_EXC is not None:
+            raise AnsibleError('Missing required import: ' + str(MISSING_IMPORT_EXC))
+
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+
+        user_cache_setting = self.get_option('cache')
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+
+        instances = None
+        if attempt_to_read_cache:
+            try:
+                instances = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+
+        if instances is None:
+            try:
+                instances = self._fetch_instances()
+            except ApiException as ex:
+                raise AnsibleError('Failed to list the resource instances: %s' % ex.message)
+            except ValueError as ex:
+                raise AnsibleError(str(ex))
+
+        if cache_needs_update:
+            self._cache[cache_key] = instances
+
+        self._populate(instances)
+
+    def _fetch_instances(self):
+        """List the instances and add their resource group name, service name and tags."""
+        sdk = config.get_resource_contollerV2_sdk()
+
+        def list_page(page_start):
+            return sdk.list_resource_instances(
+                resource_group_id=self.get_option('resource_group_id'),
+                resource_id=self.get_option('resource_id'),
+                state=self.get_option('state'),
+                start=page_start,
+            ).get_result()
+
+        instances = []
+        for page in pagination.iter_token_pages(list_page):
+            instances.extend(page.get('resources') or [])
+
+        group_names = self._fetch_resource_group_names()
+        for instance in instances:
+            instance['resource_group_name'] = group_names.get(instance.get('resource_group_id'))
+            instance['service_name'] = get_service_name(instance.get('crn'))
+
+        if self.get_option('include_tags'):
+            tagging_sdk = config.get_global_tagging_sdk()
+
+            def list_tags(instance):
+                tags = tagging_sdk.list_tags(
+                    attached_to=instance['crn'], providers=['ghost'], tag_type='user', limit=1000).get_result()
+                return [tag['name'] for tag in tags.get('items') or []]
+
+            with ThreadPoolExecutor(max_workers=max(self.get_option('parallelism'), 1)) as executor:
+                for instance, tags in zip(instances, executor.map(list_tags, instances)):
+                    instance['tags'] = tags
+
+        return instances
+
+    def _fetch_resource_group_names(self):
+        """Return the names of the resource groups by ID, empty if they can't be listed."""
+        try:
+            groups = config.get_resource_manager_sdk().list_resource_groups().get_result()
+        except ApiException:
+            return {}
+        return dict((group['id'], group['name']) for group in groups.get('resources') or [])
+
+    def _populate(self, instances):
+        hostname_field = self.get_option('hostname')
+        strict = self.get_option('strict')
+
+        for instance in instances:
+            hostname = instance.get(hostname_field)
+            if not hostname:
+                continue
+            self.inventory.add_host(hostname)
+            for key, value in instance.items():
+                self.inventory.set_variable(hostname, key, value)
+
+            groups = [
+                ('resource_group', instance.get('resource_group_name') or instance.get('resource_group_id')),
+                ('service', instance.get('service_name')),
+                ('region', instance.get('region_id')),
+            ]
+            groups.extend(('tag', tag) for tag in instance.get('tags') or [])
+            for prefix, name in groups:
+                if name:
+                    group = self.inventory.add_group(self._sanitize_group_name('%s_%s' % (prefix, name)))
+                    self.inventory.add_child(group, hostname)
+
+            self._set_composite_vars(self.get_option('compose'), instance, hostname, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), instance, hostname, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), instance, hostname, strict=strict)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+name: schematics_inventory
+short_description: IBM Cloud Schematics inventory source
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - Get the hosts and groups of an inventory that is stored in IBM Cloud Schematics, see M(ibm.cloud.ibm_schematics_inventory).
+  - The static hosts and groups of the inventory are read from its C(inventories_ini).
+  - Each resource query of the inventory, see M(ibm.cloud.ibm_schematics_resource_query), is run and its output values
+    are added as hosts to a group that is named after the query.
+  - Uses a YAML configuration file that ends with C(schematics_inventory.yml) or C(schematics_inventory.yaml).
+requirements:
+  - "SchematicsV1"
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description:
+      - The name of this plugin, it should always be set to C(ibm.cloud.schematics_inventory) for this plugin to recognize it as its own.
+    type: str
+    required: true
+    choices: ['ibm.cloud.schematics_inventory']
+  inventory_id:
+    description:
+      - The ID of the Schematics inventory.
+    type: str
+    required: true
+  parallelism:
+    description:
+      - The maximum number of resource queries that run at the same time.
+    type: int
+    default: 5
+notes:
+  - "Authenticate this plugin by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable."
+  - "With I(cache=true), the resolved hosts and groups are kept in the inventory cache for I(cache_timeout) seconds,
+    so repeated runs don't run the resource queries again. Use C(--flush-cache) to resolve them again."
+'''
+
+EXAMPLES = r'''
+# schematics_inventory.yml
+plugin: ibm.cloud.schematics_inventory
+inventory_id: us-east.INVENTORY.my-inventory.1a2b3c4d
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/ibm_cloud/inventory
+cache_timeout: 600
+'''
+
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+try:
+    from ..module_utils import config
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def new_group():
+    return {'hosts': {}, 'children': [], 'vars': {}}
+
+
+def parse_inventory_ini(text):
+    """Parse the hosts and groups of an inventory in the INI format.
+
+    Supports the `[group]`, `[group:children]` and `[group:vars]` sections,
+    and `key=value` host variables. Hosts outside of a section are in the
+    `ungrouped` group.
+
+    Args:
+        text (str): the inventory
+
+    Returns:
+        dict: the `hosts`, `children` and `vars` of each group by name
+    """
+    groups = {}
+    group, section = 'ungrouped', 'hosts'
+
+    for line in (text or '').splitlines():
+        line = line.strip()
+        if not line or line.startswith(('#', ';')):
+            continue
+
+        if line.startswith('[') and line.endswith(']'):
+            group, _sep, section = line[1:-1].partition(':')
+            section = section or 'hosts'
+            if section not in ('hosts', 'children', 'vars'):
+                raise AnsibleError('Invalid section in the Schematics inventory: %s' % line)
+            groups.setdefault(group, new_group())
+            continue
+
+        if section == 'children':
+            groups.setdefault(group, new_group())['children'].append(line)
+            continue
+
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            continue
+        if section == 'vars':
+            key, _sep, value = line.partition('=')
+            groups.setdefault(group, new_group())['vars'][key.strip()] = value.strip()
+        else:
+            host_vars = dict(token.split('=', 1) for token in tokens[1:] if '=' in token)
+            groups.setdefault(group, new_group())['hosts'][tokens[0]] = host_vars
+
+    return groups
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ibm.cloud.schematics_inventory'
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(('schematics_inventory.yml', 'schematics_inventory.yaml'))
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+
+        if MISSING_IMPORT_EXC is not None:
+            raise AnsibleError('Missing required import: ' + str(MISSING_IMPORT_EXC))
+
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+
+        user_cache_setting = self.get_option('cache')
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+
+        groups = None
+        if attempt_to_read_cache:
+            try:
+                groups = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+
+        if groups is None:
+            try:
+                groups = self._resolve_inventory(self.get_option('inventory_id'))
+            except ApiException as ex:
+                raise AnsibleError('Failed to resolve the Schematics inventory: %s' % ex.message)
+            except ValueError as ex:
+                raise AnsibleError(str(ex))
+
+        if cache_needs_update:
+            self._cache[cache_key] = groups
+
+        self._populate(groups)
+
+    def _resolve_inventory(self, inventory_id):
+        """Resolve the static groups and the resource queries of an inventory into groups of hosts."""
+        sdk = config.get_schematicsv1_sdk()
+        inventory = sdk.get_inventory(inventory_id=inventory_id).get_result()
+        groups = parse_inventory_ini(inventory.get('inventories_ini'))
+
+        def resolve_query(query_id):
+            query = sdk.get_resources_query(query_id=query_id).get_result()
+            output = sdk.execute_resource_query(query_id=query_id).get_result()
+            hosts = {}
+            for response in output.get('response') or []:
+                for item in response.get('query_output') or []:
+                    if item.get('value'):
+                        hosts[item['value']] = {}
+            return query.get('name') or query_id, hosts
+
+        query_ids = inventory.get('resource_queries') or []
+        with ThreadPoolExecutor(max_workers=max(self.get_option('parallelism'), 1)) as executor:
+            for name, hosts in executor.map(resolve_query, query_ids):
+                groups.setdefault(name, new_group())['hosts'].update(hosts)
+
+        return groups
+
+    def _populate(self, groups):
+        strict = self.get_option('strict')
+
+        names = {}
+        for name in groups:
+            names[name] = self.inventory.add_group(self._sanitize_group_name(name))
+
+        for name, group in groups.items():
+            for child in group['children']:
+                if child not in names:
+                    names[child] = self.inventory.add_group(self._sanitize_group_name(child))
+                self.inventory.add_child(names[name], names[child])
+            for key, value in group['vars'].items():
+                self.inventory.set_variable(names[name], key, value)
+            for host, host_vars in group['hosts'].items():
+                self.inventory.add_host(host, group=names[name])
+                for key, value in host_vars.items():
+                    self.inventory.set_variable(host, key, value)
+
+        for host in self.inventory.hosts:
+            host_vars = self.inventory.get_host(host).get_vars()
+            self._set_composite_vars(self.get_option('compose'), host_vars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), host_vars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_vars, host, strict=strict)
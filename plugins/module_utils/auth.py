@@ -9,14 +9,113 @@ __metaclass__ = type
 import os
 
 try:
-    from ibm_cloud_sdk_core import get_authenticator_from_environment
+    import jwt
+    from ibm_cloud_sdk_core import ApiException, get_authenticator_from_environment
     from ibm_cloud_sdk_core.authenticators import Authenticator, IAMAuthenticator
-    from ibm_platform_services import ResourceControllerV2
+    from ibm_cloud_sdk_core.token_managers.iam_token_manager import IAMTokenManager
 except ImportError:
     raise
 
+from ..module_utils import cache
+from ..module_utils import sdk
+from ..module_utils import sessions
+
 
 RESOURCE_CONTROLLER_SERVICE_NAME = 'resource_controller'
+TOKEN_CACHE_NAME = 'tokens'
+# Cached tokens are refreshed once less than this fraction of their lifetime is left.
+TOKEN_REFRESH_BUFFER = 0.2
+
+
+class PooledIAMTokenManager(IAMTokenManager):
+    """IAM token manager that sends its token requests on the shared session of the IAM host.
+
+    The SDK opens a new connection for each token request, this manager reuses
+    the pooled connections of `sessions.get_session` instead.
+    """
+
+    def _request(self, method, url, *, headers=None, params=None, data=None, auth_tuple=None, **kwargs) -> dict:
+        kwargs = dict({'timeout': sessions.DEFAULT_READ_TIMEOUT}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+
+        if self.disable_ssl_verification:
+            kwargs['verify'] = False
+
+        response = sessions.get_session(url).request(
+            method=method, url=url, headers=headers, params=params, data=data, auth=auth_tuple, **kwargs
+        )
+        if 200 <= response.status_code <= 299:
+            return response.json()
+
+        raise ApiException(response.status_code, http_response=response)
+
+
+class CachedIAMTokenManager(PooledIAMTokenManager):
+    """IAM token manager that shares its tokens with the other processes on the host.
+
+    Tokens are stored in the on-disk token cache, keyed by a hash of the API key and
+    the IAM endpoint. A token request first looks at the cache and only calls IAM if
+    the cached token is missing or due for refresh. The cache file is locked while
+    a new token is requested, so concurrent processes wait for that single request
+    and then pick up its result instead of all refreshing at once.
+
+    Args:
+        apikey (str): the IBM Cloud API key
+        cache_dir (str): directory of the token cache
+        kwargs: passed through to `IAMTokenManager`
+    """
+
+    def __init__(self, apikey: str, *, cache_dir: str, **kwargs) -> None:
+        super().__init__(apikey, **kwargs)
+        self.cache_path = os.path.join(cache_dir, cache.cache_key(apikey, self.url) + '.json')
+
+    def request_token(self) -> dict:
+        with cache.file_lock(self.cache_path):
+            token_response = cache.read_json(self.cache_path)
+            if token_response is not None and self._is_cached_token_fresh(token_response):
+                return token_response
+
+            token_response = super().request_token()
+            # The refresh token is never used by the SDK, so keep it out of the cache.
+            cache.write_json(self.cache_path, {
+                key: value for key, value in token_response.items() if key != 'refresh_token'})
+
+        return token_response
+
+    def _is_cached_token_fresh(self, token_response: dict) -> bool:
+        try:
+            decoded = jwt.decode(token_response['access_token'], algorithms=['RS256'],
+                                 options={'verify_signature': False, 'verify_aud': False})
+            expire_time = int(decoded['exp'])
+            issued_at = int(decoded['iat'])
+        except (KeyError, TypeError, ValueError, jwt.PyJWTError):
+            return False
+
+        refresh_time = expire_time - (expire_time - issued_at) * TOKEN_REFRESH_BUFFER
+        return self._get_current_time() < refresh_time
+
+
+def get_iam_authenticator(apikey: str) -> IAMAuthenticator:
+    """Create and return an IAM authenticator for the given API key.
+
+    The authenticator uses the shared token cache, unless caching is disabled,
+    and the shared session of the IAM host.
+
+    Args:
+        apikey (str): the IBM Cloud API key
+
+    Returns:
+        IAMAuthenticator: the created authenticator
+    """
+    authenticator = IAMAuthenticator(apikey=apikey)
+
+    cache_dir = cache.get_cache_dir(TOKEN_CACHE_NAME)
+    if cache_dir is not None:
+        authenticator.token_manager = CachedIAMTokenManager(apikey, cache_dir=cache_dir)
+    else:
+        authenticator.token_manager = PooledIAMTokenManager(apikey)
+
+    return authenticator
 
 
 def get_authenticator(service_name: str) -> Authenticator:
@@ -38,7 +137,7 @@ def get_authenticator(service_name: str) -> Authenticator:
         if apikey is None:
             return None
 
-        authenticator = IAMAuthenticator(apikey=apikey)
+        authenticator = get_iam_authenticator(apikey)
 
     return authenticator
 
@@ -59,6 +158,8 @@ def get_service_url(resource_id: str, fallback_authenticator: Authenticator) ->
     Returns:
         str: the retrieved service URL for the resource or None
     """
+    # Imported here, so modules that don't need it don't load the platform services SDK.
+    ResourceControllerV2 = sdk.import_service('ibm_platform_services.resource_controller_v2', 'ResourceControllerV2')
 
     authenticator = get_authenticator(ResourceControllerV2.DEFAULT_SERVICE_NAME)
     if authenticator is not None:
@@ -67,6 +168,7 @@ def get_service_url(resource_id: str, fallback_authenticator: Authenticator) ->
         resource_controller = ResourceControllerV2(fallback_authenticator)
 
     resource_controller.configure_service(RESOURCE_CONTROLLER_SERVICE_NAME)
+    sessions.configure_service(resource_controller)
     resource = resource_controller.get_resource_instance(resource_id).get_result()
 
     return resource.get('extensions', {}).get('endpoints', {}).get('public')
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+CACHE_ENV = 'IC_CACHE'
+CACHE_DIR_ENV = 'IC_CACHE_DIR'
+DEFAULT_CACHE_DIR = os.path.join('~', '.ansible', 'ibm_cloud')
+
+
+def get_cache_dir(name: str) -> str:
+    """Return the directory of the named on-disk cache, creating it if needed.
+
+    The caches live under `IC_CACHE_DIR` (default `~/.ansible/ibm_cloud`) so every
+    module process on the controller shares them. Setting `IC_CACHE` to `false`
+    disables all of them.
+
+    Args:
+        name (str): name of the cache, used as the sub-directory
+
+    Returns:
+        str: path of the cache directory or None if caching is disabled or unavailable
+    """
+    if os.getenv(CACHE_ENV, 'true').lower() in ('0', 'false', 'no', 'off'):
+        return None
+
+    path = os.path.join(os.path.expanduser(os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR), name)
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except OSError:
+        return None
+
+    return path
+
+
+def cache_key(*parts: str) -> str:
+    """Return a stable file name safe hash of the given parts.
+
+    Args:
+        parts (str): the values that identify a cache entry
+
+    Returns:
+        str: hex encoded SHA-256 digest of the parts
+    """
+    return hashlib.sha256('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive lock on `path` for the duration of the context.
+
+    The lock is taken on a `.lock` file next to `path`, so the cache file itself
+    can be replaced atomically while the lock is held. The lock file can be
+    removed with its cache file, see `remove_locked`, a process that was waiting
+    for the removed lock file then locks the new one.
+
+    Args:
+        path (str): path of the file to lock
+    """
+    lock_path = path + '.lock'
+    while True:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_ino == os.stat(lock_path).st_ino:
+                break
+        except OSError:
+            pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def remove_locked(path: str) -> bool:
+    """Remove a cache file and its lock file, while holding its lock.
+
+    Args:
+        path (str): path of the cache file
+
+    Returns:
+        bool: whether the cache file was removed
+    """
+    try:
+        os.unlink(path)
+    except OSError:
+        return False
+    finally:
+        try:
+            os.unlink(path + '.lock')
+        except OSError:
+            pass
+    return True
+
+
+def read_json(path: str):
+    """Load a cache file.
+
+    Args:
+        path (str): path of the cache file
+
+    Returns:
+        the decoded content or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, 'r') as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: str, data) -> None:
+    """Atomically replace a cache file with the JSON encoded data.
+
+    The file is only readable by the current user. Errors are ignored, since a
+    cache that can't be written is just a cache miss for the next reader.
+
+    Args:
+        path (str): path of the cache file
+        data: JSON serializable content
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'w') as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
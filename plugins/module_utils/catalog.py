@@ -1,28 +1,102 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ibm_platform_services import GlobalCatalogV1
+import functools
+import os
+import time
+
+from ..module_utils import cache
 from ..module_utils import config
 
+CATALOG_CACHE_NAME = 'catalog'
+CATALOG_CACHE_TTL_ENV = 'IC_CATALOG_CACHE_TTL'
+DEFAULT_CATALOG_CACHE_TTL = 3600
 
-def get_serviceID_targetCRN_planID(service_name, plan, location):
 
-    servicePlanID = ""
-    catalogCRN = ""
-    serviceID = ""
+def get_cache_ttl():
+    """Return the lifetime of the cached catalog resolutions in seconds, 0 disables the cache."""
+    try:
+        return max(int(os.getenv(CATALOG_CACHE_TTL_ENV, DEFAULT_CATALOG_CACHE_TTL)), 0)
+    except ValueError:
+        return DEFAULT_CATALOG_CACHE_TTL
 
-    serviceID, servicePlanID = get_planID(service_name, plan)
-    if servicePlanID != "":
-        deployments = get_child_objects(servicePlanID)
-        for deployment in deployments:
-            if deployment['metadata']['deployment']['location'] == location:
-                catalogCRN = deployment['catalog_crn']
 
-    if serviceID == "" or catalogCRN == "" or servicePlanID == "":
-        raise ValueError(
-            "[ERROR] either of service plan or service name or location is invalid or not found")
-    else:
-        return serviceID, catalogCRN, servicePlanID
+def cache_enabled():
+    """Return whether the catalog resolutions are cached, see `IC_CACHE` and `IC_CATALOG_CACHE_TTL`."""
+    return bool(get_cache_ttl()) and cache.get_cache_dir(CATALOG_CACHE_NAME) is not None
+
+
+def resolution_cache(func):
+    """Cache the result of a catalog name resolution on disk for the cache TTL.
+
+    Entries are keyed by the resolver, its arguments (service name, plan, location)
+    and the API key, since private catalog entries are only visible to some accounts.
+    The entry is locked while it's resolved, so concurrent processes asking for the
+    same name wait for a single set of catalog requests. Failed resolutions aren't cached.
+    Pass `refresh=True` to resolve again and replace the cached entry.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, refresh=False):
+        ttl = get_cache_ttl()
+        cache_dir = cache.get_cache_dir(CATALOG_CACHE_NAME) if ttl else None
+        if cache_dir is None:
+            return func(*args)
+
+        key = [func.__name__] + list(args)
+        path = os.path.join(cache_dir, cache.cache_key(os.getenv('IC_API_KEY', ''), *key) + '.json')
+        with cache.file_lock(path):
+            entry = cache.read_json(path)
+            if refresh or entry is None or entry.get('expires_at', 0) <= time.time():
+                result = func(*args)
+                entry = {'key': key, 'expires_at': time.time() + ttl, 'value': result}
+                cache.write_json(path, entry)
+
+        value = entry['value']
+        return tuple(value) if isinstance(value, list) else value
+
+    return wrapper
+
+
+def invalidate_cache(service_name=None):
+    """Remove the cached catalog resolutions.
+
+    Args:
+        service_name (str): only remove the entries of this service, all entries by default
+
+    Returns:
+        int: the number of removed entries
+    """
+    cache_dir = cache.get_cache_dir(CATALOG_CACHE_NAME)
+    if cache_dir is None:
+        return 0
+
+    removed = 0
+    for file_name in os.listdir(cache_dir):
+        if file_name.endswith('.json.lock'):
+            # The lock of a resolution that failed, and so has no entry, is removed with all the entries.
+            path = os.path.join(cache_dir, file_name[:-len('.lock')])
+            if service_name is None:
+                with cache.file_lock(path):
+                    if not os.path.exists(path):
+                        cache.remove_locked(path)
+            continue
+        if not file_name.endswith('.json'):
+            continue
+        path = os.path.join(cache_dir, file_name)
+        with cache.file_lock(path):
+            entry = cache.read_json(path)
+            if service_name is not None and entry is not None and entry.get('key', [None, None])[1] != service_name:
+                continue
+            if cache.remove_locked(path):
+                removed += 1
+
+    return removed
+
+
+def get_serviceID_targetCRN_planID(service_name, plan, location):
+    service_index = lookup_index(service_name, plan, location)
+    plan_index = service_index['plans'][plan]
+    return service_index['id'], plan_index['locations'][location], plan_index['id']
 
 
 def get_child_objects(id):
@@ -36,6 +110,7 @@ def get_child_objects(id):
     return resources
 
 
+@resolution_cache
 def get_serviceID(service_name):
     catalog_sdk = config.get_global_catalog_sdk()
     serviceID_result = catalog_sdk.list_catalog_entries(
@@ -52,20 +127,78 @@ def get_serviceID(service_name):
 
 
 def get_planID(service_name, plan):
-    servicePlanID = ""
-    serviceID = ""
+    service_index = lookup_index(service_name, plan)
+    return service_index['id'], service_index['plans'][plan]['id']
+
 
+@resolution_cache
+def get_service_index(service_name):
+    """Fetch the plan and deployment tree of a service and return it as a lookup structure.
+
+    The tree is fetched with a single catalog request and reduced to the names needed
+    to resolve a plan and location, for example::
+
+        {'id': '<service ID>', 'plans': {'standard': {'id': '<plan ID>', 'locations': {'us-south': '<catalog CRN>'}}}}
+
+    Args:
+        service_name (str): name of the service
+
+    Returns:
+        dict: the service index
+    """
     serviceID = get_serviceID(service_name)
-    if serviceID != "":
-        resources = get_child_objects(serviceID)
-        for resource in resources:
-            if resource['name'] == plan:
-                servicePlanID = resource['id']
-    if serviceID == "" or servicePlanID == "":
+    catalog_sdk = config.get_global_catalog_sdk()
+    service = catalog_sdk.get_catalog_entry(
+        id=serviceID,
+        complete=True,
+        depth=2,
+    ).get_result()
+
+    plans = {}
+    for plan in service.get('children') or []:
+        locations = {}
+        for deployment in plan.get('children') or []:
+            location = ((deployment.get('metadata') or {}).get('deployment') or {}).get('location')
+            if location:
+                locations[location] = deployment['catalog_crn']
+        plans[plan['name']] = {'id': plan['id'], 'locations': locations}
+
+    return {'id': serviceID, 'plans': plans}
+
+
+def lookup_index(service_name, plan, location=None):
+    """Return the index of the service, after checking that it knows the plan and location.
+
+    A cached index that misses the plan or location is fetched again once, so a plan or
+    region added after the index was cached is still found.
+
+    Raises:
+        ValueError: the service, plan or location is not found
+    """
+    for refresh in ((False, True) if get_cache_ttl() else (False,)):
+        service_index = get_service_index(service_name, refresh=refresh)
+        plan_index = service_index['plans'].get(plan)
+        if plan_index is not None and (location is None or location in plan_index['locations']):
+            return service_index
+
+    if location is None:
         raise ValueError(
             "[ERROR] either of service plan or service name is invalid or not found")
-    else:
-        return serviceID, servicePlanID
+    raise ValueError(
+        "[ERROR] either of service plan or service name or location is invalid or not found")
+
+
+def prewarm(service_names, refresh=False):
+    """Build and cache the index of every given service.
+
+    Args:
+        service_names (list): names of the services
+        refresh (bool): fetch the indexes again even if they are cached
+
+    Returns:
+        dict: the index of each service keyed by its name
+    """
+    return dict((service_name, get_service_index(service_name, refresh=refresh)) for service_name in service_names)
 
 # serviceID,catalogCRN,servicePlanID = get_serviceID_targetCRN_planID(service_name,plan,location)
 # print (serviceID, catalogCRN,servicePlanID)
@@ -1,59 +1,150 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import functools
 import os
-from ibm_cloud_sdk_core import get_authenticator_from_environment
-from ibm_cloud_sdk_core.authenticators import Authenticator, IAMAuthenticator
-from ibm_platform_services import CatalogManagementV1, ResourceControllerV2, ResourceManagerV2, IamAccessGroupsV2, IamIdentityV1, GlobalCatalogV1
-from ibm_schematics import SchematicsV1
+import threading
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ..module_utils import auth
+from ..module_utils import sdk
+from ..module_utils import sessions
+from ..module_utils.auth import get_iam_authenticator
 
+# The SDK classes are imported inside the factory functions, so a module only
+# loads the service SDK it actually uses, see sdk.import_service. The clients
+# share a pooled HTTP session per host, see sessions.configure_service.
 
+_clients = {}
+# Reentrant, since the client factories call the memoized get_authenticator.
+_clients_lock = threading.RLock()
+
+
+def memoized(factory=None, service_name=None):
+    """Share the object built by a factory within the process.
+
+    The objects are keyed by the factory and the API key, so every helper of
+    a module run gets the same SDK client, and all the clients share one
+    authenticator and its IAM token, instead of each building their own.
+    With `service_name`, the environment variables that configure the client
+    of that service, like `RESOURCE_MANAGER_URL`, are part of the key too.
+    """
+    if factory is None:
+        return functools.partial(memoized, service_name=service_name)
+
+    prefix = service_name.upper() + '_' if service_name else None
+
+    @functools.wraps(factory)
+    def wrapper():
+        key = (factory.__name__, os.getenv('IC_API_KEY'))
+        if prefix is not None:
+            key += tuple(sorted(item for item in os.environ.items() if item[0].startswith(prefix)))
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = factory()
+        return client
+
+    return wrapper
+
+
+def clear_clients() -> None:
+    """Forget the shared clients and authenticators, the next calls of the factories build new ones."""
+    with _clients_lock:
+        _clients.clear()
+
+
+@memoized
 def get_authenticator() -> Authenticator:
     apikey = os.getenv('IC_API_KEY')
     if apikey is None:
         raise ValueError(
             "[ERROR] Please export IC_API_KEY. Value for APIKey is None")
-    authenticator = IAMAuthenticator(apikey=apikey)
+    authenticator = get_iam_authenticator(apikey)
     return authenticator
 
 
+@memoized
 def get_catalog_management_sdk():
-    return CatalogManagementV1(
+    CatalogManagementV1 = sdk.import_service('ibm_platform_services.catalog_management_v1', 'CatalogManagementV1')
+    return sessions.configure_service(CatalogManagementV1(
         authenticator=get_authenticator(),
-    )
+    ))
 
 
+@memoized
 def get_resource_contollerV2_sdk():
-    return ResourceControllerV2(
+    ResourceControllerV2 = sdk.import_service('ibm_platform_services.resource_controller_v2', 'ResourceControllerV2')
+    return sessions.configure_service(ResourceControllerV2(
         authenticator=get_authenticator(),
-    )
+    ))
 
 
+@memoized
 def get_resource_manager_sdk():
-    return ResourceManagerV2(
+    ResourceManagerV2 = sdk.import_service('ibm_platform_services.resource_manager_v2', 'ResourceManagerV2')
+    return sessions.configure_service(ResourceManagerV2(
         authenticator=get_authenticator(),
+    ))
+
+
+@memoized(service_name='resource_manager')
+def get_resource_manager_sdk_from_environment():
+    """Build the Resource Manager client from the `RESOURCE_MANAGER_*` environment variables.
+
+    The authenticator and the service URL are read from the environment, like
+    the SDK does, and the authenticator falls back to `IC_API_KEY`, see
+    `auth.get_authenticator`.
+
+    Raises:
+        ValueError: no authenticator can be created
+    """
+    authenticator = auth.get_authenticator(service_name='resource_manager')
+    if authenticator is None:
+        raise ValueError('Cannot create the authenticator.')
+
+    ResourceManagerV2 = sdk.import_service('ibm_platform_services.resource_manager_v2', 'ResourceManagerV2')
+    service = ResourceManagerV2(
+        authenticator=authenticator,
     )
+    service.configure_service('resource_manager')
+    return sessions.configure_service(service)
 
 
+@memoized
 def get_iam_access_group_sdk():
-    return IamAccessGroupsV2(
+    IamAccessGroupsV2 = sdk.import_service('ibm_platform_services.iam_access_groups_v2', 'IamAccessGroupsV2')
+    return sessions.configure_service(IamAccessGroupsV2(
         authenticator=get_authenticator(),
-    )
+    ))
 
 
+@memoized
 def get_iam_identity_sdk():
-    return IamIdentityV1(
+    IamIdentityV1 = sdk.import_service('ibm_platform_services.iam_identity_v1', 'IamIdentityV1')
+    return sessions.configure_service(IamIdentityV1(
         authenticator=get_authenticator(),
-    )
+    ))
 
 
+@memoized
 def get_schematicsv1_sdk():
-    return SchematicsV1(
+    from ibm_schematics.schematics_v1 import SchematicsV1
+    return sessions.configure_service(SchematicsV1(
         authenticator=get_authenticator(),
-    )
+    ))
 
 
+@memoized
 def get_global_catalog_sdk():
-    return GlobalCatalogV1(
+    GlobalCatalogV1 = sdk.import_service('ibm_platform_services.global_catalog_v1', 'GlobalCatalogV1')
+    return sessions.configure_service(GlobalCatalogV1(
         authenticator=get_authenticator(),
-    )
+    ))
+
+
+@memoized
+def get_global_tagging_sdk():
+    GlobalTaggingV1 = sdk.import_service('ibm_platform_services.global_tagging_v1', 'GlobalTaggingV1')
+    return sessions.configure_service(GlobalTaggingV1(
+        authenticator=get_authenticator(),
+    ))
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+# Fields that are set by the services, they are never part of a patch.
+SERVER_MANAGED_FIELDS = frozenset([
+    'id',
+    'guid',
+    'crn',
+    'url',
+    'href',
+    'etag',
+    'rev',
+    '_rev',
+    'created_at',
+    'created_by',
+    'updated_at',
+    'updated_by',
+    'deleted_at',
+    'deleted_by',
+])
+
+
+def normalize(value):
+    """Normalize a value before it's compared.
+
+    Drops the keys with a None value from dicts, since the services omit the
+    fields that aren't set, and normalizes nested dicts and lists.
+
+    Args:
+        value: the value to normalize
+
+    Returns:
+        the normalized value
+    """
+    if isinstance(value, dict):
+        return dict((key, normalize(item)) for key, item in value.items() if item is not None)
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return value
+
+
+def get_patch(desired, actual, ignore=SERVER_MANAGED_FIELDS):
+    """Return the minimal patch that turns the actual resource into the desired one.
+
+    Only the fields of the desired resource are compared, so fields that the
+    task doesn't set and fields that only the service sets never show up in
+    the patch. Nested dicts are compared the same way and only their
+    differing keys are kept. Lists are replaced as a whole when they differ,
+    lists of scalars are compared regardless of their order.
+
+    Args:
+        desired (dict): the desired fields, None values are not set
+        actual (dict): the resource as returned by the service
+        ignore (set): the fields that are never compared
+
+    Returns:
+        dict: the fields that differ with their desired value, empty if the resource is up to date
+    """
+    return _dict_patch(normalize(desired), normalize(actual or {}), ignore)
+
+
+def _dict_patch(desired, actual, ignore):
+    patch = {}
+    for key, value in desired.items():
+        if key in ignore:
+            continue
+        current = actual.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            nested = _dict_patch(value, current, ())
+            if nested:
+                patch[key] = nested
+        elif not _matches(value, current):
+            patch[key] = value
+    return patch
+
+
+def _matches(desired, actual):
+    if isinstance(desired, dict):
+        return isinstance(actual, dict) and not _dict_patch(desired, actual, ())
+    if isinstance(desired, list):
+        if not isinstance(actual, list) or len(desired) != len(actual):
+            return False
+        if all(_is_scalar(item) for item in desired + actual):
+            return sorted(desired, key=repr) == sorted(actual, key=repr)
+        return all(_matches(item, current) for item, current in zip(desired, actual))
+    return desired == actual
+
+
+def _is_scalar(value):
+    return not isinstance(value, (dict, list))
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from ibm_cloud_sdk_core import get_query_param
+except ImportError:
+    raise
+
+
+DEFAULT_PARALLELISM = 5
+
+
+def iter_token_pages(list_page, start=None, next_field='next_url', token_param='start'):
+    """Iterate over the pages of a list operation that uses page tokens.
+
+    The token of the next page is taken from the `next_url` of each page, until a
+    page comes without one.
+
+    Args:
+        list_page (callable): called with the page token (None for the first page), returns the page as a dict
+        start (str): the token of the first page to return
+        next_field (str): the field of the page that holds the URL of the next page
+        token_param (str): the query parameter of that URL that holds the page token
+
+    Yields:
+        dict: the result of each page
+    """
+    token = start
+    while True:
+        page = list_page(token)
+        yield page
+
+        next_url = page.get(next_field)
+        token = get_query_param(next_url, token_param) if next_url else None
+        if not token:
+            return
+
+
+def iter_offset_pages(list_page, items_field, offset=None, limit=None):
+    """Iterate over the pages of a list operation that uses offset and limit paging.
+
+    The pages are fetched one by one, so the caller can stop as soon as it has
+    the items it needs. The listing ends at the first page that comes with
+    fewer items than `limit`, for the operations that don't return a
+    `total_count`.
+
+    Args:
+        list_page (callable): called with the offset and limit of a page, returns the page as a dict
+        items_field (str): the field of the page that holds the items
+        offset (int): the offset of the first item
+        limit (int): the page size
+
+    Yields:
+        dict: the result of each page
+    """
+    offset = offset or 0
+    while True:
+        page = list_page(offset, limit)
+        yield page
+
+        items = page.get(items_field) or []
+        offset += len(items)
+        if not items or (limit and len(items) < limit) or offset >= page.get('total_count', offset + 1):
+            return
+
+
+def fetch_offset_pages(list_page, items_field, offset=None, limit=None, parallelism=DEFAULT_PARALLELISM):
+    """Fetch all pages of a list operation that uses offset and limit paging.
+
+    The first page is fetched alone to learn the `total_count` and the page size,
+    then the remaining pages are fetched in parallel by a bounded thread pool.
+    The items are merged in the order of their offsets.
+
+    Args:
+        list_page (callable): called with the offset and limit of a page, returns the page as a dict
+        items_field (str): the field of the page that holds the items
+        offset (int): the offset of the first item
+        limit (int): the page size, the service default if omitted
+        parallelism (int): the maximum number of pages fetched at the same time
+
+    Returns:
+        dict: the `total_count`, `offset` and `limit` of the listing and all the items in `items_field`
+    """
+    offset = offset or 0
+    first_page = list_page(offset, limit)
+    items = list(first_page.get(items_field) or [])
+    total_count = first_page.get('total_count', len(items))
+    page_size = first_page.get('limit') or limit or len(items)
+
+    if page_size:
+        offsets = range(offset + page_size, total_count, page_size)
+        with ThreadPoolExecutor(max_workers=max(parallelism, 1)) as executor:
+            for page in executor.map(lambda page_offset: list_page(page_offset, page_size), offsets):
+                items.extend(page.get(items_field) or [])
+
+    return {
+        'total_count': total_count,
+        'offset': offset,
+        'limit': len(items),
+        items_field: items,
+    }
+
+
+class JSONLinesWriter:
+    """Write items to a file, one JSON document per line.
+
+    Used to stream large listings to disk page by page, instead of keeping
+    all items in memory until the module exits.
+
+    Args:
+        path (str): path of the file, it's replaced if it exists
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'w')
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+
+    def extend(self, items) -> None:
+        for item in items:
+            self._file.write(json.dumps(item, sort_keys=True))
+            self._file.write('\n')
+            self.count += 1
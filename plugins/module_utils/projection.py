@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+def project_fields(data, fields):
+    """Keep only the given fields of a result.
+
+    Each field is a path of keys separated by dots. The projection keeps the
+    structure of the result: nested dicts keep only the selected keys, and a
+    path that reaches a list is applied to every item of that list, for example
+    `resources.id` keeps the `id` of every item of `resources`. Keys that aren't
+    in the result are ignored. A path that is also the parent of another path
+    keeps its whole value, `resources` and `resources.id` keep all of `resources`.
+
+    Args:
+        data: the result to project
+        fields (list): the paths to keep, the whole result is returned if empty
+
+    Returns:
+        the projected result
+    """
+    if not fields:
+        return data
+
+    tree = {}
+    for field in fields:
+        node = tree
+        *parents, last = field.split('.')
+        for key in parents:
+            node = node.setdefault(key, {})
+            if node is None:
+                break
+        else:
+            node[last] = None
+
+    return _project(data, tree)
+
+
+def _project(data, tree):
+    # None is the end of a path, so the whole value is kept.
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [_project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return dict((key, _project(data[key], subtree)) for key, subtree in tree.items() if key in data)
+    return data
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    from ibm_cloud_sdk_core import ApiException
+except ImportError:
+    raise
+
+from ..module_utils import cache
+from ..module_utils import wait
+
+
+CACHE_NAME = 'ratelimit'
+RATE_LIMITS_ENV = 'IC_RATE_LIMITS'
+RETRIES_ENV = 'IC_RATE_LIMIT_RETRIES'
+DEFAULT_MAX_RETRIES = 5
+MAX_RETRY_AFTER = 300
+# The rate of a bucket is multiplied by DECREASE_FACTOR on each 429, down to
+# MIN_RATE_FACTOR of its budget, and recovers to the budget in RECOVERY_TIME seconds.
+DECREASE_FACTOR = 0.5
+MIN_RATE_FACTOR = 0.1
+RECOVERY_TIME = 60
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Limit the rate of the calls that the threads of a module make.
+
+    Tokens are added at `rate` per second, up to `burst` tokens. Each call
+    takes a token, and waits until one is available if the bucket is empty.
+
+    Args:
+        rate (float): the tokens added per second, no limit if it's None or 0
+        burst (int): the maximum number of tokens, the calls that can be made at once
+        clock (callable): a monotonic clock in seconds
+        sleep (callable): used to wait for a token
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting until one is available.
+
+        Returns:
+            float: the seconds waited
+        """
+        if not self.rate:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class SharedTokenBucket:
+    """Limit the rate of the calls to a service that all the module processes make.
+
+    The state of the bucket is kept in a file of the `ratelimit` cache, locked
+    while it's updated, so the forks of the controller share the budget of the
+    service. It falls back to a bucket of the process when the cache is
+    disabled.
+
+    When the service answers 429, `throttle` stops the calls of every process
+    until its `Retry-After` is over, and cuts the rate of the bucket in half.
+    The rate then recovers linearly to the budget within `RECOVERY_TIME`
+    seconds, so the processes settle just below the limit of the service.
+
+    Args:
+        name (str): the name of the service
+        rate (float): the budget, in calls per second, no limit if it's None or 0
+        burst (int): the maximum number of tokens, the calls that can be made at once
+        clock (callable): a clock in seconds that is shared by the processes
+        sleep (callable): used to wait for a token
+    """
+
+    def __init__(self, name, rate=None, burst=1, clock=time.time, sleep=time.sleep):
+        self.name = name
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._memory = {}
+        cache_dir = cache.get_cache_dir(CACHE_NAME)
+        self.path = os.path.join(cache_dir, cache.cache_key(name) + '.json') if cache_dir else None
+
+    @contextmanager
+    def _state(self):
+        """Yield the state of the bucket to update, locked for the threads and processes."""
+        with self._lock:
+            if self.path is None:
+                yield self._memory
+                return
+
+            with cache.file_lock(self.path):
+                state = cache.read_json(self.path) or {}
+                original = dict(state)
+                yield state
+                if state != original:
+                    cache.write_json(self.path, state)
+
+    def _blocked_until(self):
+        if self.path is None:
+            return self._memory.get('blocked_until', 0)
+        return (cache.read_json(self.path) or {}).get('blocked_until', 0)
+
+    def acquire(self):
+        """Take a token, waiting until one is available and the service isn't throttled.
+
+        Returns:
+            float: the seconds waited
+        """
+        waited = 0.0
+        while True:
+            if not self.rate:
+                # Without a budget, only the throttling of the service is shared.
+                delay = self._blocked_until() - self._clock()
+                if delay <= 0:
+                    return waited
+            else:
+                with self._state() as state:
+                    now = self._clock()
+                    elapsed = max(now - state.get('updated', now), 0)
+                    rate = min(self.rate, state.get('rate', self.rate) + self.rate * elapsed / RECOVERY_TIME)
+                    tokens = min(self.burst, state.get('tokens', self.burst) + elapsed * rate)
+                    state.update(rate=rate, tokens=tokens, updated=now)
+                    delay = state.get('blocked_until', 0) - now
+                    if delay <= 0:
+                        if tokens >= 1:
+                            state['tokens'] = tokens - 1
+                            return waited
+                        delay = (1 - tokens) / rate
+            self._sleep(delay)
+            waited += delay
+
+    def throttle(self, delay):
+        """Stop the calls to the service for `delay` seconds, and slow down the bucket.
+
+        Args:
+            delay (float): the seconds to wait, from the `Retry-After` of the response
+        """
+        with self._state() as state:
+            now = self._clock()
+            state['blocked_until'] = max(state.get('blocked_until', 0), now + delay)
+            if self.rate:
+                state.update(
+                    rate=max(state.get('rate', self.rate) * DECREASE_FACTOR, self.rate * MIN_RATE_FACTOR),
+                    tokens=0,
+                    updated=now,
+                )
+
+
+def get_rate_limits():
+    """Return the budgets of the services, from `IC_RATE_LIMITS`.
+
+    The variable is a comma separated list of `service=rate` pairs, where the
+    service is the name of its SDK client, for example
+    `resource_controller=20,iam_access_groups=10`, and the rate is the number
+    of calls per second that all the processes of the controller can make.
+    Invalid pairs are ignored.
+
+    Returns:
+        dict: the rate of each service
+    """
+    limits = {}
+    for pair in os.getenv(RATE_LIMITS_ENV, '').split(','):
+        name, _sep, value = pair.partition('=')
+        try:
+            rate = float(value)
+        except ValueError:
+            continue
+        if name.strip() and rate > 0:
+            limits[name.strip()] = rate
+    return limits
+
+
+def get_max_retries():
+    """Return the number of retries of a call that is rate limited, from `IC_RATE_LIMIT_RETRIES`."""
+    try:
+        return max(int(os.getenv(RETRIES_ENV, DEFAULT_MAX_RETRIES)), 0)
+    except ValueError:
+        return DEFAULT_MAX_RETRIES
+
+
+def get_limiter(name):
+    """Return the shared bucket of a service in this process.
+
+    Args:
+        name (str): the name of the service
+
+    Returns:
+        SharedTokenBucket: the bucket with the budget of the service
+    """
+    rate = get_rate_limits().get(name)
+    key = (name, rate)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = SharedTokenBucket(name, rate, burst=math.ceil(rate or 1))
+    return limiter
+
+
+def get_retry_after(response):
+    """Return the seconds to wait from the `Retry-After` header of a response.
+
+    Args:
+        response (requests.Response): the response, can be None
+
+    Returns:
+        float: the seconds to wait, up to `MAX_RETRY_AFTER`, or None without a valid header
+    """
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0), MAX_RETRY_AFTER)
+
+
+def is_retryable(request):
+    """Return whether a call can be sent again after a 429.
+
+    The call must be idempotent, and its body must not be a stream or a file
+    that the first attempt has already consumed.
+
+    Args:
+        request (dict): the request prepared by the SDK client
+
+    Returns:
+        bool: whether the call can be retried
+    """
+    if request.get('method', '').upper() not in IDEMPOTENT_METHODS:
+        return False
+    return isinstance(request.get('data'), (bytes, str, type(None))) and not request.get('files')
+
+
+def limit_service(service):
+    """Make an SDK client share the budget of its service and retry the calls that are rate limited.
+
+    Each call waits for the `SharedTokenBucket` of the service, named by the
+    `DEFAULT_SERVICE_NAME` of the client. When the service answers 429, all
+    the processes wait for its `Retry-After`, or for an exponential backoff
+    with jitter without one, and the idempotent calls are retried up to
+    `get_max_retries()` times. Other calls fail with the 429, since the
+    service could still act on them, and so do the calls with a streamed
+    body, see `is_retryable`.
+
+    Args:
+        service (BaseService): the SDK client
+
+    Returns:
+        BaseService: the same SDK client
+    """
+    limiter = get_limiter(service.DEFAULT_SERVICE_NAME)
+
+    def send(request, **kwargs):
+        delays = wait.get_delays(initial=1)
+        retries = 0
+        while True:
+            limiter.acquire()
+            try:
+                # Resolved on each call, so the clients keep using the send of their class.
+                return type(service).send(service, request, **kwargs)
+            except ApiException as ex:
+                if ex.status_code != 429:
+                    raise
+                delay = get_retry_after(ex.http_response)
+                limiter.throttle(delay if delay is not None else next(delays))
+                if not is_retryable(request) or retries >= get_max_retries():
+                    raise
+                retries += 1
+
+    service.send = send
+    return service
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Argument spec fragments of the Schematics modules.
+
+The Schematics API nests the same structures in many places: a job has
+variable data in its settings, its inputs and outputs, and again in the data
+of each workspace, action and flow job. The modules build those options with
+these functions instead of repeating them, which keeps the modules and their
+AnsiballZ payloads small. The specs are built once and shared by every
+option that uses them, so they must not be modified.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from functools import lru_cache
+
+
+VARIABLE_TYPES = ['boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link']
+CREDENTIAL_TYPES = ['string', 'link']
+JOB_STATUS_CODES = ['job_pending', 'job_in_progress', 'job_finished', 'job_failed', 'job_cancelled']
+SOURCE_TYPES = ['local', 'git_hub', 'git_hub_enterprise', 'git_lab', 'ibm_git_lab', 'ibm_cloud_catalog']
+
+
+def option(type_: str, **kwargs) -> dict:
+    """Return the spec of an optional option."""
+    spec = dict(type=type_, **kwargs)
+    spec.update(required=False)
+    return spec
+
+
+def str_options(*names: str) -> dict:
+    """Return the specs of optional string options, in order."""
+    return dict((name, option('str')) for name in names)
+
+
+def dict_option(options: dict) -> dict:
+    """Return the spec of an optional dict with suboptions."""
+    return dict(type='dict', options=options, required=False)
+
+
+def list_option(options: dict) -> dict:
+    """Return the spec of an optional list of dicts with suboptions."""
+    return dict(type='list', elements='dict', options=options, required=False)
+
+
+@lru_cache(maxsize=None)
+def variable_metadata_spec(credential: bool = False) -> dict:
+    """Return the spec of the metadata of a variable, the `VariableMetadata` model.
+
+    Args:
+        credential (bool): for the metadata of a credential, which has fewer fields
+
+    Returns:
+        dict: the spec of the `metadata` option
+    """
+    options = dict(
+        type=option('str', choices=CREDENTIAL_TYPES if credential else VARIABLE_TYPES),
+        aliases=option('list', elements='str'),
+    )
+    options.update(str_options('description', 'cloud_data_type', 'default_value'))
+    options.update(link_status=option('str', choices=['normal', 'broken']))
+    if not credential:
+        options.update(secure=option('bool'))
+    options.update(immutable=option('bool'), hidden=option('bool'), required=option('bool'))
+    if not credential:
+        options.update(
+            options=option('list', elements='str'),
+            min_value=option('int'),
+            max_value=option('int'),
+            min_length=option('int'),
+            max_length=option('int'),
+            matches=option('str'),
+        )
+    options.update(position=option('int'))
+    options.update(str_options('group_by', 'source'))
+    return dict_option(options)
+
+
+@lru_cache(maxsize=None)
+def variable_data_spec(credential: bool = False, single: bool = False) -> dict:
+    """Return the spec of variable data, the `VariableData` model of inputs, outputs and settings.
+
+    Args:
+        credential (bool): for credentials, see `variable_metadata_spec`
+        single (bool): for a single variable instead of a list
+
+    Returns:
+        dict: the spec of the option
+    """
+    options = dict(
+        name=option('str'),
+        value=option('str'),
+        use_default=option('bool'),
+        metadata=variable_metadata_spec(credential),
+        link=option('str'),
+    )
+    return dict_option(options) if single else list_option(options)
+
+
+@lru_cache(maxsize=None)
+def bastion_spec() -> dict:
+    """Return the spec of a bastion host, the `BastionResourceDefinition` model."""
+    return dict_option(str_options('name', 'host'))
+
+
+@lru_cache(maxsize=None)
+def source_spec() -> dict:
+    """Return the spec of the source of an action or flow workitem, the `ExternalSource` model."""
+    return dict_option(dict(
+        source_type=option('str', choices=SOURCE_TYPES),
+        git=dict_option(str_options(
+            'computed_git_repo_url', 'git_repo_url', 'git_token', 'git_repo_folder', 'git_release', 'git_branch')),
+        catalog=dict_option(str_options(
+            'catalog_name', 'offering_name', 'offering_version', 'offering_kind', 'catalog_id', 'offering_id',
+            'offering_version_id', 'offering_repo_url', 'offering_provisioner_working_directory')),
+    ))
+
+
+@lru_cache(maxsize=None)
+def flow_job_status_spec() -> dict:
+    """Return the spec of the status of a flow job, the `JobStatusFlow` model."""
+    options = str_options('flow_id', 'flow_name')
+    options.update(
+        status_code=option('str', choices=JOB_STATUS_CODES),
+        status_message=option('str'),
+        workitems=list_option(dict(
+            workspace_id=option('str'),
+            workspace_name=option('str'),
+            job_id=option('str'),
+            status_code=option('str', choices=JOB_STATUS_CODES),
+            status_message=option('str'),
+            updated_at=option('str'),
+        )),
+        updated_at=option('str'),
+    )
+    return dict_option(options)
+
+
+@lru_cache(maxsize=None)
+def workspace_status_spec() -> dict:
+    """Return the spec of the frozen and locked status of a workspace."""
+    return dict_option(dict(
+        frozen=option('bool'),
+        frozen_at=option('str'),
+        frozen_by=option('str'),
+        locked=option('bool'),
+        locked_by=option('str'),
+        locked_time=option('str'),
+    ))
+
+
+@lru_cache(maxsize=None)
+def template_repo_spec() -> dict:
+    """Return the spec of the template repository of a workspace."""
+    return dict_option(str_options('branch', 'release', 'repo_sha_value', 'repo_url', 'url'))
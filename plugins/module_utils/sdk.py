@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import importlib.util
+import sys
+import threading
+
+
+# The SDK packages whose __init__ imports all of their services.
+LAZY_PACKAGES = ['ibm_platform_services']
+
+_lock = threading.RLock()
+
+
+def _register_lazy_package(package_name: str) -> None:
+    """Register an SDK package in `sys.modules` without running its __init__.
+
+    Its submodules can then be imported one by one. The __init__ runs on the
+    first access of a name that isn't loaded yet, so the package can still be
+    used as a whole, for example `from ibm_platform_services import IamIdentityV1`.
+    """
+    spec = importlib.util.find_spec(package_name)
+    if spec is None:
+        return
+    package = importlib.util.module_from_spec(spec)
+
+    def load(name):
+        with _lock:
+            if package.__dict__.pop('__getattr__', None) is not None:
+                spec.loader.exec_module(package)
+        try:
+            return package.__dict__[name]
+        except KeyError:
+            raise AttributeError("module '%s' has no attribute '%s'" % (package_name, name))
+
+    package.__getattr__ = load
+    sys.modules[package_name] = package
+
+
+def import_service(module_name: str, class_name: str):
+    """Import the client class of an SDK service.
+
+    `ibm_platform_services/__init__` imports all of its services, which is the
+    bulk of a module's start-up. Only the module of the service is loaded.
+
+    Args:
+        module_name (str): the module of the service, e.g. `ibm_platform_services.resource_controller_v2`
+        class_name (str): the client class, e.g. `ResourceControllerV2`
+
+    Returns:
+        type: the client class
+    """
+    package_name = module_name.partition('.')[0]
+    with _lock:
+        if package_name in LAZY_PACKAGES and package_name not in sys.modules:
+            _register_lazy_package(package_name)
+        module = importlib.import_module(module_name)
+    return getattr(module, class_name)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import threading
+
+try:
+    import requests
+    from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+    from urllib.parse import urlsplit
+except ImportError:
+    raise
+
+from ..module_utils import ratelimit
+
+
+POOL_SIZE_ENV = 'IC_HTTP_POOL_SIZE'
+CONNECT_TIMEOUT_ENV = 'IC_HTTP_CONNECT_TIMEOUT'
+READ_TIMEOUT_ENV = 'IC_HTTP_READ_TIMEOUT'
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10
+# The timeout that the SDK uses when none is configured.
+DEFAULT_READ_TIMEOUT = 60
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def _get_env_number(name: str, default, cast=float):
+    try:
+        value = cast(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def get_pool_size() -> int:
+    """Return the maximum number of connections kept open to each host, from `IC_HTTP_POOL_SIZE`."""
+    return _get_env_number(POOL_SIZE_ENV, DEFAULT_POOL_SIZE, int)
+
+
+def get_http_config() -> dict:
+    """Return the HTTP config of the SDK clients, with the timeouts from the environment.
+
+    The connect and read timeouts are taken from `IC_HTTP_CONNECT_TIMEOUT` and
+    `IC_HTTP_READ_TIMEOUT`, in seconds.
+
+    Returns:
+        dict: the config for `BaseService.set_http_config`
+    """
+    return {'timeout': (
+        _get_env_number(CONNECT_TIMEOUT_ENV, DEFAULT_CONNECT_TIMEOUT),
+        _get_env_number(READ_TIMEOUT_ENV, DEFAULT_READ_TIMEOUT),
+    )}
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the HTTP session that is shared by all the clients of a host in this process.
+
+    The session keeps up to `get_pool_size()` connections open to the host, so
+    the clients of the same endpoint reuse the connections and their TLS
+    handshakes instead of each opening its own.
+
+    Args:
+        url (str): a URL of the host
+
+    Returns:
+        requests.Session: the session of the host
+    """
+    parts = urlsplit(url or '')
+    key = (parts.scheme, parts.netloc)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            pool_size = get_pool_size()
+            adapter = SSLHTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[key] = session
+    return session
+
+
+def configure_service(service):
+    """Make an SDK client use the shared session of its host, the configured timeouts and rate limits.
+
+    The session is picked once, by the service URL of the client when it's
+    configured, so the service URL must be set before; a later
+    `set_service_url` keeps the session of the former host.
+    A client that was configured with retries or without SSL verification, see
+    `BaseService.configure_service`, keeps its own session, since those
+    settings are mounted on the session.
+    The timeouts also apply to the token requests of its authenticator.
+    The calls share the budget of the service and are retried when they're
+    rate limited, see `ratelimit.limit_service`.
+
+    Args:
+        service (BaseService): the SDK client
+
+    Returns:
+        BaseService: the same SDK client
+    """
+    if service.retry_config is None and not service.disable_ssl_verification:
+        service.set_http_client(get_session(service.service_url))
+    service.set_http_config(get_http_config())
+    return ratelimit.limit_service(service)
+
+
+def close_sessions() -> None:
+    """Close the shared sessions and their connections."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import time
+
+
+DEFAULT_WAIT_TIMEOUT = 1800
+INITIAL_DELAY = 2
+MAX_DELAY = 60
+BACKOFF_FACTOR = 2
+
+
+class WaitTimeoutError(Exception):
+    """Raised when a resource doesn't reach the awaited state in time.
+
+    Args:
+        message (str): the error message
+        result: the last polled result
+        polls (int): the number of polls
+        elapsed (float): the seconds waited
+    """
+
+    def __init__(self, message, result, polls, elapsed):
+        super(WaitTimeoutError, self).__init__(message)
+        self.message = message
+        self.result = result
+        self.polls = polls
+        self.elapsed = elapsed
+
+
+def get_delays(initial=INITIAL_DELAY, maximum=MAX_DELAY, factor=BACKOFF_FACTOR):
+    """Yield the delays between polls.
+
+    The delays grow exponentially up to the maximum, and each one is picked at
+    random up to that bound ("full jitter"), so parallel tasks don't poll in step.
+    """
+    bound = initial
+    while True:
+        yield random.uniform(initial / 2.0, bound)
+        bound = min(bound * factor, maximum)
+
+
+def wait_for(poll, is_done, timeout=DEFAULT_WAIT_TIMEOUT, delays=None, sleep=time.sleep, clock=time.monotonic):
+    """Poll a resource until it's done, with exponential backoff and jitter.
+
+    Args:
+        poll (callable): returns the current state of the resource
+        is_done (callable): called with the result of `poll`, true once the wait is over
+        timeout (int): the maximum number of seconds to wait
+        delays (iterable): the delays between polls, see `get_delays`
+        sleep (callable): used to wait between polls
+        clock (callable): a monotonic clock in seconds
+
+    Returns:
+        tuple: the last result, the number of polls and the seconds waited
+
+    Raises:
+        WaitTimeoutError: if the resource isn't done within the timeout
+    """
+    delays = iter(delays if delays is not None else get_delays())
+    start = clock()
+    polls = 0
+    while True:
+        result = poll()
+        polls += 1
+        elapsed = clock() - start
+        if is_done(result):
+            return result, polls, elapsed
+
+        remaining = timeout - elapsed
+        if remaining <= 0:
+            raise WaitTimeoutError('Timed out after %d seconds' % timeout, result, polls, elapsed)
+        sleep(min(next(delays), remaining))
@@ -0,0 +1,156 @@
+#!/usr/bin/python
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_catalog_index
+short_description: Manage the cached Global Catalog index of services.
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - This module fetches the plan and deployment tree of one or more services from the Global Catalog
+    and stores it in the local catalog cache.
+  - The modules that take a service name, plan and location, for example M(ibm.cloud.ibm_resource_instance),
+    then resolve them from the cached index without any catalog request.
+  - Run it once at the top of a play to prewarm the index of every service the play uses.
+requirements:
+  - "GlobalCatalogV1"
+options:
+  services:
+    description:
+      - The names of the services to index, for example C(cloud-object-storage).
+      - When I(state=absent), only the cached entries of these services are removed. All entries are removed if omitted.
+    type: list
+    elements: str
+  refresh:
+    description:
+      - Fetch the index again even if it's already cached.
+    type: bool
+    default: false
+  state:
+    description:
+      - C(present) builds and caches the index of the services, C(absent) invalidates the cached entries.
+    type: str
+    default: present
+    choices: [present, absent]
+seealso:
+  - name: IBM Cloud Global Catalog docs
+    description: "The Global Catalog holds the services, plans and deployments that can be provisioned."
+    link: https://cloud.ibm.com/docs/account?topic=account-globalcatalog-rest
+notes:
+  - "Authenticate this module by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable.
+    The API key will be used to authenticate all IBM Cloud modules that use this environment variable."
+  - "The index is cached in the directory set by the C(IC_CACHE_DIR) environment variable (default C(~/.ansible/ibm_cloud))
+    for C(IC_CATALOG_CACHE_TTL) seconds (default one hour)."
+  - "With I(state=present), the module fails when the cache is disabled, by setting C(IC_CACHE) to C(false)
+    or C(IC_CATALOG_CACHE_TTL) to C(0), since the index could not be cached."
+'''
+
+EXAMPLES = r'''
+- name: Prewarm the catalog index for the services of this play
+  ibm_catalog_index:
+    services:
+      - cloud-object-storage
+      - databases-for-postgresql
+
+- name: Invalidate the cached catalog entries of a service
+  ibm_catalog_index:
+    services:
+      - cloud-object-storage
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+  description:
+    - With I(state=present), the index of each service keyed by the service name. Each index holds the service C(id)
+      and its C(plans) by name, each with the plan C(id) and the catalog CRN of each deployment location in C(locations).
+    - With I(state=absent), the number of C(removed) cache entries.
+    - On error, a message that describes what went wrong.
+  type: raw
+  returned: always
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+
+try:
+    from ..module_utils import catalog
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def run_module():
+    module_args = dict(
+        services=dict(
+            type='list',
+            elements='str',
+            required=False),
+        refresh=dict(
+            type='bool',
+            default=False,
+            required=False),
+        state=dict(
+            type='str',
+            default='present',
+            choices=['absent', 'present'],
+            required=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        required_if=[
+            ('state', 'present', ['services']),
+        ],
+        supports_check_mode=False
+    )
+
+    if MISSING_IMPORT_EXC is not None:
+        module.fail_json(msg='Missing required import: ' + MISSING_IMPORT_EXC.msg)
+
+    services = module.params["services"]
+    refresh = module.params["refresh"]
+    state = module.params["state"]
+
+    # Invalidate path
+    if state == "absent":
+        if services:
+            removed = sum(catalog.invalidate_cache(service) for service in services)
+        else:
+            removed = catalog.invalidate_cache()
+        module.exit_json(changed=removed > 0, msg={"removed": removed})
+
+    # Prewarm path
+    if not catalog.cache_enabled():
+        module.fail_json(msg="The catalog cache is disabled, set IC_CACHE to true and IC_CATALOG_CACHE_TTL above 0 to cache the index")
+
+    try:
+        result = catalog.prewarm(services, refresh=refresh)
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
+    else:
+        module.exit_json(changed=False, msg=result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -260,7 +260,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import CatalogManagementV1
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -480,13 +480,14 @@ def run_module():
 
     sdk = config.get_catalog_management_sdk()
     resource_exists = True
+    existing = None
 
     # Check for existence
     if catalog_identifier:
         try:
-            sdk.get_catalog(
+            existing = sdk.get_catalog(
                 catalog_identifier=catalog_identifier,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -513,6 +514,19 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            label=label,
+            short_description=short_description,
+            catalog_icon_url=catalog_icon_url,
+            tags=tags,
+            features=features,
+            disabled=disabled,
+            resource_group_id=resource_group_id,
+            owning_account=owning_account,
+            catalog_filters=catalog_filters,
+            syndication_settings=syndication_settings,
+            kind=kind,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -535,6 +549,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
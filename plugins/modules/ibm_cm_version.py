@@ -79,7 +79,6 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import CatalogManagementV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 import base64
@@ -72,7 +72,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -128,15 +128,16 @@ def run_module():
     sdk = config.get_iam_access_group_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if access_group_id:
         try:
-            sdk.get_access_group(
+            existing = sdk.get_access_group(
                 access_group_id=access_group_id,
                 transaction_id=transaction_id,
                 show_federated=show_federated,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -165,6 +166,10 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+            description=description,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -178,6 +183,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_access_group(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     access_group_id:
         description:
@@ -40,7 +42,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -56,6 +58,10 @@ def run_module():
         show_federated=dict(
             type='bool',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -66,6 +72,7 @@ def run_module():
     access_group_id = module.params["access_group_id"]
     transaction_id = module.params["transaction_id"]
     show_federated = module.params["show_federated"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_access_group_sdk()
     if access_group_id:
@@ -76,7 +83,7 @@ def run_module():
                 transaction_id=transaction_id,
                 show_federated=show_federated
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -68,6 +68,14 @@ options:
         description:
             - Return user's email and name for each user ID or the name for each service ID or trusted profile.
         type: bool
+    purge:
+        description:
+            - Make I(members) the exact list of static members of the access group.
+            - The current members are listed once, the missing members are added and the members that
+              aren't in I(members) are removed, in batches of up to 50 members per request.
+            - Members that are added by dynamic rules are never removed.
+        type: bool
+        default: false
     state:
         description:
             - Should the resource be present or absent.
@@ -77,13 +85,66 @@ options:
 '''
 
 EXAMPLES = r'''
-Examples coming soon.
+- name: Make these users the only static members of an access group
+  ibm_iam_access_group_members:
+    access_group_id: AccessGroupId-8cd2fb30-2a8c-4e5a-a4c5-0b7e2f3d9a61
+    members:
+      - iam_id: IBMid-user1
+        type: user
+      - iam_id: iam-ServiceId-2c8e1c5a-5d3b-4f0e-9a8b-1e2f3d4c5b6a
+        type: service
+    purge: true
 '''
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import pagination
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
+# The maximum number of members per add or remove request.
+MEMBERS_BATCH_SIZE = 50
+
+
+def batches(items, size=MEMBERS_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def sync_members(sdk, access_group_id, members, transaction_id):
+    """Make the members the exact list of static members of the access group.
+
+    Returns:
+        dict: the `added` and `removed` IAM IDs
+    """
+    def list_page(page_offset, page_limit):
+        return sdk.list_access_group_members(
+            access_group_id=access_group_id,
+            transaction_id=transaction_id,
+            membership_type='static',
+            limit=page_limit,
+            offset=page_offset,
+        ).get_result()
+
+    current = set(member['iam_id'] for member in pagination.fetch_offset_pages(list_page, 'members', limit=100)['members'])
+    desired = set(member['iam_id'] for member in members)
+
+    to_add = [member for member in members if member['iam_id'] not in current]
+    to_remove = sorted(current - desired)
+
+    for batch in batches(to_add):
+        sdk.add_members_to_access_group(
+            access_group_id=access_group_id,
+            members=batch,
+            transaction_id=transaction_id,
+        )
+    for batch in batches(to_remove):
+        sdk.remove_members_from_access_group(
+            access_group_id=access_group_id,
+            members=batch,
+            transaction_id=transaction_id,
+        )
+
+    return {"added": [member['iam_id'] for member in to_add], "removed": to_remove}
+
 
 def run_module():
     module_args = dict(
@@ -123,6 +184,10 @@ def run_module():
         verbose=dict(
             type='bool',
             required=False),
+        purge=dict(
+            type='bool',
+            default=False,
+            required=False),
         state=dict(
             type='str',
             default='present',
@@ -132,6 +197,9 @@ def run_module():
 
     module = AnsibleModule(
         argument_spec=module_args,
+        required_if=[
+            ('purge', True, ['access_group_id', 'members']),
+        ],
         supports_check_mode=False
     )
 
@@ -144,10 +212,20 @@ def run_module():
     sort = module.params["sort"]
     type = module.params["type"]
     verbose = module.params["verbose"]
+    purge = module.params["purge"]
     state = module.params["state"]
 
     sdk = config.get_iam_access_group_sdk()
 
+    # Sync path
+    if purge and state == "present":
+        try:
+            result = sync_members(sdk, access_group_id, members, transaction_id)
+        except ApiException as ex:
+            module.fail_json(msg=ex.message)
+        else:
+            module.exit_json(changed=bool(result["added"] or result["removed"]), msg=result)
+
     resource_exists = True
 
     # Check for existence
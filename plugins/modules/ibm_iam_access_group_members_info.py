@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_access_group_members(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     access_group_id:
         description:
@@ -49,13 +51,25 @@ options:
         description:
             - Return user's email and name for each user ID or the name for each service ID or trusted profile.
         type: bool
+    fetch_all:
+        description:
+            - Return all the members, not just one page. Starts at I(offset) and uses I(limit) as the page size.
+            - After the first page, the remaining pages are fetched in parallel and merged in order.
+        type: bool
+        default: false
+    parallelism:
+        description:
+            - With I(fetch_all), the maximum number of pages fetched at the same time.
+        type: int
+        default: 5
 '''
 
 EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import projection
+from ..module_utils import pagination
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -83,6 +97,18 @@ def run_module():
         verbose=dict(
             type='bool',
             required=False),
+        fetch_all=dict(
+            type='bool',
+            default=False,
+            required=False),
+        parallelism=dict(
+            type='int',
+            default=pagination.DEFAULT_PARALLELISM,
+            required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -97,21 +123,31 @@ def run_module():
     sort = module.params["sort"]
     type = module.params["type"]
     verbose = module.params["verbose"]
+    fetch_all = module.params["fetch_all"]
+    parallelism = module.params["parallelism"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_access_group_sdk()
 
     # list
     try:
-        response = sdk.list_access_group_members(
-            access_group_id=access_group_id,
-            transaction_id=transaction_id,
-            limit=limit,
-            offset=offset,
-            type=type,
-            verbose=verbose,
-            sort=sort
-        )
-        module.exit_json(msg=response.get_result())
+        def list_page(page_offset, page_limit):
+            return sdk.list_access_group_members(
+                access_group_id=access_group_id,
+                transaction_id=transaction_id,
+                limit=page_limit,
+                offset=page_offset,
+                type=type,
+                verbose=verbose,
+                sort=sort
+            ).get_result()
+
+        if fetch_all:
+            result = pagination.fetch_offset_pages(
+                list_page, 'members', offset=offset, limit=limit, parallelism=parallelism)
+        else:
+            result = list_page(offset, limit)
+        module.exit_json(msg=projection.project_fields(result, fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
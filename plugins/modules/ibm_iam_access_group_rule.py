@@ -82,7 +82,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -150,15 +150,16 @@ def run_module():
     sdk = config.get_iam_access_group_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if rule_id:
         try:
-            sdk.get_access_group_rule(
+            existing = sdk.get_access_group_rule(
                 access_group_id=access_group_id,
                 rule_id=rule_id,
                 transaction_id=transaction_id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -187,6 +188,12 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+            expiration=expiration,
+            realm_name=realm_name,
+            conditions=conditions,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -202,6 +209,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
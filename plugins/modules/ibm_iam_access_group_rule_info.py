@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_access_group_rule(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     rule_id:
         description:
@@ -39,7 +41,7 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -55,6 +57,10 @@ def run_module():
         transaction_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -65,6 +71,7 @@ def run_module():
     rule_id = module.params["rule_id"]
     access_group_id = module.params["access_group_id"]
     transaction_id = module.params["transaction_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_access_group_sdk()
 
@@ -75,7 +82,7 @@ def run_module():
             rule_id=rule_id,
             transaction_id=transaction_id
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
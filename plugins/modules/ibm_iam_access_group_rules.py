@@ -0,0 +1,313 @@
+#!/usr/bin/python
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_iam_access_group_rules
+short_description: Manage the full set of C(rules) of an access group for IAM Access Groups.
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - This module adds or replaces the given dynamic rules of an access group, and with I(purge) makes them its only rules.
+  - The current rules are listed once and matched to the given rules by their content, not by their ID.
+    A rule that differs from a current rule of the same name replaces it, the other rules are added, and with
+    I(purge) the current rules that don't match any given rule are removed.
+  - Only the differences are applied, concurrently. The ETags of the replaced rules are fetched automatically.
+  - Use M(ibm.cloud.ibm_iam_access_group_rule) to manage a single rule by its ID.
+requirements:
+  - "IamAccessGroupsV2"
+options:
+  access_group_id:
+    description: "The access group identifier."
+    type: str
+    required: true
+  rules:
+    description:
+      - The desired rules of the access group.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: "The name of the rule."
+        type: str
+        required: true
+      expiration:
+        description: "The number of hours that the rule lives for."
+        type: int
+        required: true
+      realm_name:
+        description: "The url of the identity provider."
+        type: str
+        required: true
+      conditions:
+        description: "A list of conditions the rule must satisfy."
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+          claim:
+            description: "The claim to evaluate against. This will be found in the C(ext) claims of a user's login request."
+            type: str
+            required: true
+          operator:
+            description: "The operation to perform on the claim."
+            type: str
+            required: true
+          value:
+            description: "The stringified JSON value that the claim is compared to using the operator."
+            type: str
+            required: true
+  purge:
+    description:
+      - Remove the current rules that don't match any of the given rules.
+      - With C(false), the current rules are only added or replaced.
+    type: bool
+    default: false
+  parallelism:
+    description:
+      - The maximum number of rules that are added, replaced or removed at the same time.
+    type: int
+    default: 5
+  transaction_id:
+    description:
+      - An optional transaction ID that is sent with every request, to track the calls of this task.
+    type: str
+seealso:
+  - name: IBM Cloud IAM Access Groups docs
+    description: "Dynamic rules add users to access groups based on the claims of their identity provider."
+    link: https://cloud.ibm.com/docs/account?topic=account-rules
+notes:
+  - "Authenticate this module by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable.
+    The API key will be used to authenticate all IBM Cloud modules that use this environment variable."
+'''
+
+EXAMPLES = r'''
+- name: Sync the dynamic rules of an access group
+  ibm_iam_access_group_rules:
+    access_group_id: AccessGroupId-8cd2fb30-2a8c-4e5a-a4c5-0b7e2f3d9a61
+    rules:
+      - name: Managers
+        expiration: 24
+        realm_name: https://idp.example.org/SAML2
+        conditions:
+          - claim: isManager
+            operator: EQUALS
+            value: 'true'
+      - name: Cloud administrators
+        expiration: 12
+        realm_name: https://idp.example.org/SAML2
+        conditions:
+          - claim: groups
+            operator: CONTAINS
+            value: '"cloud-admins"'
+    purge: true
+'''
+
+RETURN = r'''
+msg:
+  description:
+    - The result of each rule, the given rules first, followed by the removed rules.
+    - Each result has the C(name), C(id) and C(status) of the rule. The C(status) is one of C(added),
+      C(replaced), C(removed), C(unchanged) or C(failed). Failed results also have an C(error) message.
+  type: list
+  elements: dict
+  returned: always
+'''
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+
+try:
+    from ..module_utils import config
+    from ..module_utils import pagination
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def rule_content(rule):
+    """Return the content of a rule that is compared, regardless of the order of its conditions."""
+    conditions = sorted((condition.get("claim"), condition.get("operator"), condition.get("value"))
+                        for condition in rule.get("conditions") or [])
+    return (rule.get("name"), rule.get("expiration"), rule.get("realm_name"), tuple(conditions))
+
+
+def plan_rules(desired, current, purge):
+    """Match the desired rules to the current rules.
+
+    Returns:
+        list: `(action, desired_rule, current_rule)` tuples, the action is `add`, `replace`, `remove` or None
+    """
+    unmatched = list(current)
+    plan = []
+    for rule in desired:
+        match = next((existing for existing in unmatched if rule_content(existing) == rule_content(rule)), None)
+        if match is not None:
+            unmatched.remove(match)
+            plan.append((None, rule, match))
+        else:
+            plan.append(("add", rule, None))
+
+    # A rule that changed replaces an unmatched rule of the same name.
+    for index, (action, rule, _match) in enumerate(plan):
+        if action == "add":
+            match = next((existing for existing in unmatched if existing.get("name") == rule["name"]), None)
+            if match is not None:
+                unmatched.remove(match)
+                plan[index] = ("replace", rule, match)
+
+    if purge:
+        plan.extend(("remove", None, existing) for existing in unmatched)
+    return plan
+
+
+def run_module():
+    module_args = dict(
+        access_group_id=dict(
+            type='str',
+            required=True),
+        rules=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                name=dict(
+                    type='str',
+                    required=True),
+                expiration=dict(
+                    type='int',
+                    required=True),
+                realm_name=dict(
+                    type='str',
+                    required=True),
+                conditions=dict(
+                    type='list',
+                    elements='dict',
+                    options=dict(
+                        claim=dict(
+                            type='str',
+                            required=True),
+                        operator=dict(
+                            type='str',
+                            required=True),
+                        value=dict(
+                            type='str',
+                            required=True),
+                    ),
+                    required=True),
+            ),
+            required=True),
+        purge=dict(
+            type='bool',
+            default=False,
+            required=False),
+        parallelism=dict(
+            type='int',
+            default=pagination.DEFAULT_PARALLELISM,
+            required=False),
+        transaction_id=dict(
+            type='str',
+            required=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+
+    if MISSING_IMPORT_EXC is not None:
+        module.fail_json(msg='Missing required import: ' + MISSING_IMPORT_EXC.msg)
+
+    access_group_id = module.params["access_group_id"]
+    rules = module.params["rules"]
+    purge = module.params["purge"]
+    parallelism = module.params["parallelism"]
+    transaction_id = module.params["transaction_id"]
+
+    sdk = config.get_iam_access_group_sdk()
+
+    try:
+        current = sdk.list_access_group_rules(
+            access_group_id=access_group_id,
+            transaction_id=transaction_id,
+        ).get_result().get("rules") or []
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+
+    def apply(step):
+        action, rule, existing = step
+        result = {"name": (rule or existing).get("name"), "id": existing.get("id") if existing else None}
+        try:
+            if action == "add":
+                added = sdk.add_access_group_rule(
+                    access_group_id=access_group_id,
+                    name=rule["name"],
+                    expiration=rule["expiration"],
+                    realm_name=rule["realm_name"],
+                    conditions=rule["conditions"],
+                    transaction_id=transaction_id,
+                ).get_result()
+                result.update(id=added.get("id"), status="added")
+            elif action == "replace":
+                etag = sdk.get_access_group_rule(
+                    access_group_id=access_group_id,
+                    rule_id=existing["id"],
+                    transaction_id=transaction_id,
+                ).get_headers().get("ETag")
+                sdk.replace_access_group_rule(
+                    access_group_id=access_group_id,
+                    rule_id=existing["id"],
+                    if_match=etag,
+                    name=rule["name"],
+                    expiration=rule["expiration"],
+                    realm_name=rule["realm_name"],
+                    conditions=rule["conditions"],
+                    transaction_id=transaction_id,
+                )
+                result.update(status="replaced")
+            elif action == "remove":
+                sdk.remove_access_group_rule(
+                    access_group_id=access_group_id,
+                    rule_id=existing["id"],
+                    transaction_id=transaction_id,
+                )
+                result.update(status="removed")
+            else:
+                result.update(status="unchanged")
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(parallelism, 1)) as executor:
+        results = list(executor.map(apply, plan_rules(rules, current, purge)))
+
+    changed = any(result["status"] in ("added", "replaced", "removed") for result in results)
+    failed = [result for result in results if result["status"] == "failed"]
+    if failed:
+        module.fail_json(msg="Failed to apply %d of %d access group rules" % (len(failed), len(results)),
+                         changed=changed, results=results)
+
+    module.exit_json(changed=changed, msg=results)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
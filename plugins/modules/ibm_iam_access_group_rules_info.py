@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_access_group_rules(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     access_group_id:
         description:
@@ -36,7 +38,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -49,6 +51,10 @@ def run_module():
         transaction_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -58,6 +64,7 @@ def run_module():
 
     access_group_id = module.params["access_group_id"]
     transaction_id = module.params["transaction_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_access_group_sdk()
 
@@ -67,7 +74,7 @@ def run_module():
             access_group_id=access_group_id,
             transaction_id=transaction_id
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
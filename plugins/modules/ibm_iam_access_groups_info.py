@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_access_groups(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     account_id:
         description: |
@@ -55,6 +57,17 @@ options:
         description:
             - If hide_public_access is true, do not include the Public Access Group in the results.
         type: bool
+    fetch_all:
+        description:
+            - Return all the groups, not just one page. Starts at I(offset) and uses I(limit) as the page size.
+            - After the first page, the remaining pages are fetched in parallel and merged in order.
+        type: bool
+        default: false
+    parallelism:
+        description:
+            - With I(fetch_all), the maximum number of pages fetched at the same time.
+        type: int
+        default: 5
 '''
 
 EXAMPLES = r'''
@@ -62,7 +75,8 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamAccessGroupsV2
+from ..module_utils import projection
+from ..module_utils import pagination
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -93,6 +107,18 @@ def run_module():
         hide_public_access=dict(
             type='bool',
             required=False),
+        fetch_all=dict(
+            type='bool',
+            default=False,
+            required=False),
+        parallelism=dict(
+            type='int',
+            default=pagination.DEFAULT_PARALLELISM,
+            required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -108,22 +134,32 @@ def run_module():
     show_federated = module.params["show_federated"]
     sort = module.params["sort"]
     hide_public_access = module.params["hide_public_access"]
+    fetch_all = module.params["fetch_all"]
+    parallelism = module.params["parallelism"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_access_group_sdk()
 
     # list
     try:
-        response = sdk.list_access_groups(
-            account_id=account_id,
-            transaction_id=transaction_id,
-            iam_id=iam_id,
-            limit=limit,
-            offset=offset,
-            sort=sort,
-            show_federated=show_federated,
-            hide_public_access=hide_public_access
-        )
-        module.exit_json(msg=response.get_result())
+        def list_page(page_offset, page_limit):
+            return sdk.list_access_groups(
+                account_id=account_id,
+                transaction_id=transaction_id,
+                iam_id=iam_id,
+                limit=page_limit,
+                offset=page_offset,
+                sort=sort,
+                show_federated=show_federated,
+                hide_public_access=hide_public_access
+            ).get_result()
+
+        if fetch_all:
+            result = pagination.fetch_offset_pages(
+                list_page, 'groups', offset=offset, limit=limit, parallelism=parallelism)
+        else:
+            result = list_page(offset, limit)
+        module.exit_json(msg=projection.project_fields(result, fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -102,7 +102,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamIdentityV1
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -181,15 +181,16 @@ def run_module():
 
     sdk = config.get_iam_identity_sdk()
     resource_exists = True
+    existing = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_service_id(
+            existing = sdk.get_service_id(
                 id=id,
                 # include_history=include_history,
                 # include_activity=include_activity,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -216,6 +217,11 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+            description=description,
+            unique_instance_crns=unique_instance_crns,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -231,6 +237,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
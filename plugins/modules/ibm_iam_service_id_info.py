@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_service_id(s).
 requirements:
     - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     include_history:
         description:
@@ -40,7 +42,7 @@ Examples coming soon.
 
 
 from ..module_utils import config
-from ibm_platform_services import IamIdentityV1
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -56,6 +58,10 @@ def run_module():
         include_activity=dict(
             type='bool',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -66,6 +72,7 @@ def run_module():
     include_history = module.params["include_history"]
     id = module.params["id"]
     include_activity = module.params["include_activity"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_identity_sdk()
 
@@ -77,7 +84,7 @@ def run_module():
                 include_history=include_history,
                 include_activity=include_activity
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_iam_service_ids(s).
 requirements:
     - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     include_history:
         description:
@@ -64,7 +66,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import IamIdentityV1
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -98,6 +100,10 @@ def run_module():
         order=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -114,6 +120,7 @@ def run_module():
     pagetoken = module.params["pagetoken"]
     include_activity = module.params["include_activity"]
     order = module.params["order"]
+    fields = module.params["fields"]
 
     sdk = config.get_iam_identity_sdk()
 
@@ -125,7 +132,7 @@ def run_module():
                 include_history=include_history,
                 include_activity=include_activity
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -140,7 +147,7 @@ def run_module():
             order=order,
             include_history=include_history
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -49,7 +49,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -89,13 +89,14 @@ def run_module():
     sdk = config.get_resource_contollerV2_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_alias(
+            existing = sdk.get_resource_alias(
                 id=id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -122,6 +123,9 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -134,6 +138,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
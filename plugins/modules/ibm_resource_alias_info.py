@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_resource_alias(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     id:
         description:
@@ -30,7 +32,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -40,6 +42,10 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -48,6 +54,7 @@ def run_module():
     )
 
     id = module.params["id"]
+    fields = module.params["fields"]
 
     sdk = config.get_resource_contollerV2_sdk()
 
@@ -57,7 +64,7 @@ def run_module():
             response = sdk.get_resource_alias(
                 id=id
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_resource_aliases(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     limit:
         description:
@@ -40,7 +42,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -56,6 +58,10 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -66,6 +72,7 @@ def run_module():
     limit = module.params["limit"]
     start = module.params["start"]
     id = module.params["id"]
+    fields = module.params["fields"]
 
     sdk = config.get_resource_contollerV2_sdk()
 
@@ -76,7 +83,7 @@ def run_module():
             limit=limit,
             start=start
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
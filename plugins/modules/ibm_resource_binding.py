@@ -64,7 +64,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import diff
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -118,13 +118,14 @@ def run_module():
     sdk = config.get_resource_contollerV2_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_binding(
+            existing = sdk.get_resource_binding(
                 id=id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -151,6 +152,9 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -165,6 +169,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
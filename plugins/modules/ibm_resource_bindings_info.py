@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_resource_bindings(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     resource_group_id:
         description:
@@ -64,7 +66,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -98,6 +100,10 @@ def run_module():
         region_binding_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -114,6 +120,7 @@ def run_module():
     resource_id = module.params["resource_id"]
     updated_to = module.params["updated_to"]
     region_binding_id = module.params["region_binding_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_resource_contollerV2_sdk()
 
@@ -130,7 +137,7 @@ def run_module():
             updated_from=updated_from,
             updated_to=updated_to
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -96,9 +96,9 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 
 try:
-    from ..module_utils.auth import get_authenticator
+    from ..module_utils import config
+    from ..module_utils import diff
     from ibm_cloud_sdk_core import ApiException
-    from ibm_platform_services import ResourceManagerV2
 except ImportError as imp_exc:
     MISSING_IMPORT_EXC = imp_exc
 else:
@@ -140,24 +140,20 @@ def run_module():
     id = module.params["id"]
     state = module.params["state"]
 
-    authenticator = get_authenticator(service_name='resource_manager')
-    if authenticator is None:
-        module.fail_json(msg='Cannot create the authenticator.')
-
-    sdk = ResourceManagerV2(
-        authenticator=authenticator,
-    )
-
-    sdk.configure_service('resource_manager')
+    try:
+        sdk = config.get_resource_manager_sdk_from_environment()
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_group(
+            existing = sdk.get_resource_group(
                 id=id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -182,6 +178,10 @@ def run_module():
             module.exit_json(changed=False, id=id, status="not_found")
 
     if state == "present":
+        desired = dict(
+            name=name,
+            state=resource_group_state,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -195,6 +195,9 @@ def run_module():
                 result = response.get_result()
 
                 module.exit_json(changed=True, **result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, **existing)
         else:
             # Update path
             try:
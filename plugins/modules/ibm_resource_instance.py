@@ -20,6 +20,7 @@ version_added: "0.0.1-beta0"
 description:
     - This module creates, updates, or deletes a ibm_resource_instance.
     - By default the module will look for an existing ibm_resource_instance.
+    - An existing instance is only updated when its name, parameters, plan or allow_cleanup differ from the given ones.
 requirements:
     - "ResourceControllerV2"
 options:
@@ -30,6 +31,7 @@ options:
     plan:
         description:
             - The unique ID of the plan associated with the offering. This value is provided by and stored in the global catalog.
+            - With I(service), the name of the plan in the global catalog.
         type: str
     allow_cleanup:
         description:
@@ -71,15 +73,56 @@ options:
         type: str
         default: present
         choices: [present, absent]
+    wait:
+        description:
+            - Wait until the created or updated instance reaches one of the I(wait_states) and its last operation is no longer in progress.
+            - The instance is polled with a delay that grows exponentially up to 60 seconds, with jitter.
+            - The task fails if the instance or its last operation fails, or if it doesn't reach the I(wait_states) within I(wait_timeout).
+        type: bool
+        default: false
+    wait_states:
+        description:
+            - The states of the instance that end the wait.
+        type: list
+        elements: str
+        default: [active]
+    wait_timeout:
+        description:
+            - The maximum number of seconds to wait for the instance.
+        type: int
+        default: 1800
 '''
 
 EXAMPLES = r'''
 Examples coming soon.
 '''
 
+RETURN = r'''
+msg:
+    description: The resource instance, the last polled one with I(wait).
+    returned: always
+    type: dict
+polls:
+    description: The number of times the instance was polled.
+    returned: with I(wait)
+    type: int
+elapsed:
+    description: The number of seconds waited for the instance.
+    returned: with I(wait)
+    type: float
+timings:
+    description:
+        - The seconds spent in each phase, C(request) for the create or update call, then each state that the instance was seen in,
+          like C(provisioning).
+    returned: with I(wait)
+    type: dict
+'''
+
+import time
+
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import diff
+from ..module_utils.wait import WaitTimeoutError, wait_for
 from ..module_utils import catalog
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
@@ -87,6 +130,21 @@ from ibm_cloud_sdk_core import ApiException
 # pylint: disable=line-too-long,fixme
 
 
+# The states of an instance that end a wait as a failure.
+INSTANCE_FAILED_STATES = ('failed', 'removed')
+
+
+def is_failed(instance):
+    last_operation = instance.get('last_operation') or {}
+    return instance.get('state') in INSTANCE_FAILED_STATES or last_operation.get('state') == 'failed'
+
+
+def is_in_progress(instance):
+    # An updated instance stays active while the update, for example a plan change, is in progress.
+    last_operation = instance.get('last_operation') or {}
+    return last_operation.get('state') == 'in progress'
+
+
 def run_module():
     module_args = dict(
         resource_group=dict(
@@ -128,6 +186,19 @@ def run_module():
             default='present',
             choices=['absent', 'present'],
             required=False),
+        wait=dict(
+            type='bool',
+            default=False,
+            required=False),
+        wait_states=dict(
+            type='list',
+            elements='str',
+            default=['active'],
+            required=False),
+        wait_timeout=dict(
+            type='int',
+            default=1800,
+            required=False),
     )
 
     module = AnsibleModule(
@@ -147,16 +218,58 @@ def run_module():
     recursive = module.params["recursive"]
     state = module.params["state"]
     service = module.params["service"]  # handcoded argument
+    wait = module.params["wait"]
+    wait_states = module.params["wait_states"]
+    wait_timeout = module.params["wait_timeout"]
 
     sdk = config.get_resource_contollerV2_sdk()
     resource_exists = True
+    instance = None
+
+    def exit_instance(result, started):
+        if not wait:
+            module.exit_json(changed=True, msg=result)
+
+        instance_id = result.get('guid') or result['id']
+        timings = {'request': time.monotonic() - started}
+        observed = {'state': result.get('state'), 'since': time.monotonic()}
+
+        def poll():
+            polled = sdk.get_resource_instance(id=instance_id).get_result()
+            now = time.monotonic()
+            phase = observed['state'] or 'unknown'
+            timings[phase] = timings.get(phase, 0) + now - observed['since']
+            observed.update(state=polled.get('state'), since=now)
+            return polled
+
+        def rounded(timings):
+            return dict((phase, round(seconds, 1)) for phase, seconds in timings.items())
+
+        try:
+            result, polls, elapsed = wait_for(
+                poll,
+                lambda polled: (polled.get('state') in wait_states and not is_in_progress(polled)) or is_failed(polled),
+                timeout=wait_timeout,
+            )
+        except WaitTimeoutError as ex:
+            module.fail_json(
+                msg='Timed out after %d seconds waiting for the resource instance %s' % (wait_timeout, instance_id),
+                changed=True, instance=ex.result, polls=ex.polls, elapsed=round(ex.elapsed, 1), timings=rounded(timings))
+        except ApiException as ex:
+            module.fail_json(msg=ex.message, changed=True)
+
+        if result.get('state') not in wait_states:
+            module.fail_json(
+                msg='The resource instance %s ended in the state %s' % (instance_id, result.get('state')),
+                changed=True, instance=result, polls=polls, elapsed=round(elapsed, 1), timings=rounded(timings))
+        module.exit_json(changed=True, msg=result, polls=polls, elapsed=round(elapsed, 1), timings=rounded(timings))
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_instance(
+            instance = sdk.get_resource_instance(
                 id=id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -184,12 +297,27 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        # With a service, the plan is a name of the catalog. It's resolved to
+        # its ID to compare it with the instance and to update the instance.
+        planID = plan
+        if resource_exists and service is not None and plan is not None:
+            try:
+                _serviceID, planID = catalog.get_planID(service, plan)
+            except ValueError as ex:
+                module.fail_json(msg=str(ex))
+        desired = dict(
+            name=name,
+            parameters=parameters,
+            resource_plan_id=planID,
+            allow_cleanup=allow_cleanup,
+        )
         catalogCRN, servicePlanID = '', ''
         if not resource_exists:
             if service is not None:
                 serviceID, catalogCRN, servicePlanID = catalog.get_serviceID_targetCRN_planID(
                     service, plan, location)
             # Create path
+            started = time.monotonic()
             try:
                 result = sdk.create_resource_instance(
                     name=name,
@@ -204,21 +332,25 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                exit_instance(result, started)
+        elif not diff.get_patch(desired, instance):
+            # Nothing to update
+            module.exit_json(changed=False, msg=instance)
         else:
             # Update path
+            started = time.monotonic()
             try:
                 result = sdk.update_resource_instance(
                     id=id,
                     name=name,
                     parameters=parameters,
-                    resource_plan_id=plan,
+                    resource_plan_id=planID,
                     allow_cleanup=allow_cleanup,
                 ).get_result()
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                exit_instance(result, started)
 
 
 def main():
@@ -20,6 +20,8 @@ description:
     - This module retrieves one or more ibm_resource_instance(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     id:
         description:
@@ -34,8 +36,7 @@ Examples coming soon.
 # pylint: disable=line-too-long,fixme
 
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -45,6 +46,10 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -53,6 +58,7 @@ def run_module():
     )
 
     id = module.params["id"]
+    fields = module.params["fields"]
 
     sdk = config.get_resource_contollerV2_sdk()
     # sdk = ResourceControllerV2.new_instance()
@@ -62,7 +68,7 @@ def run_module():
         response = sdk.get_resource_instance(
             id=id
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
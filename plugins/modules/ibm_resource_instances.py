@@ -0,0 +1,402 @@
+#!/usr/bin/python
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_resource_instances
+short_description: Manage many C(resource_instances) of a service plan for Resource Controller at once.
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - This module creates or deletes a list of C(resource_instance) resources of the same service, plan and location in a single task.
+  - The service, plan and location are resolved in the global catalog once, and the existing instances of the plan are listed once.
+    An instance is identified by its name, only the missing instances are created and only the existing instances are deleted.
+  - The instances are created or deleted concurrently, and with I(wait) they are also polled concurrently until they are active.
+  - Use M(ibm.cloud.ibm_resource_instance) to update a single instance.
+requirements:
+  - "ResourceControllerV2"
+  - "GlobalCatalogV1"
+options:
+  service:
+    description: "The name of the service of the instances, as in the global catalog."
+    type: str
+    required: true
+  plan:
+    description: "The name of the plan of the instances."
+    type: str
+    required: true
+  location:
+    description: "The deployment location where the instances are hosted."
+    type: str
+    required: true
+  resource_group:
+    description: "The ID of the resource group of the instances."
+    type: str
+  instances:
+    description:
+      - The resource instances.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: "The name of the instance."
+        type: str
+        required: true
+      parameters:
+        description: "Configuration options represented as key-value pairs. Only used to create the instance."
+        type: dict
+      tags:
+        description: "Tags that are attached to the instance after provisioning. Only used to create the instance."
+        type: list
+        elements: str
+  parallelism:
+    description:
+      - The maximum number of instances that are created, deleted or polled at the same time.
+    type: int
+    default: 5
+  rate_limit:
+    description:
+      - The maximum number of Resource Controller calls per second made by this task, for the create, delete and poll calls.
+      - Up to I(parallelism) calls can be made at once, then the calls are spread to stay under this rate.
+      - The rate isn't limited by default.
+    type: float
+  recursive:
+    description:
+      - With I(state=absent), also delete the resource bindings, keys and aliases of the instances.
+    type: bool
+    default: false
+  wait:
+    description:
+      - With I(state=present), wait until the created instances reach one of the I(wait_states).
+      - The instances are all created first, then polled together, up to I(parallelism) at a time, with a delay
+        between the rounds of polls that grows exponentially up to 60 seconds, with jitter.
+      - An instance that fails, or that doesn't reach the I(wait_states) within I(wait_timeout), is reported as C(failed).
+    type: bool
+    default: false
+  wait_states:
+    description:
+      - The states of the instances that end the wait.
+    type: list
+    elements: str
+    default: [active]
+  wait_timeout:
+    description:
+      - The maximum number of seconds to wait for the instances, once they're all created.
+    type: int
+    default: 1800
+  state:
+    description:
+      - Should the resources be present or absent.
+    type: str
+    default: present
+    choices: [present, absent]
+seealso:
+  - name: IBM Cloud Resource Controller docs
+    description: "Resource instances are the provisioned instances of the services of the catalog."
+    link: https://cloud.ibm.com/docs/account?topic=account-manage_resource
+notes:
+  - "Authenticate this module by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable.
+    The API key will be used to authenticate all IBM Cloud modules that use this environment variable."
+'''
+
+EXAMPLES = r'''
+- name: Create a Cloud Object Storage instance for each tenant
+  ibm_resource_instances:
+    service: cloud-object-storage
+    plan: standard
+    location: global
+    resource_group: 5c49eabc-f5e8-5881-a37e-2d100a33b3df
+    instances: "{{ tenants | map('regex_replace', '^(.*)$', 'cos-\\1') | map('community.general.dict_kv', 'name') }}"
+    parallelism: 10
+    rate_limit: 5
+    wait: true
+
+- name: Delete the instances of two tenants
+  ibm_resource_instances:
+    service: cloud-object-storage
+    plan: standard
+    location: global
+    resource_group: 5c49eabc-f5e8-5881-a37e-2d100a33b3df
+    instances:
+      - name: cos-tenant-a
+      - name: cos-tenant-b
+    recursive: true
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+  description:
+    - The result of each instance, in the order of I(instances).
+    - Each result has the C(name), C(id) and C(status) of the instance. The C(status) is one of C(created),
+      C(exists), C(deleted), C(not_found) or C(failed). Failed results also have an C(error) message.
+    - Created results have the C(resource_instance) that was returned by the service, the last polled one with I(wait).
+      With I(wait), they also have the C(state) of the instance and the C(elapsed) seconds waited for it.
+  type: list
+  elements: dict
+  returned: always
+'''
+
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+
+try:
+    from ..module_utils import catalog
+    from ..module_utils import config
+    from ..module_utils import pagination
+    from ..module_utils import wait as wait_utils
+    from ..module_utils.ratelimit import TokenBucket
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+# The states of an instance that end a wait as a failure.
+INSTANCE_FAILED_STATES = ('failed', 'removed')
+
+
+def is_failed(instance):
+    last_operation = instance.get('last_operation') or {}
+    return instance.get('state') in INSTANCE_FAILED_STATES or last_operation.get('state') == 'failed'
+
+
+def list_existing_instances(sdk, limiter, resource_group, plan_id, location):
+    """List the instances of the plan in the location and resource group by name."""
+    def list_page(page_start):
+        limiter.acquire()
+        return sdk.list_resource_instances(
+            resource_group_id=resource_group,
+            resource_plan_id=plan_id,
+            start=page_start,
+        ).get_result()
+
+    existing = {}
+    for page in pagination.iter_token_pages(list_page):
+        for instance in page.get('resources') or []:
+            if instance.get('region_id') == location:
+                existing.setdefault(instance.get('name'), instance)
+    return existing
+
+
+def run_module():
+    module_args = dict(
+        service=dict(
+            type='str',
+            required=True),
+        plan=dict(
+            type='str',
+            required=True),
+        location=dict(
+            type='str',
+            required=True),
+        resource_group=dict(
+            type='str',
+            required=False),
+        instances=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                name=dict(
+                    type='str',
+                    required=True),
+                parameters=dict(
+                    type='dict',
+                    required=False),
+                tags=dict(
+                    type='list',
+                    elements='str',
+                    required=False),
+            ),
+            required=True),
+        parallelism=dict(
+            type='int',
+            default=pagination.DEFAULT_PARALLELISM,
+            required=False),
+        rate_limit=dict(
+            type='float',
+            required=False),
+        recursive=dict(
+            type='bool',
+            default=False,
+            required=False),
+        wait=dict(
+            type='bool',
+            default=False,
+            required=False),
+        wait_states=dict(
+            type='list',
+            elements='str',
+            default=['active'],
+            required=False),
+        wait_timeout=dict(
+            type='int',
+            default=1800,
+            required=False),
+        state=dict(
+            type='str',
+            default='present',
+            choices=['absent', 'present'],
+            required=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+
+    if MISSING_IMPORT_EXC is not None:
+        module.fail_json(msg='Missing required import: ' + MISSING_IMPORT_EXC.msg)
+
+    service = module.params["service"]
+    plan = module.params["plan"]
+    location = module.params["location"]
+    resource_group = module.params["resource_group"]
+    instances = module.params["instances"]
+    parallelism = max(module.params["parallelism"], 1)
+    rate_limit = module.params["rate_limit"]
+    recursive = module.params["recursive"]
+    wait = module.params["wait"]
+    wait_states = module.params["wait_states"]
+    wait_timeout = module.params["wait_timeout"]
+    state = module.params["state"]
+
+    sdk = config.get_resource_contollerV2_sdk()
+    limiter = TokenBucket(rate_limit, burst=parallelism)
+
+    try:
+        _service_id, target, plan_id = catalog.get_serviceID_targetCRN_planID(service, plan, location)
+        existing = list_existing_instances(sdk, limiter, resource_group, plan_id, location)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+
+    def create(instance):
+        result = {"name": instance["name"]}
+        try:
+            limiter.acquire()
+            created = sdk.create_resource_instance(
+                name=instance["name"],
+                target=target,
+                resource_group=resource_group,
+                resource_plan_id=plan_id,
+                tags=instance["tags"],
+                parameters=instance["parameters"],
+            ).get_result()
+            result.update(id=created.get("id"), status="created", resource_instance=created)
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+        return result
+
+    def delete(instance):
+        result = {"name": instance.get("name"), "id": instance.get("id")}
+        try:
+            limiter.acquire()
+            sdk.delete_resource_instance(
+                id=instance["guid"],
+                recursive=recursive,
+            )
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+        else:
+            result.update(status="deleted")
+        return result
+
+    tasks = []
+    for instance in instances:
+        match = existing.get(instance["name"])
+        if state == "present":
+            if match is not None:
+                tasks.append((None, {"name": instance["name"], "id": match.get("id"), "status": "exists"}))
+            else:
+                tasks.append((create, instance))
+        elif match is not None:
+            tasks.append((delete, match))
+        else:
+            tasks.append((None, {"name": instance["name"], "status": "not_found"}))
+
+    def poll(pending):
+        result, instance_id = pending
+        limiter.acquire()
+        try:
+            return sdk.get_resource_instance(id=instance_id).get_result()
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+            return None
+
+    def wait_instances(executor, created):
+        """Poll the created instances until they're done, all of them in each round.
+
+        The instances are polled concurrently in each round, and the rounds are
+        spaced by the delays of the wait module, so all the instances share
+        the same `wait_timeout`, counted once all of them are created.
+        """
+        delays = iter(wait_utils.get_delays())
+        start = time.monotonic()
+        pending = [(result, result["resource_instance"].get("guid") or result["id"]) for result in created]
+        while pending:
+            polled = list(executor.map(poll, pending))
+            elapsed = round(time.monotonic() - start, 1)
+            still_pending = []
+            for (result, instance_id), instance in zip(pending, polled):
+                if instance is None:
+                    continue
+                result.update(resource_instance=instance, state=instance.get('state'), elapsed=elapsed)
+                if instance.get('state') in wait_states:
+                    continue
+                if is_failed(instance):
+                    result.update(status="failed", error="The instance ended in the state %s" % instance.get('state'))
+                    continue
+                still_pending.append((result, instance_id))
+            pending = still_pending
+
+            remaining = wait_timeout - (time.monotonic() - start)
+            if pending and remaining <= 0:
+                for result, _instance_id in pending:
+                    result.update(status="failed", error="Timed out after %d seconds" % wait_timeout)
+                return
+            if pending:
+                time.sleep(min(next(delays), remaining))
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        # All the instances are created before any of them is polled, so a
+        # long provisioning doesn't hold back the creates of the next ones.
+        futures = [executor.submit(action, instance) if action else None for action, instance in tasks]
+        results = [future.result() if future else instance for future, (_action, instance) in zip(futures, tasks)]
+        if wait and state == "present":
+            wait_instances(executor, [result for result in results if result["status"] == "created"])
+
+    # An instance that was created but failed to become active is still a change.
+    changed = any(result["status"] in ("created", "deleted") or "resource_instance" in result for result in results)
+    failed = [result for result in results if result["status"] == "failed"]
+    if failed:
+        module.fail_json(msg="Failed to %s %d of %d resource instances" % (
+            "create" if state == "present" else "delete", len(failed), len(results)),
+            changed=changed, results=results)
+
+    module.exit_json(changed=changed, msg=results)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,8 @@ description:
     - This module retrieves one or more ibm_resource_instances(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     resource_group_id:
         description:
@@ -45,6 +47,7 @@ options:
     limit:
         description:
             - Limit on how many items should be returned.
+            - With I(all_pages), the number of items requested per page.
         type: int
     start:
         description: |
@@ -72,16 +75,42 @@ options:
         description:
             - End date inclusive filter.
         type: str
+    all_pages:
+        description:
+            - Follow the C(next_url) of each page and return the items of all pages, starting from I(start).
+            - The result holds the C(resources) and their C(rows_count). C(next_url) is set if I(max_items) stopped the listing on a page boundary.
+        type: bool
+        default: false
+    max_items:
+        description:
+            - With I(all_pages), stop after this many items. C(truncated) is set in the result if more items were available.
+            - Must be at least 1.
+        type: int
+    dest:
+        description:
+            - With I(all_pages), write the items to this file instead of returning them, one JSON document per line.
+            - The items are written page by page, so the memory used doesn't grow with the number of instances.
+            - The result holds the C(dest) path and C(rows_count) instead of C(resources).
+        type: path
 '''
 
 EXAMPLES = r'''
-Examples coming soon.
+- name: List all the Cloud Object Storage instances of the account
+  ibm_resource_instances_info:
+    service: cloud-object-storage
+    all_pages: true
+
+- name: Write all the instances of the account to a file
+  ibm_resource_instances_info:
+    all_pages: true
+    limit: 100
+    dest: /tmp/resource_instances.jsonl
 '''
 
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ..module_utils import catalog
+from ..module_utils import pagination
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -124,10 +153,28 @@ def run_module():
         updated_to=dict(
             type='str',
             required=False),
+        all_pages=dict(
+            type='bool',
+            default=False,
+            required=False),
+        max_items=dict(
+            type='int',
+            required=False),
+        dest=dict(
+            type='path',
+            required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
         argument_spec=module_args,
+        required_by={
+            'max_items': 'all_pages',
+            'dest': 'all_pages',
+        },
         supports_check_mode=False
     )
 
@@ -143,6 +190,13 @@ def run_module():
     state_ = module.params["state_"]
     type = module.params["type"]
     updated_to = module.params["updated_to"]
+    all_pages = module.params["all_pages"]
+    max_items = module.params["max_items"]
+    dest = module.params["dest"]
+    fields = module.params["fields"]
+
+    if max_items is not None and max_items < 1:
+        module.fail_json(msg='max_items must be at least 1, got %d' % max_items)
 
     # sdk = ResourceControllerV2.new_instance()
 
@@ -156,23 +210,62 @@ def run_module():
             servicePlanID = ""
             if plan != "" and plan is not None and plan != "None":
                 serviceID, servicePlanID = catalog.get_planID(service, plan)
-        response = sdk.list_resource_instances(
-            guid=guid,
-            name=name,
-            resource_group_id=resource_group_id,
-            resource_id=serviceID,
-            resource_plan_id=servicePlanID,
-            type=type,
-            sub_type=sub_type,
-            limit=limit,
-            start=start,
-            state=state_,
-            updated_from=updated_from,
-            updated_to=updated_to
-        )
-        module.exit_json(msg=response.get_result())
+
+        def list_page(page_start, page_limit=limit):
+            return sdk.list_resource_instances(
+                guid=guid,
+                name=name,
+                resource_group_id=resource_group_id,
+                resource_id=serviceID,
+                resource_plan_id=servicePlanID,
+                type=type,
+                sub_type=sub_type,
+                limit=page_limit,
+                start=page_start,
+                state=state_,
+                updated_from=updated_from,
+                updated_to=updated_to
+            ).get_result()
+
+        if not all_pages:
+            module.exit_json(msg=projection.project_fields(list_page(start), fields))
+
+        if dest is not None:
+            with pagination.JSONLinesWriter(dest) as writer:
+                result = list_all_pages(list_page, start, limit, max_items, writer)
+            result.update(dest=dest, rows_count=writer.count)
+        else:
+            resources = []
+            result = list_all_pages(list_page, start, limit, max_items, resources)
+            result.update(resources=resources, rows_count=len(resources))
+        module.exit_json(msg=projection.project_fields(result, fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
+    except (IOError, OSError) as ex:
+        module.fail_json(msg='Failed to write %s: %s' % (dest, ex))
+
+
+def list_all_pages(list_page, start, limit, max_items, items):
+    """Add the resources of every page to `items`, stopping after `max_items`."""
+    # Don't ask for more than needed when the cap is below the page size.
+    if max_items is not None and (limit is None or limit > max_items):
+        limit = max_items
+
+    count = 0
+    for page in pagination.iter_token_pages(lambda token: list_page(token, limit), start=start):
+        resources = page.get('resources') or []
+        if max_items is not None and count + len(resources) >= max_items:
+            kept = resources[:max_items - count]
+            items.extend(kept)
+            truncated = len(kept) < len(resources) or bool(page.get('next_url'))
+            # The next page token is only a valid continuation if the whole page was kept.
+            next_url = page.get('next_url') if len(kept) == len(resources) else None
+            return {'truncated': truncated, 'next_url': next_url}
+
+        items.extend(resources)
+        count += len(resources)
+
+    return {'truncated': False, 'next_url': None}
 
 
 def main():
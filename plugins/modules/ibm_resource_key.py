@@ -61,8 +61,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -113,13 +112,14 @@ def run_module():
 
     sdk = config.get_resource_contollerV2_sdk()
     resource_exists = True
+    existing = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_key(
+            existing = sdk.get_resource_key(
                 id=id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -146,6 +146,9 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -159,6 +162,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
@@ -21,6 +21,8 @@ description:
     - This module retrieves one or more ibm_resource_key(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     id:
         description:
@@ -32,8 +34,7 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -43,6 +44,10 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -51,6 +56,7 @@ def run_module():
     )
 
     id = module.params["id"]
+    fields = module.params["fields"]
 
     # sdk = ResourceControllerV2.new_instance()
 
@@ -61,7 +67,7 @@ def run_module():
             response = sdk.get_resource_key(
                 id=id
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
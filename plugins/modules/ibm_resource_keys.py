@@ -0,0 +1,303 @@
+#!/usr/bin/python
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_resource_keys
+short_description: Manage many C(resource_keys) for Resource Controller at once.
+author:
+  - Kavya Handadi (@kavya498)
+version_added: "1.0.0"
+description:
+  - This module creates or deletes a list of C(resource_key) resources for Resource Controller in a single task.
+  - The existing keys are listed once, a key is identified by its name and the resource instance of its source.
+    Only the missing keys are created and only the existing keys are deleted, concurrently.
+  - Use M(ibm.cloud.ibm_resource_key) to update a single key.
+requirements:
+  - "ResourceControllerV2"
+options:
+  keys:
+    description:
+      - The resource keys.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: "The name of the key."
+        type: str
+        required: true
+      source:
+        description:
+          - The ID of resource instance or alias. The ID or CRN of the instance or alias can be used.
+          - An alias is resolved to its resource instance to match the existing keys.
+        type: str
+        required: true
+      role:
+        description: "The service or custom role name or it's CRN. Only used to create the key."
+        type: str
+      parameters:
+        description: "Configuration options represented as key-value pairs. Only used to create the key."
+        type: dict
+  purge:
+    description:
+      - With I(state=present), also delete the existing keys of the sources in I(keys) that aren't in I(keys).
+      - Use it to rotate the credentials of a set of instances in one task.
+    type: bool
+    default: false
+  parallelism:
+    description:
+      - The maximum number of keys that are created or deleted at the same time.
+    type: int
+    default: 5
+  state:
+    description:
+      - Should the resources be present or absent.
+    type: str
+    default: present
+    choices: [present, absent]
+seealso:
+  - name: IBM Cloud Resource Controller docs
+    description: "Resource keys are the credentials to access a resource instance."
+    link: https://cloud.ibm.com/docs/account?topic=account-service_credentials
+notes:
+  - "Authenticate this module by using an IBM Cloud API key. For more information about working with IBM Cloud API keys,
+    see I(Managing API keys): U(https://cloud.ibm.com/docs/account?topic=account-manapikey)."
+  - "To configure the authentication, set your IBM Cloud API key on the C(IC_API_KEY) environment variable.
+    The API key will be used to authenticate all IBM Cloud modules that use this environment variable."
+'''
+
+EXAMPLES = r'''
+- name: Create a key for each instance
+  ibm_resource_keys:
+    keys: "{{ instance_guids | map('community.general.dict_kv', 'source') | map('combine', key_spec) }}"
+    parallelism: 10
+  vars:
+    key_spec:
+      name: app-credentials-v1
+      role: Writer
+
+- name: Rotate the keys of two instances
+  ibm_resource_keys:
+    keys:
+      - name: app-credentials-v2
+        source: 381fd51a-f251-4f95-aff4-2b03fa8caa63
+        role: Writer
+      - name: app-credentials-v2
+        source: 5b6f5e1c-7a2e-4d3c-9d51-3c5a8e2f1b77
+        role: Writer
+    purge: true
+
+- name: Delete keys
+  ibm_resource_keys:
+    keys:
+      - name: app-credentials-v1
+        source: 381fd51a-f251-4f95-aff4-2b03fa8caa63
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+  description:
+    - The result of each key, in the order of I(keys) followed by the purged keys.
+    - Each result has the C(name), C(source), C(id) and C(status) of the key. The C(status) is one of C(created),
+      C(exists), C(deleted), C(not_found) or C(failed). Failed results also have an C(error) message.
+    - Created results have the C(resource_key) that was returned by the service, with its credentials.
+  type: list
+  elements: dict
+  returned: always
+'''
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+
+try:
+    from ..module_utils import config
+    from ..module_utils import pagination
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def get_crn_instance(crn):
+    """Return the GUID of the resource instance in a CRN, also for the CRN of an alias."""
+    segments = (crn or '').split(':')
+    return segments[7] if len(segments) > 7 else None
+
+
+def get_key_source(key):
+    """Return the GUID of the resource instance of a resource key, from its source CRN."""
+    return get_crn_instance(key.get('source_crn'))
+
+
+def get_source_instance(sdk, source):
+    """Return the GUID of the resource instance of a key source.
+
+    The source can be the GUID or CRN of an instance or of an alias, like the
+    source of a new key. A GUID is an alias if Resource Controller has one with
+    that ID, otherwise it's the GUID of an instance.
+    """
+    if source.startswith('crn:'):
+        return get_crn_instance(source) or source
+
+    try:
+        alias = sdk.get_resource_alias(id=source).get_result()
+    except ApiException as ex:
+        if ex.code == 404:
+            return source
+        raise
+    return get_crn_instance(alias.get('resource_instance_id')) or alias.get('resource_instance_id') or source
+
+
+def list_existing_keys(sdk):
+    """List the active resource keys of the account by name and source."""
+    def list_page(page_start):
+        return sdk.list_resource_keys(start=page_start).get_result()
+
+    existing = {}
+    for page in pagination.iter_token_pages(list_page):
+        for key in page.get('resources') or []:
+            if key.get('state') == 'active':
+                existing[(key.get('name'), get_key_source(key))] = key
+    return existing
+
+
+def run_module():
+    module_args = dict(
+        keys=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                name=dict(
+                    type='str',
+                    required=True),
+                source=dict(
+                    type='str',
+                    required=True),
+                role=dict(
+                    type='str',
+                    required=False),
+                parameters=dict(
+                    type='dict',
+                    required=False),
+            ),
+            no_log=False,
+            required=True),
+        purge=dict(
+            type='bool',
+            default=False,
+            required=False),
+        parallelism=dict(
+            type='int',
+            default=pagination.DEFAULT_PARALLELISM,
+            required=False),
+        state=dict(
+            type='str',
+            default='present',
+            choices=['absent', 'present'],
+            required=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+
+    if MISSING_IMPORT_EXC is not None:
+        module.fail_json(msg='Missing required import: ' + MISSING_IMPORT_EXC.msg)
+
+    keys = module.params["keys"]
+    purge = module.params["purge"]
+    parallelism = module.params["parallelism"]
+    state = module.params["state"]
+
+    sdk = config.get_resource_contollerV2_sdk()
+
+    def create(key):
+        result = {"name": key["name"], "source": key["source"]}
+        try:
+            resource_key = sdk.create_resource_key(
+                name=key["name"],
+                source=key["source"],
+                parameters=key["parameters"],
+                role=key["role"],
+            ).get_result()
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+        else:
+            result.update(id=resource_key.get("id"), status="created", resource_key=resource_key)
+        return result
+
+    def delete(key):
+        result = {"name": key.get("name"), "source": get_key_source(key), "id": key.get("id")}
+        try:
+            sdk.delete_resource_key(
+                id=key["id"],
+            )
+        except ApiException as ex:
+            result.update(status="failed", error=ex.message)
+        else:
+            result.update(status="deleted")
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(parallelism, 1)) as executor:
+        # The sources are resolved concurrently with the listing of the keys.
+        listing = executor.submit(list_existing_keys, sdk)
+        sources = list(set(key["source"] for key in keys))
+        try:
+            instances = dict(zip(sources, executor.map(lambda source: get_source_instance(sdk, source), sources)))
+            existing = listing.result()
+        except ApiException as ex:
+            module.fail_json(msg=ex.message)
+
+        desired = dict(((key["name"], instances[key["source"]]), key) for key in keys)
+        tasks = []
+        for identity, key in desired.items():
+            if state == "present":
+                if identity in existing:
+                    tasks.append((None, {
+                        "name": key["name"], "source": key["source"], "id": existing[identity].get("id"), "status": "exists"}))
+                else:
+                    tasks.append((create, key))
+            elif identity in existing:
+                tasks.append((delete, existing[identity]))
+            else:
+                tasks.append((None, {"name": key["name"], "source": key["source"], "status": "not_found"}))
+
+        if state == "present" and purge:
+            instance_ids = set(instances.values())
+            for identity, key in existing.items():
+                if identity[1] in instance_ids and identity not in desired:
+                    tasks.append((delete, key))
+
+        futures = [executor.submit(action, key) if action else None for action, key in tasks]
+        results = [future.result() if future else key for future, (_action, key) in zip(futures, tasks)]
+
+    changed = any(result["status"] in ("created", "deleted") for result in results)
+    failed = [result for result in results if result["status"] == "failed"]
+    if failed:
+        module.fail_json(msg="Failed to %s %d of %d resource keys" % (
+            "create or delete" if state == "present" else "delete", len(failed), len(results)),
+            changed=changed, results=results)
+
+    module.exit_json(changed=changed, msg=results)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,8 @@ description:
     - This module retrieves one or more ibm_resource_keys(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     resource_group_id:
         description:
@@ -63,8 +65,7 @@ Examples coming soon.
 
 
 from ..module_utils import config
-# Todo: change this to external python package format
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -95,6 +96,10 @@ def run_module():
         updated_to=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -110,6 +115,7 @@ def run_module():
     guid = module.params["guid"]
     resource_id = module.params["resource_id"]
     updated_to = module.params["updated_to"]
+    fields = module.params["fields"]
 
     # sdk = ResourceControllerV2.new_instance()
 
@@ -127,7 +133,7 @@ def run_module():
             updated_from=updated_from,
             updated_to=updated_to
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -21,6 +21,8 @@ description:
   - This module retrieves one or more C(resource_quota) for Resource Manager.
 requirements:
   - "ResourceManagerV2"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   id:
     description: "The id of the quota."
@@ -121,9 +123,9 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 
 try:
-    from ..module_utils.auth import get_authenticator
+    from ..module_utils import config
+    from ..module_utils import projection
     from ibm_cloud_sdk_core import ApiException
-    from ibm_platform_services import ResourceManagerV2
 except ImportError as imp_exc:
     MISSING_IMPORT_EXC = imp_exc
 else:
@@ -135,6 +137,10 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -146,19 +152,15 @@ def run_module():
         module.fail_json(msg='Missing required import: ' + MISSING_IMPORT_EXC.msg)
 
     id = module.params["id"]
+    fields = module.params["fields"]
 
     if module.check_mode:
         module.exit_json(msg='The module would run with the following parameters: ' + module.paramss)
 
-    authenticator = get_authenticator(service_name='resource_manager')
-    if authenticator is None:
-        module.fail_json(msg='Cannot create the authenticator.')
-
-    sdk = ResourceManagerV2(
-        authenticator=authenticator,
-    )
-
-    sdk.configure_service('resource_manager')
+    try:
+        sdk = config.get_resource_manager_sdk_from_environment()
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
 
     # list
     try:
@@ -168,7 +170,7 @@ def run_module():
 
         result = response.get_result()
 
-        module.exit_json(**result)
+        module.exit_json(**projection.project_fields(result, fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -18,6 +18,8 @@ description:
     - This module retrieves one or more ibm_resource_reclamations(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.fields
 options:
     account_id:
         description:
@@ -34,7 +36,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
-from ibm_platform_services import ResourceControllerV2
+from ..module_utils import projection
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
 
@@ -47,6 +49,10 @@ def run_module():
         resource_instance_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -56,6 +62,7 @@ def run_module():
 
     account_id = module.params["account_id"]
     resource_instance_id = module.params["resource_instance_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_resource_contollerV2_sdk()
 
@@ -65,7 +72,7 @@ def run_module():
             account_id=account_id,
             resource_instance_id=resource_instance_id
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
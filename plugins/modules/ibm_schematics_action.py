@@ -890,6 +890,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import schematics_argspec
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -900,323 +901,10 @@ except ImportError:
 
 def run_module():
     module_args = dict(
-        outputs=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['boolean', 'string', 'integer', 'date',
-                                     'array', 'list', 'map', 'complex', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        secure=dict(
-                            type='bool',
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        options=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        min_value=dict(
-                            type='int',
-                            required=False),
-                        max_value=dict(
-                            type='int',
-                            required=False),
-                        min_length=dict(
-                            type='int',
-                            required=False),
-                        max_length=dict(
-                            type='int',
-                            required=False),
-                        matches=dict(
-                            type='str',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
-        settings=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['boolean', 'string', 'integer', 'date',
-                                     'array', 'list', 'map', 'complex', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        secure=dict(
-                            type='bool',
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        options=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        min_value=dict(
-                            type='int',
-                            required=False),
-                        max_value=dict(
-                            type='int',
-                            required=False),
-                        min_length=dict(
-                            type='int',
-                            required=False),
-                        max_length=dict(
-                            type='int',
-                            required=False),
-                        matches=dict(
-                            type='str',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
-        credentials=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['string', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
-        inputs=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['boolean', 'string', 'integer', 'date',
-                                     'array', 'list', 'map', 'complex', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        secure=dict(
-                            type='bool',
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        options=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        min_value=dict(
-                            type='int',
-                            required=False),
-                        max_value=dict(
-                            type='int',
-                            required=False),
-                        min_length=dict(
-                            type='int',
-                            required=False),
-                        max_length=dict(
-                            type='int',
-                            required=False),
-                        matches=dict(
-                            type='str',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        outputs=schematics_argspec.variable_data_spec(),
+        settings=schematics_argspec.variable_data_spec(),
+        credentials=schematics_argspec.variable_data_spec(credential=True),
+        inputs=schematics_argspec.variable_data_spec(),
         description=dict(
             type='str',
             required=False),
@@ -1224,138 +912,14 @@ def run_module():
             type='str',
             required=False),
         # Represents the CredentialVariableData Python class
-        bastion_credential=dict(
-            type='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['string', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        bastion_credential=schematics_argspec.variable_data_spec(credential=True, single=True),
         source_type=dict(
             type='str',
             choices=['local', 'git_hub', 'git_hub_enterprise',
                      'git_lab', 'ibm_git_lab', 'ibm_cloud_catalog'],
             required=False),
         # Represents the ExternalSource Python class
-        source=dict(
-            type='dict',
-            options=dict(
-                source_type=dict(
-                    type='str',
-                    choices=['local', 'git_hub', 'git_hub_enterprise',
-                             'git_lab', 'ibm_git_lab', 'ibm_cloud_catalog'],
-                    required=False),
-                git=dict(
-                    type='dict',
-                    options=dict(
-                        computed_git_repo_url=dict(
-                            type='str',
-                            required=False),
-                        git_repo_url=dict(
-                            type='str',
-                            required=False),
-                        git_token=dict(
-                            type='str',
-                            required=False),
-                        git_repo_folder=dict(
-                            type='str',
-                            required=False),
-                        git_release=dict(
-                            type='str',
-                            required=False),
-                        git_branch=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                catalog=dict(
-                    type='dict',
-                    options=dict(
-                        catalog_name=dict(
-                            type='str',
-                            required=False),
-                        offering_name=dict(
-                            type='str',
-                            required=False),
-                        offering_version=dict(
-                            type='str',
-                            required=False),
-                        offering_kind=dict(
-                            type='str',
-                            required=False),
-                        catalog_id=dict(
-                            type='str',
-                            required=False),
-                        offering_id=dict(
-                            type='str',
-                            required=False),
-                        offering_version_id=dict(
-                            type='str',
-                            required=False),
-                        offering_repo_url=dict(
-                            type='str',
-                            required=False),
-                        offering_provisioner_working_directory=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-            ),
-            required=False),
+        source=schematics_argspec.source_spec(),
         inventory=dict(
             type='str',
             required=False),
@@ -1404,17 +968,7 @@ def run_module():
             choices=['us-south', 'us-east', 'eu-gb', 'eu-de'],
             required=False),
         # Represents the BastionResourceDefinition Python class
-        bastion=dict(
-            type='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                host=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        bastion=schematics_argspec.bastion_spec(),
         # Represents the ActionState Python class
         state_=dict(
             type='dict',
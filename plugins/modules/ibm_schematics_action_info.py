@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_action) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   action_id:
     description:
@@ -62,6 +64,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 
 try:
@@ -80,6 +83,10 @@ def run_module():
             type='str',
             choices=['summary', 'detailed', 'ids'],
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -89,6 +96,7 @@ def run_module():
 
     action_id = module.params["action_id"]
     profile = module.params["profile"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
@@ -99,7 +107,7 @@ def run_module():
                 action_id=action_id,
                 profile=profile
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -116,6 +116,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -186,14 +187,15 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if inventory_id:
         try:
-            sdk.get_inventory(
+            existing = sdk.get_inventory(
                 inventory_id=inventory_id,
                 profile=profile,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -222,6 +224,14 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            name=name,
+            description=description,
+            location=location,
+            resource_group=resource_group,
+            inventories_ini=inventories_ini,
+            resource_queries=resource_queries,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -237,6 +247,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_inventory) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   inventory_id:
     description:
@@ -59,6 +61,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 
 try:
@@ -77,6 +80,10 @@ def run_module():
             type='str',
             choices=['summary', 'detailed', 'ids'],
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -86,6 +93,7 @@ def run_module():
 
     inventory_id = module.params["inventory_id"]
     profile = module.params["profile"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
@@ -96,7 +104,7 @@ def run_module():
                 inventory_id=inventory_id,
                 profile=profile
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -2729,6 +2729,24 @@ options:
     description:
       - Equivalent to -force options in the command line.
     type: bool
+  wait:
+    description:
+      - Wait until the created or updated job is finished, failed or cancelled.
+      - The job is polled with an exponential backoff and jitter, within this single task.
+      - The task fails if the job fails, is cancelled or doesn't end within I(wait_timeout).
+    type: bool
+    default: false
+  wait_timeout:
+    description:
+      - The maximum number of seconds to wait for the job.
+    type: int
+    default: 1800
+  log_dest:
+    description:
+      - Tail the log of the created or updated job to this local file while the job runs, implies I(wait).
+      - The file is replaced when the task starts, then only the new bytes of the log are appended at each poll
+        until the job ends.
+    type: path
   state:
     description:
       - Should the resource be present or absent.
@@ -2830,11 +2848,32 @@ msg:
     If a resource was created, a C(Job) object is returned.
     If a resource was updated, a C(Job) object is returned.
     If a resource was deleted, the C(id) and C(status) fields are returned.
+    With I(wait), the C(Job) object as it was when the job ended.
   returned: always
   type: dict
+job_status:
+  description: The final status code of the job, for example C(job_finished).
+  returned: with I(wait)
+  type: str
+polls:
+  description: The number of times the job was read while waiting.
+  returned: with I(wait)
+  type: int
+elapsed:
+  description: The number of seconds waited for the job.
+  returned: with I(wait)
+  type: float
+log_bytes:
+  description: The number of bytes of the job log that were written to I(log_dest).
+  returned: with I(log_dest)
+  type: int
 '''
 
+import base64
+
 from ..module_utils import config
+from ..module_utils import schematics_argspec
+from ..module_utils.wait import WaitTimeoutError, wait_for
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -2843,907 +2882,86 @@ except ImportError:
     pass
 
 
+# The status codes of a job that won't change anymore.
+JOB_DONE_STATUS_CODES = ('job_finished', 'job_failed', 'job_cancelled')
+
+
+def get_job_status_code(job):
+    """Return the status code of a job, whatever its command object is."""
+    for job_status in ((job or {}).get('status') or {}).values():
+        if isinstance(job_status, dict) and job_status.get('status_code'):
+            return job_status['status_code']
+    return None
+
+
+def tail_job_log(sdk, job_id, path, offset):
+    """Append the bytes of the job log past the offset to the file.
+
+    The job logs API only returns the whole log, so the log is read at each
+    call but only the bytes that weren't written yet are appended.
+
+    Returns:
+        int: the new offset
+    """
+    try:
+        details = sdk.list_job_logs(job_id=job_id).get_result().get('details')
+    except ApiException as ex:
+        # The log doesn't exist until the job starts.
+        if ex.code == 404:
+            return offset
+        raise
+
+    log = base64.b64decode(details) if details else b''
+    if len(log) > offset:
+        with open(path, 'ab') as log_file:
+            log_file.write(log[offset:])
+    return max(offset, len(log))
+
+
 def run_module():
     module_args = dict(
-        settings=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['boolean', 'string', 'integer', 'date',
-                                     'array', 'list', 'map', 'complex', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        secure=dict(
-                            type='bool',
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        options=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        min_value=dict(
-                            type='int',
-                            required=False),
-                        max_value=dict(
-                            type='int',
-                            required=False),
-                        min_length=dict(
-                            type='int',
-                            required=False),
-                        max_length=dict(
-                            type='int',
-                            required=False),
-                        matches=dict(
-                            type='str',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        settings=schematics_argspec.variable_data_spec(),
         # Represents the JobData Python class
         data=dict(
             type='dict',
             options=dict(
                 job_type=dict(
-                    type='str',
-                    choices=['repo_download_job', 'workspace_job',
-                             'action_job', 'system_job', 'flow-job'],
-                    required=False),
-                workspace_job_data=dict(
-                    type='dict',
-                    options=dict(
-                        workspace_name=dict(
-                            type='str',
-                            required=False),
-                        flow_id=dict(
-                            type='str',
-                            required=False),
-                        flow_name=dict(
-                            type='str',
-                            required=False),
-                        inputs=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                name=dict(
-                                    type='str',
-                                    required=False),
-                                value=dict(
-                                    type='str',
-                                    required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                link=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        outputs=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                name=dict(
-                                    type='str',
-                                    required=False),
-                                value=dict(
-                                    type='str',
-                                    required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                link=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        settings=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                name=dict(
-                                    type='str',
-                                    required=False),
-                                value=dict(
-                                    type='str',
-                                    required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                link=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        template_data=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                template_id=dict(
-                                    type='str',
-                                    required=False),
-                                template_name=dict(
-                                    type='str',
-                                    required=False),
-                                flow_index=dict(
-                                    type='int',
-                                    required=False),
-                                inputs=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                outputs=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                settings=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                updated_at=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        updated_at=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                action_job_data=dict(
-                    type='dict',
-                    options=dict(
-                        action_name=dict(
-                            type='str',
-                            required=False),
-                        inputs=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                name=dict(
-                                    type='str',
-                                    required=False),
-                                value=dict(
-                                    type='str',
-                                    required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                link=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        outputs=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                name=dict(
-                                    type='str',
-                                    required=False),
-                                value=dict(
-                                    type='str',
-                                    required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                link=dict(
-                                    type='str',
-                                    required=False),
-                            ),
+                    type='str',
+                    choices=['repo_download_job', 'workspace_job',
+                             'action_job', 'system_job', 'flow-job'],
+                    required=False),
+                workspace_job_data=dict(
+                    type='dict',
+                    options=dict(
+                        workspace_name=dict(
+                            type='str',
+                            required=False),
+                        flow_id=dict(
+                            type='str',
                             required=False),
-                        settings=dict(
+                        flow_name=dict(
+                            type='str',
+                            required=False),
+                        inputs=schematics_argspec.variable_data_spec(),
+                        outputs=schematics_argspec.variable_data_spec(),
+                        settings=schematics_argspec.variable_data_spec(),
+                        template_data=dict(
                             type='list',
                             elements='dict',
                             options=dict(
-                                name=dict(
+                                template_id=dict(
                                     type='str',
                                     required=False),
-                                value=dict(
+                                template_name=dict(
                                     type='str',
                                     required=False),
-                                use_default=dict(
-                                    type='bool',
-                                    required=False),
-                                metadata=dict(
-                                    type='dict',
-                                    options=dict(
-                                        type=dict(
-                                            type='str',
-                                            choices=[
-                                                'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                            required=False),
-                                        aliases=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        description=dict(
-                                            type='str',
-                                            required=False),
-                                        cloud_data_type=dict(
-                                            type='str',
-                                            required=False),
-                                        default_value=dict(
-                                            type='str',
-                                            required=False),
-                                        link_status=dict(
-                                            type='str',
-                                            choices=['normal', 'broken'],
-                                            required=False),
-                                        secure=dict(
-                                            type='bool',
-                                            required=False),
-                                        immutable=dict(
-                                            type='bool',
-                                            required=False),
-                                        hidden=dict(
-                                            type='bool',
-                                            required=False),
-                                        required=dict(
-                                            type='bool',
-                                            required=False),
-                                        options=dict(
-                                            type='list',
-                                            elements='str',
-                                            required=False),
-                                        min_value=dict(
-                                            type='int',
-                                            required=False),
-                                        max_value=dict(
-                                            type='int',
-                                            required=False),
-                                        min_length=dict(
-                                            type='int',
-                                            required=False),
-                                        max_length=dict(
-                                            type='int',
-                                            required=False),
-                                        matches=dict(
-                                            type='str',
-                                            required=False),
-                                        position=dict(
-                                            type='int',
-                                            required=False),
-                                        group_by=dict(
-                                            type='str',
-                                            required=False),
-                                        source=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
+                                flow_index=dict(
+                                    type='int',
                                     required=False),
-                                link=dict(
+                                inputs=schematics_argspec.variable_data_spec(),
+                                outputs=schematics_argspec.variable_data_spec(),
+                                settings=schematics_argspec.variable_data_spec(),
+                                updated_at=dict(
                                     type='str',
                                     required=False),
                             ),
@@ -3751,6 +2969,20 @@ def run_module():
                         updated_at=dict(
                             type='str',
                             required=False),
+                    ),
+                    required=False),
+                action_job_data=dict(
+                    type='dict',
+                    options=dict(
+                        action_name=dict(
+                            type='str',
+                            required=False),
+                        inputs=schematics_argspec.variable_data_spec(),
+                        outputs=schematics_argspec.variable_data_spec(),
+                        settings=schematics_argspec.variable_data_spec(),
+                        updated_at=dict(
+                            type='str',
+                            required=False),
                         inventory_record=dict(
                             type='dict',
                             options=dict(
@@ -3839,329 +3071,10 @@ def run_module():
                                     choices=['local', 'git_hub', 'git_hub_enterprise',
                                              'git_lab', 'ibm_git_lab', 'ibm_cloud_catalog'],
                                     required=False),
-                                source=dict(
-                                    type='dict',
-                                    options=dict(
-                                        source_type=dict(
-                                            type='str',
-                                            choices=['local', 'git_hub', 'git_hub_enterprise',
-                                                     'git_lab', 'ibm_git_lab', 'ibm_cloud_catalog'],
-                                            required=False),
-                                        git=dict(
-                                            type='dict',
-                                            options=dict(
-                                                computed_git_repo_url=dict(
-                                                    type='str',
-                                                    required=False),
-                                                git_repo_url=dict(
-                                                    type='str',
-                                                    required=False),
-                                                git_token=dict(
-                                                    type='str',
-                                                    required=False),
-                                                git_repo_folder=dict(
-                                                    type='str',
-                                                    required=False),
-                                                git_release=dict(
-                                                    type='str',
-                                                    required=False),
-                                                git_branch=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        catalog=dict(
-                                            type='dict',
-                                            options=dict(
-                                                catalog_name=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_name=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_version=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_kind=dict(
-                                                    type='str',
-                                                    required=False),
-                                                catalog_id=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_id=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_version_id=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_repo_url=dict(
-                                                    type='str',
-                                                    required=False),
-                                                offering_provisioner_working_directory=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                    ),
-                                    required=False),
-                                inputs=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                outputs=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                settings=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        name=dict(
-                                            type='str',
-                                            required=False),
-                                        value=dict(
-                                            type='str',
-                                            required=False),
-                                        use_default=dict(
-                                            type='bool',
-                                            required=False),
-                                        metadata=dict(
-                                            type='dict',
-                                            options=dict(
-                                                type=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'boolean', 'string', 'integer', 'date', 'array', 'list', 'map', 'complex', 'link'],
-                                                    required=False),
-                                                aliases=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                description=dict(
-                                                    type='str',
-                                                    required=False),
-                                                cloud_data_type=dict(
-                                                    type='str',
-                                                    required=False),
-                                                default_value=dict(
-                                                    type='str',
-                                                    required=False),
-                                                link_status=dict(
-                                                    type='str',
-                                                    choices=[
-                                                        'normal', 'broken'],
-                                                    required=False),
-                                                secure=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                immutable=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                hidden=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                required=dict(
-                                                    type='bool',
-                                                    required=False),
-                                                options=dict(
-                                                    type='list',
-                                                    elements='str',
-                                                    required=False),
-                                                min_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_value=dict(
-                                                    type='int',
-                                                    required=False),
-                                                min_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                max_length=dict(
-                                                    type='int',
-                                                    required=False),
-                                                matches=dict(
-                                                    type='str',
-                                                    required=False),
-                                                position=dict(
-                                                    type='int',
-                                                    required=False),
-                                                group_by=dict(
-                                                    type='str',
-                                                    required=False),
-                                                source=dict(
-                                                    type='str',
-                                                    required=False),
-                                            ),
-                                            required=False),
-                                        link=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
+                                source=schematics_argspec.source_spec(),
+                                inputs=schematics_argspec.variable_data_spec(),
+                                outputs=schematics_argspec.variable_data_spec(),
+                                settings=schematics_argspec.variable_data_spec(),
                                 last_job=dict(
                                     type='dict',
                                     options=dict(
@@ -4207,91 +3120,7 @@ def run_module():
                     required=False),
             ),
             required=False),
-        inputs=dict(
-            type='list',
-            elements='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                value=dict(
-                    type='str',
-                    required=False),
-                use_default=dict(
-                    type='bool',
-                    required=False),
-                metadata=dict(
-                    type='dict',
-                    options=dict(
-                        type=dict(
-                            type='str',
-                            choices=['boolean', 'string', 'integer', 'date',
-                                     'array', 'list', 'map', 'complex', 'link'],
-                            required=False),
-                        aliases=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        description=dict(
-                            type='str',
-                            required=False),
-                        cloud_data_type=dict(
-                            type='str',
-                            required=False),
-                        default_value=dict(
-                            type='str',
-                            required=False),
-                        link_status=dict(
-                            type='str',
-                            choices=['normal', 'broken'],
-                            required=False),
-                        secure=dict(
-                            type='bool',
-                            required=False),
-                        immutable=dict(
-                            type='bool',
-                            required=False),
-                        hidden=dict(
-                            type='bool',
-                            required=False),
-                        required=dict(
-                            type='bool',
-                            required=False),
-                        options=dict(
-                            type='list',
-                            elements='str',
-                            required=False),
-                        min_value=dict(
-                            type='int',
-                            required=False),
-                        max_value=dict(
-                            type='int',
-                            required=False),
-                        min_length=dict(
-                            type='int',
-                            required=False),
-                        max_length=dict(
-                            type='int',
-                            required=False),
-                        matches=dict(
-                            type='str',
-                            required=False),
-                        position=dict(
-                            type='int',
-                            required=False),
-                        group_by=dict(
-                            type='str',
-                            required=False),
-                        source=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
-                link=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        inputs=schematics_argspec.variable_data_spec(),
         command_name=dict(
             type='str',
             choices=['workspace_plan', 'workspace_apply', 'workspace_destroy', 'workspace_refresh',
@@ -4488,17 +3317,7 @@ def run_module():
             choices=['us-south', 'us-east', 'eu-gb', 'eu-de'],
             required=False),
         # Represents the BastionResourceDefinition Python class
-        bastion=dict(
-            type='dict',
-            options=dict(
-                name=dict(
-                    type='str',
-                    required=False),
-                host=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        bastion=schematics_argspec.bastion_spec(),
         # Represents the JobStatus Python class
         status=dict(
             type='dict',
@@ -4523,54 +3342,7 @@ def run_module():
                         status_message=dict(
                             type='str',
                             required=False),
-                        flow_status=dict(
-                            type='dict',
-                            options=dict(
-                                flow_id=dict(
-                                    type='str',
-                                    required=False),
-                                flow_name=dict(
-                                    type='str',
-                                    required=False),
-                                status_code=dict(
-                                    type='str',
-                                    choices=['job_pending', 'job_in_progress',
-                                             'job_finished', 'job_failed', 'job_cancelled'],
-                                    required=False),
-                                status_message=dict(
-                                    type='str',
-                                    required=False),
-                                workitems=dict(
-                                    type='list',
-                                    elements='dict',
-                                    options=dict(
-                                        workspace_id=dict(
-                                            type='str',
-                                            required=False),
-                                        workspace_name=dict(
-                                            type='str',
-                                            required=False),
-                                        job_id=dict(
-                                            type='str',
-                                            required=False),
-                                        status_code=dict(
-                                            type='str',
-                                            choices=[
-                                                'job_pending', 'job_in_progress', 'job_finished', 'job_failed', 'job_cancelled'],
-                                            required=False),
-                                        status_message=dict(
-                                            type='str',
-                                            required=False),
-                                        updated_at=dict(
-                                            type='str',
-                                            required=False),
-                                    ),
-                                    required=False),
-                                updated_at=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
+                        flow_status=schematics_argspec.flow_job_status_spec(),
                         template_status=dict(
                             type='list',
                             elements='dict',
@@ -4683,54 +3455,7 @@ def run_module():
                             required=False),
                     ),
                     required=False),
-                flow_job_status=dict(
-                    type='dict',
-                    options=dict(
-                        flow_id=dict(
-                            type='str',
-                            required=False),
-                        flow_name=dict(
-                            type='str',
-                            required=False),
-                        status_code=dict(
-                            type='str',
-                            choices=['job_pending', 'job_in_progress',
-                                     'job_finished', 'job_failed', 'job_cancelled'],
-                            required=False),
-                        status_message=dict(
-                            type='str',
-                            required=False),
-                        workitems=dict(
-                            type='list',
-                            elements='dict',
-                            options=dict(
-                                workspace_id=dict(
-                                    type='str',
-                                    required=False),
-                                workspace_name=dict(
-                                    type='str',
-                                    required=False),
-                                job_id=dict(
-                                    type='str',
-                                    required=False),
-                                status_code=dict(
-                                    type='str',
-                                    choices=['job_pending', 'job_in_progress',
-                                             'job_finished', 'job_failed', 'job_cancelled'],
-                                    required=False),
-                                status_message=dict(
-                                    type='str',
-                                    required=False),
-                                updated_at=dict(
-                                    type='str',
-                                    required=False),
-                            ),
-                            required=False),
-                        updated_at=dict(
-                            type='str',
-                            required=False),
-                    ),
-                    required=False),
+                flow_job_status=schematics_argspec.flow_job_status_spec(),
             ),
             required=False),
         refresh_token=dict(
@@ -4749,6 +3474,17 @@ def run_module():
         force=dict(
             type='bool',
             required=False),
+        wait=dict(
+            type='bool',
+            default=False,
+            required=False),
+        wait_timeout=dict(
+            type='int',
+            default=1800,
+            required=False),
+        log_dest=dict(
+            type='path',
+            required=False),
         state=dict(
             type='str',
             default='present',
@@ -4779,10 +3515,52 @@ def run_module():
     profile = module.params["profile"]
     propagate = module.params["propagate"]
     force = module.params["force"]
+    wait = module.params["wait"]
+    wait_timeout = module.params["wait_timeout"]
+    log_dest = module.params["log_dest"]
     state = module.params["state"]
 
     sdk = config.get_schematicsv1_sdk()
 
+    def exit_job(job):
+        if not (wait or log_dest):
+            module.exit_json(changed=True, msg=job)
+
+        run_id = job['id']
+        log = {}
+
+        def poll():
+            polled = sdk.get_job(job_id=run_id, profile=profile).get_result()
+            if log_dest:
+                log['log_bytes'] = tail_job_log(sdk, run_id, log_dest, log['log_bytes'])
+            return polled
+
+        try:
+            if log_dest:
+                open(log_dest, 'wb').close()
+                log['log_bytes'] = 0
+            job, polls, elapsed = wait_for(
+                poll,
+                lambda polled: get_job_status_code(polled) in JOB_DONE_STATUS_CODES,
+                timeout=wait_timeout,
+            )
+        except WaitTimeoutError as ex:
+            module.fail_json(
+                msg='Timed out after %d seconds waiting for the job %s' % (wait_timeout, run_id),
+                changed=True, job=ex.result, job_status=get_job_status_code(ex.result), polls=ex.polls, elapsed=round(ex.elapsed, 1),
+                **log)
+        except ApiException as ex:
+            module.fail_json(msg=ex.message, changed=True, **log)
+        except OSError as ex:
+            module.fail_json(msg='Failed to write %s: %s' % (log_dest, ex), changed=True)
+
+        job_status = get_job_status_code(job)
+        if job_status != 'job_finished':
+            module.fail_json(
+                msg='The job %s ended with the status %s' % (run_id, job_status),
+                changed=True, job=job, job_status=job_status, polls=polls, elapsed=round(elapsed, 1), **log)
+        module.exit_json(changed=True, msg=job, job_status=job_status, polls=polls, elapsed=round(elapsed, 1), **log)
+
     resource_exists = True
 
     # Check for existence
@@ -4843,7 +3621,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                exit_job(result)
         else:
             # Update path
             try:
@@ -4867,7 +3645,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                exit_job(result)
 
 
 def main():
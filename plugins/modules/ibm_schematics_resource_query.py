@@ -125,6 +125,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -203,13 +204,14 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    existing = None
 
     # Check for existence
     if query_id:
         try:
-            sdk.get_resources_query(
+            existing = sdk.get_resources_query(
                 query_id=query_id,
-            )
+            ).get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -238,6 +240,11 @@ def run_module():
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
+        desired = dict(
+            type=type,
+            name=name,
+            queries=queries,
+        )
         if not resource_exists:
             # Create path
             try:
@@ -250,6 +257,9 @@ def run_module():
                 module.fail_json(msg=ex.message)
             else:
                 module.exit_json(changed=True, msg=result)
+        elif not diff.get_patch(desired, existing):
+            # Nothing to update
+            module.exit_json(changed=False, msg=existing)
         else:
             # Update path
             try:
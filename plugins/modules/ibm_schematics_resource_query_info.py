@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_resource_query) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   query_id:
     description:
@@ -52,6 +54,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -65,6 +68,10 @@ def run_module():
         query_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -73,6 +80,7 @@ def run_module():
     )
 
     query_id = module.params["query_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
@@ -82,7 +90,7 @@ def run_module():
             response = sdk.get_resources_query(
                 query_id=query_id
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_state) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   t_id:
     description: |
@@ -29,6 +31,24 @@ options:
     description:
       - The ID of the workspace for which you want to retrieve the Terraform statefile.  To find the workspace ID, use the C(GET /v1/workspaces) API.
     type: str
+  dest:
+    description:
+      - Write the Terraform statefile to this file instead of returning it.
+      - The statefile is streamed to the file in chunks, so it's never held in memory as a whole.
+      - The result holds the C(dest) path with the C(size) and C(checksum) of the statefile instead of the statefile.
+      - The file is only replaced if its content changed, C(changed) is then true.
+    type: path
+  gzip:
+    description:
+      - With I(dest), compress the file with gzip.
+      - The C(size) and C(checksum) are still those of the uncompressed statefile.
+    type: bool
+    default: false
+  checksum_only:
+    description:
+      - Only return the C(size) and C(checksum) of the statefile, to detect that it changed without returning or writing it.
+    type: bool
+    default: false
 seealso:
   - name: IBM Cloud Schematics docs
     description: Use Schematics to run your Ansible playbooks to provision, configure, and manage IBM Cloud resources.
@@ -46,6 +66,13 @@ EXAMPLES = r'''
 
 - name: List ibm_schematics_state
   ibm_schematics_state_info:
+
+- name: Save the Terraform statefile of a workspace
+  ibm_schematics_state_info:
+    w_id: us-south.workspace.my-workspace.1a2b3c4d
+    t_id: 5b6f5e1c-7a2e-4d3c-9d51-3c5a8e2f1b77
+    dest: /tmp/terraform.tfstate.gz
+    gzip: true
 '''
 
 RETURN = '''
@@ -53,11 +80,19 @@ msg:
   description: |-
     A dictionary that represents the result.
     In case of "list", it's a C(TemplateStateStore).
+    With I(dest) or I(checksum_only), it holds the C(size) in bytes and the SHA-256 C(checksum) of the statefile,
+    and the C(dest) path with I(dest).
   returned: always
   type: dict
 '''
 
+import gzip
+import hashlib
+import os
+import tempfile
+
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -66,6 +101,52 @@ except ImportError:
     pass
 
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def copy_state(response, out=None):
+    """Read a streamed statefile in chunks, writing them to `out` if given.
+
+    Returns:
+        tuple: the size and the SHA-256 checksum of the statefile
+    """
+    checksum = hashlib.sha256()
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            checksum.update(chunk)
+            size += len(chunk)
+            if out is not None:
+                out.write(chunk)
+    finally:
+        response.close()
+    return size, checksum.hexdigest()
+
+
+def save_state(module, response, dest, compress):
+    """Write a streamed statefile to a temporary file next to `dest`, then move it in place.
+
+    Returns:
+        tuple: the size and the SHA-256 checksum of the statefile, and whether `dest` changed
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)))
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            if compress:
+                # No name or time in the header, the same statefile gives the same file.
+                with gzip.GzipFile(filename='', mode='wb', fileobj=out, mtime=0) as gzip_out:
+                    size, checksum = copy_state(response, gzip_out)
+            else:
+                size, checksum = copy_state(response, out)
+        changed = not os.path.exists(dest) or module.sha256(dest) != module.sha256(tmp)
+        if changed:
+            module.atomic_move(tmp, dest)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return size, checksum, changed
+
+
 def run_module():
     module_args = dict(
         t_id=dict(
@@ -74,27 +155,67 @@ def run_module():
         w_id=dict(
             type='str',
             required=False),
+        dest=dict(
+            type='path',
+            required=False),
+        gzip=dict(
+            type='bool',
+            default=False,
+            required=False),
+        checksum_only=dict(
+            type='bool',
+            default=False,
+            required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=[
+            ('dest', 'checksum_only'),
+        ],
         supports_check_mode=False
     )
 
     t_id = module.params["t_id"]
     w_id = module.params["w_id"]
+    dest = module.params["dest"]
+    compress = module.params["gzip"]
+    checksum_only = module.params["checksum_only"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
     # list
     try:
+        if dest is None and not checksum_only:
+            response = sdk.get_workspace_template_state(
+                w_id=w_id,
+                t_id=t_id
+            )
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
+
+        # Stream the statefile instead of parsing it, it can be tens of MB.
         response = sdk.get_workspace_template_state(
             w_id=w_id,
-            t_id=t_id
-        )
-        module.exit_json(msg=response.get_result())
+            t_id=t_id,
+            stream=True
+        ).get_result()
+        changed = False
+        if checksum_only:
+            size, checksum = copy_state(response)
+            result = dict(size=size, checksum=checksum)
+        else:
+            size, checksum, changed = save_state(module, response, dest, compress)
+            result = dict(dest=dest, size=size, checksum=checksum)
+        module.exit_json(changed=changed, msg=projection.project_fields(result, fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
+    except (IOError, OSError) as ex:
+        module.fail_json(msg='Failed to write %s: %s' % (dest, ex))
 
 
 def main():
@@ -627,6 +627,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import schematics_argspec
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -689,29 +690,7 @@ def run_module():
             ),
             required=False),
         # Represents the WorkspaceStatusUpdateRequest Python class
-        workspace_status_update_request_workspace_status=dict(
-            type='dict',
-            options=dict(
-                frozen=dict(
-                    type='bool',
-                    required=False),
-                frozen_at=dict(
-                    type='str',
-                    required=False),
-                frozen_by=dict(
-                    type='str',
-                    required=False),
-                locked=dict(
-                    type='bool',
-                    required=False),
-                locked_by=dict(
-                    type='str',
-                    required=False),
-                locked_time=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        workspace_status_update_request_workspace_status=schematics_argspec.workspace_status_spec(),
         # Represents the Dependencies Python class
         dependencies=dict(
             type='dict',
@@ -731,29 +710,7 @@ def run_module():
             elements='str',
             required=False),
         # Represents the WorkspaceStatusRequest Python class
-        workspace_status=dict(
-            type='dict',
-            options=dict(
-                frozen=dict(
-                    type='bool',
-                    required=False),
-                frozen_at=dict(
-                    type='str',
-                    required=False),
-                frozen_by=dict(
-                    type='str',
-                    required=False),
-                locked=dict(
-                    type='bool',
-                    required=False),
-                locked_by=dict(
-                    type='str',
-                    required=False),
-                locked_time=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        workspace_status=schematics_argspec.workspace_status_spec(),
         # Represents the CatalogRef Python class
         catalog_ref=dict(
             type='dict',
@@ -959,26 +916,7 @@ def run_module():
             type='str',
             required=False),
         # Represents the TemplateRepoRequest Python class
-        template_repo=dict(
-            type='dict',
-            options=dict(
-                branch=dict(
-                    type='str',
-                    required=False),
-                release=dict(
-                    type='str',
-                    required=False),
-                repo_sha_value=dict(
-                    type='str',
-                    required=False),
-                repo_url=dict(
-                    type='str',
-                    required=False),
-                url=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        template_repo=schematics_argspec.template_repo_spec(),
         # Represents the WorkspaceStatusMessage Python class
         workspace_status_msg=dict(
             type='dict',
@@ -995,26 +933,7 @@ def run_module():
             type='str',
             required=False),
         # Represents the TemplateRepoUpdateRequest Python class
-        template_repo_update_request_template_repo=dict(
-            type='dict',
-            options=dict(
-                branch=dict(
-                    type='str',
-                    required=False),
-                release=dict(
-                    type='str',
-                    required=False),
-                repo_sha_value=dict(
-                    type='str',
-                    required=False),
-                repo_url=dict(
-                    type='str',
-                    required=False),
-                url=dict(
-                    type='str',
-                    required=False),
-            ),
-            required=False),
+        template_repo_update_request_template_repo=schematics_argspec.template_repo_spec(),
         name=dict(
             type='str',
             required=False),
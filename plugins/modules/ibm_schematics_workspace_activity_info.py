@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_workspace_activity) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   w_id:
     description:
@@ -27,6 +29,22 @@ options:
     description:
       - The ID of the activity or job, for which you want to retrieve details.  To find the job ID, use the C(GET /v1/workspaces/{id}/actions) API.
     type: str
+  since:
+    description:
+      - List the activities of the workspace I(w_id) that are newer than this cursor, newest first.
+      - The cursor is either the ID of an activity or a timestamp, like C(2023-04-01T12:00:00Z).
+      - The activities are listed page by page, and the listing stops at the page that reaches the cursor,
+        so the older activities aren't fetched.
+      - Takes precedence over the cursor that is saved in I(state_file).
+    type: str
+  state_file:
+    description:
+      - List the activities of the workspace I(w_id) that are newer than the cursor that is saved in this file, newest first.
+      - The cursor is then updated to the newest activity, so the next run only returns the activities that happened
+        since this one. All the activities are returned if the file doesn't exist yet.
+      - The file holds a cursor for each workspace, so it can be shared by the tasks of several workspaces.
+      - C(changed) is true when the cursor in the file is updated.
+    type: path
 seealso:
   - name: IBM Cloud Schematics docs
     description: Use Schematics to run your Ansible playbooks to provision, configure, and manage IBM Cloud resources.
@@ -44,6 +62,11 @@ EXAMPLES = r'''
 
 - name: List ibm_schematics_workspace_activity
   ibm_schematics_workspace_activity_info:
+
+- name: List the activities of a workspace since the last run
+  ibm_schematics_workspace_activity_info:
+    w_id: us-south.workspace.my-workspace.1a2b3c4d
+    state_file: ~/.ansible/ibm_cloud/workspace_activities.json
 '''
 
 RETURN = '''
@@ -51,19 +74,82 @@ msg:
   description: |-
     A dictionary that represents the result.
     In case of "list", it's a C(WorkspaceActivity).
+    With I(since) or I(state_file), it holds the new C(actions) and the C(cursor) of the newest activity,
+    with its C(activity_id) and C(performed_at).
   returned: always
   type: dict
 '''
 
+import json
+import os
+import re
+import tempfile
+
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
-    from ibm_cloud_sdk_core import ApiException
+    from ibm_cloud_sdk_core import ApiException, string_to_datetime
 except ImportError:
     pass
 
 
+ACTIVITIES_PAGE_SIZE = 100
+TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}([T ]|$)')
+
+
+def parse_cursor(since):
+    """Parse a cursor that is either an ISO 8601 timestamp or the ID of an activity."""
+    if TIMESTAMP_RE.match(since):
+        return {'performed_at': string_to_datetime(since)}
+    return {'activity_id': since}
+
+
+def is_reached(activity, cursor):
+    """Whether an activity is the one of the cursor or older."""
+    if cursor.get('activity_id') and activity.get('action_id') == cursor['activity_id']:
+        return True
+    if cursor.get('performed_at') and activity.get('performed_at'):
+        return string_to_datetime(activity['performed_at']) <= cursor['performed_at']
+    return False
+
+
+def list_new_activities(sdk, w_id, cursor):
+    """List the activities of a workspace that are newer than the cursor, newest first."""
+    def list_page(page_offset, page_limit):
+        return sdk.list_workspace_activities(
+            w_id=w_id,
+            offset=page_offset,
+            limit=page_limit
+        ).get_result()
+
+    activities = []
+    for page in pagination.iter_offset_pages(list_page, 'actions', limit=ACTIVITIES_PAGE_SIZE):
+        for activity in page.get('actions') or []:
+            if cursor and is_reached(activity, cursor):
+                return activities
+            activities.append(activity)
+    return activities
+
+
+def read_cursors(path):
+    """Read the cursors of the workspaces from the state file, if it exists."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as state_file:
+        return json.load(state_file)
+
+
+def write_cursors(module, path, cursors):
+    """Replace the state file with the cursors of the workspaces."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    with os.fdopen(fd, 'w') as state_file:
+        json.dump(cursors, state_file, sort_keys=True)
+    module.atomic_move(tmp, path)
+
+
 def run_module():
     module_args = dict(
         w_id=dict(
@@ -72,25 +158,77 @@ def run_module():
         activity_id=dict(
             type='str',
             required=False),
+        since=dict(
+            type='str',
+            required=False),
+        state_file=dict(
+            type='path',
+            required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=[
+            ('activity_id', 'since'),
+            ('activity_id', 'state_file'),
+        ],
+        required_by={
+            'since': 'w_id',
+            'state_file': 'w_id',
+        },
         supports_check_mode=False
     )
 
     w_id = module.params["w_id"]
     activity_id = module.params["activity_id"]
+    since = module.params["since"]
+    state_file = module.params["state_file"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
+    if since is not None or state_file is not None:
+        try:
+            cursors = read_cursors(state_file) if state_file else {}
+            if since is not None:
+                cursor = parse_cursor(since)
+            elif w_id in cursors:
+                cursor = {}
+                for saved in (cursors[w_id].get('activity_id'), cursors[w_id].get('performed_at')):
+                    if saved:
+                        cursor.update(parse_cursor(saved))
+            else:
+                cursor = None
+
+            activities = list_new_activities(sdk, w_id, cursor)
+            newest = cursors.get(w_id)
+            changed = False
+            if activities:
+                newest = {
+                    'activity_id': activities[0].get('action_id'),
+                    'performed_at': activities[0].get('performed_at'),
+                }
+                if state_file and cursors.get(w_id) != newest:
+                    cursors[w_id] = newest
+                    write_cursors(module, state_file, cursors)
+                    changed = True
+        except ApiException as ex:
+            module.fail_json(msg=ex.message)
+        except (IOError, OSError, ValueError) as ex:
+            module.fail_json(msg='Failed to use the state file %s: %s' % (state_file, ex))
+        module.exit_json(changed=changed, msg=projection.project_fields(dict(actions=activities, cursor=newest), fields))
+
     # list
     try:
         response = sdk.get_workspace_activity(
             w_id=w_id,
             activity_id=activity_id
         )
-        module.exit_json(msg=response.get_result())
+        module.exit_json(msg=projection.project_fields(response.get_result(), fields))
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -18,6 +18,8 @@ description:
   - This module retrieves one or more C(schematics_workspace) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+  - ibm.cloud.fields
 options:
   w_id:
     description:
@@ -51,6 +53,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -64,6 +67,10 @@ def run_module():
         w_id=dict(
             type='str',
             required=False),
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
     )
 
     module = AnsibleModule(
@@ -72,6 +79,7 @@ def run_module():
     )
 
     w_id = module.params["w_id"]
+    fields = module.params["fields"]
 
     sdk = config.get_schematicsv1_sdk()
 
@@ -81,7 +89,7 @@ def run_module():
             response = sdk.get_workspace(
                 w_id=w_id
             )
-            module.exit_json(msg=response.get_result())
+            module.exit_json(msg=projection.project_fields(response.get_result(), fields))
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -0,0 +1,202 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the argument spec of a module: its payload size and validation time.
+
+AnsiballZ ships the source of the module and of the collection module_utils
+that it imports, and the module is compiled again on every run. The report
+shows the size of that source, raw and compressed, the time to compile the
+module, and the time of `run_module()` up to the end of the `AnsibleModule`
+constructor, which builds the argument spec and validates a sample job
+against it. The caches of the module_utils are cleared before each run, like
+in the new process of a module run. With `--baseline`, the same module is also measured at a git
+revision, for example the one before a change of its argument spec.
+
+Usage:
+    python tests/benchmarks/argspec_validation.py [--runs N] [--baseline REV] [--json] [module ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+import types
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from module_startup import COLLECTION_ROOT, collections_path  # noqa: E402
+
+
+MODULES_PACKAGE = 'ansible_collections.ibm.cloud.plugins.modules'
+MODULE_UTILS_PACKAGE = 'ansible_collections.ibm.cloud.plugins.module_utils.'
+MODULE_UTILS_IMPORT = re.compile(r'^\s*from \.\.module_utils(?:\.(\w+))? import (\w+)', re.MULTILINE)
+
+VARIABLE = {
+    'name': 'instance_count',
+    'value': '3',
+    'metadata': {'type': 'integer', 'description': 'The number of instances', 'min_value': 1, 'max_value': 10},
+}
+
+SAMPLE_ARGS = {
+    'ibm_schematics_job': {
+        'command_object': 'workspace',
+        'command_object_id': 'us-south.workspace.bench.0123abcd',
+        'command_name': 'workspace_apply',
+        'location': 'us-south',
+        'settings': [VARIABLE],
+        'inputs': [VARIABLE, dict(VARIABLE, name='zone', value='us-south-1', metadata={'type': 'string'})],
+        'bastion': {'name': 'bastion', 'host': '10.0.0.1'},
+        'data': {
+            'job_type': 'workspace_job',
+            'workspace_job_data': {'workspace_name': 'bench', 'inputs': [VARIABLE], 'settings': [VARIABLE]},
+        },
+        'state': 'present',
+    },
+    'ibm_schematics_action': {
+        'name': 'bench-action',
+        'location': 'us-south',
+        'source': {'source_type': 'git_hub', 'git': {'git_repo_url': 'https://github.com/example/playbooks'}},
+        'inputs': [VARIABLE],
+        'credentials': [{'name': 'ssh_key', 'value': 'key', 'metadata': {'type': 'string'}}],
+        'bastion': {'name': 'bastion', 'host': '10.0.0.1'},
+        'state': 'present',
+    },
+    'ibm_schematics_workspace': {
+        'name': 'bench-workspace',
+        'location': 'us-south',
+        'template_repo': {'url': 'https://github.com/example/templates'},
+        'workspace_status': {'frozen': False, 'locked': False},
+        'state': 'present',
+    },
+}
+
+
+class Validated(Exception):
+    """Raised once the arguments are validated, to stop the module."""
+
+
+def read_source(path: str, revision: str = None) -> str:
+    """Read a file of the collection, at a git revision or in the working tree."""
+    if revision is None:
+        with open(os.path.join(COLLECTION_ROOT, path)) as source:
+            return source.read()
+    return subprocess.check_output(['git', 'show', '%s:%s' % (revision, path)], cwd=COLLECTION_ROOT).decode()
+
+
+def payload_sources(module: str, revision: str = None) -> dict:
+    """Return the sources of a module and of the collection module_utils that it imports."""
+    sources = {}
+    pending = ['plugins/modules/%s.py' % module]
+    while pending:
+        path = pending.pop()
+        if path in sources:
+            continue
+        sources[path] = read_source(path, revision)
+        for match in MODULE_UTILS_IMPORT.finditer(sources[path]):
+            pending.append('plugins/module_utils/%s.py' % (match.group(1) or match.group(2)))
+    return sources
+
+
+def load_module(module: str, source: str) -> types.ModuleType:
+    """Execute a module source in the collection package, under a private name."""
+    loaded = types.ModuleType('%s._bench_%s' % (MODULES_PACKAGE, module))
+    loaded.__package__ = MODULES_PACKAGE
+    exec(compile(source, module + '.py', 'exec'), loaded.__dict__)
+    return loaded
+
+
+def clear_caches() -> None:
+    """Clear the caches of the collection module_utils, as in a new module process."""
+    for name, utils in list(sys.modules.items()):
+        if name.startswith(MODULE_UTILS_PACKAGE):
+            for value in list(vars(utils).values()):
+                if callable(getattr(value, 'cache_clear', None)):
+                    value.cache_clear()
+
+
+def validation_time(loaded: types.ModuleType, args: dict) -> float:
+    """Run `run_module()` of a loaded module until its arguments are validated."""
+    from ansible.module_utils import basic
+
+    def validate(*pargs, **kwargs):
+        basic.AnsibleModule(*pargs, **kwargs)
+        raise Validated()
+
+    loaded.AnsibleModule = validate
+    basic._ANSIBLE_ARGS = json.dumps({'ANSIBLE_MODULE_ARGS': args}).encode()
+    # Newer ansible-core releases also need the serialization profile of the arguments.
+    basic._ANSIBLE_PROFILE = 'legacy'
+    clear_caches()
+    start = time.perf_counter()
+    try:
+        loaded.run_module()
+    except Validated:
+        return time.perf_counter() - start
+    raise RuntimeError('%s returned before validating its arguments' % loaded.__name__)
+
+
+def measure(module: str, runs: int, revision: str = None) -> dict:
+    sources = payload_sources(module, revision)
+    source = sources['plugins/modules/%s.py' % module]
+    payload = ''.join(sources.values()).encode()
+
+    compile_times, validation_times = [], []
+    for dummy in range(runs):
+        start = time.perf_counter()
+        compile(source, module + '.py', 'exec')
+        compile_times.append(time.perf_counter() - start)
+        validation_times.append(validation_time(load_module(module, source), SAMPLE_ARGS[module]))
+
+    return {
+        'module': module,
+        'revision': revision or 'working tree',
+        'module_bytes': len(source.encode()),
+        'payload_bytes': len(payload),
+        'payload_compressed_bytes': len(zlib.compress(payload)),
+        'compile_median_ms': round(statistics.median(compile_times) * 1000, 2),
+        'validation_median_ms': round(statistics.median(validation_times) * 1000, 2),
+        'validation_min_ms': round(min(validation_times) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', help='modules to measure, all by default: ' + ', '.join(sorted(SAMPLE_ARGS)))
+    parser.add_argument('--runs', type=int, default=200, help='validations per module')
+    parser.add_argument('--baseline', metavar='REV', help='also measure the modules at this git revision')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+    unknown = set(args.modules) - set(SAMPLE_ARGS)
+    if unknown:
+        parser.error('unknown modules: ' + ', '.join(sorted(unknown)))
+
+    os.environ.update(IC_API_KEY='benchmarkAPIKey', IC_CACHE='false')
+    sys.path.insert(0, collections_path())
+
+    results = []
+    for module in args.modules or sorted(SAMPLE_ARGS):
+        if args.baseline:
+            results.append(measure(module, args.runs, args.baseline))
+        results.append(measure(module, args.runs))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print('%-26s %-14s %10s %13s %12s %13s %16s' % (
+        'module', 'revision', 'module (B)', 'payload (B)', 'zipped (B)', 'compile (ms)', 'validation (ms)'))
+    for result in results:
+        print('%-26s %-14s %10s %13s %12s %13s %16s' % (
+            result['module'], result['revision'][:14], result['module_bytes'], result['payload_bytes'],
+            result['payload_compressed_bytes'], result['compile_median_ms'], result['validation_median_ms']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Count the SDK clients and authenticators that a module run builds.
+
+Every path runs a module's `main()` in this process against a fake service
+that answers all the requests, so nothing leaves the host. The SDK client and
+authenticator constructors are counted, once with the clients shared by the
+`config` factories and once with a new client for every factory call, which
+is how the modules behaved before the factories were memoized. A helper that
+builds its own client instead of using the `config` factories shows up as a
+regression in the first column.
+
+Usage:
+    python tests/benchmarks/client_constructions.py [--json] [path ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from module_startup import collections_path  # noqa: E402
+
+
+INSTANCE_CRN = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:%s::'
+
+PATHS = {
+    'resource_instance_create': ('ibm_resource_instance', {
+        'name': 'bench-instance',
+        'service': 'cloud-object-storage',
+        'plan': 'standard',
+        'location': 'global',
+        'resource_group': 'bench-group',
+    }),
+    'resource_instances_create': ('ibm_resource_instances', {
+        'service': 'cloud-object-storage',
+        'plan': 'standard',
+        'location': 'global',
+        'resource_group': 'bench-group',
+        'instances': [{'name': 'bench-instance-%d' % index} for index in range(10)],
+    }),
+    'resource_keys_create': ('ibm_resource_keys', {
+        'keys': [{'name': 'bench-key', 'source': 'instance-%d' % index} for index in range(10)],
+    }),
+}
+
+
+def respond(request):
+    """Answer a request like the services would, with the smallest valid result."""
+    method, url, params = request['method'], request['url'], request.get('params') or {}
+    if 'globalcatalog' in url:
+        if 'q' in params:
+            return {'resources': [{'id': 'service-id'}]}
+        return {'id': 'service-id', 'children': [{'id': 'plan-id', 'name': 'standard', 'children': [
+            {'catalog_crn': 'catalog-crn', 'metadata': {'deployment': {'location': 'global'}}}]}]}
+    if method == 'GET':
+        return {'resources': [], 'next_url': None}
+    body = json.loads(request.get('data') or '{}')
+    name = body.get('name', 'created')
+    return {'id': INSTANCE_CRN % name, 'guid': name, 'name': name, 'state': 'active'}
+
+
+class Counter:
+    """Wrap a constructor to count its calls."""
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.count = 0
+        self.original = cls.__init__
+
+    def __enter__(self):
+        counter = self
+
+        def counted(instance, *args, **kwargs):
+            counter.count += 1
+            counter.original(instance, *args, **kwargs)
+
+        self.cls.__init__ = counted
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cls.__init__ = self.original
+
+
+class Unshared(dict):
+    """A client registry that never keeps a client."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def run_path(name, shared):
+    from ansible.module_utils import basic
+    from ansible_collections.ibm.cloud.plugins.module_utils import config
+    from ibm_cloud_sdk_core import BaseService, DetailedResponse
+    from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+
+    module_name, args = PATHS[name]
+    module = importlib.import_module('ansible_collections.ibm.cloud.plugins.modules.' + module_name)
+
+    config.clear_clients()
+    registry = config._clients
+    if not shared:
+        config._clients = Unshared()
+
+    requests = []
+
+    def send(service, request, **kwargs):
+        requests.append(request['url'])
+        return DetailedResponse(response=respond(request), headers={}, status_code=200)
+
+    original_send, original_authenticate = BaseService.send, IAMAuthenticator.authenticate
+    BaseService.send = send
+    IAMAuthenticator.authenticate = lambda authenticator, request: None
+    basic._ANSIBLE_ARGS = json.dumps({'ANSIBLE_MODULE_ARGS': args}).encode()
+    # Newer ansible-core releases also need the serialization profile of the arguments.
+    basic._ANSIBLE_PROFILE = 'legacy'
+    try:
+        with Counter(BaseService) as clients, Counter(IAMAuthenticator) as authenticators:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                try:
+                    module.main()
+                except SystemExit:
+                    pass
+    finally:
+        BaseService.send, IAMAuthenticator.authenticate = original_send, original_authenticate
+        config._clients = registry
+        config.clear_clients()
+
+    result = json.loads(output.getvalue())
+    if result.get('failed'):
+        raise RuntimeError('%s failed: %s' % (name, result.get('msg')))
+    return {'clients': clients.count, 'authenticators': authenticators.count, 'requests': len(requests)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='*', help='module paths to measure, all by default: ' + ', '.join(sorted(PATHS)))
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+    unknown = set(args.paths) - set(PATHS)
+    if unknown:
+        parser.error('unknown paths: ' + ', '.join(sorted(unknown)))
+
+    os.environ.update(IC_API_KEY='benchmarkAPIKey', IC_CACHE='false')
+    sys.path.insert(0, collections_path())
+
+    results = []
+    for name in args.paths or sorted(PATHS):
+        shared, unshared = run_path(name, True), run_path(name, False)
+        results.append({
+            'path': name,
+            'requests': shared['requests'],
+            'clients': shared['clients'],
+            'authenticators': shared['authenticators'],
+            'unshared_clients': unshared['clients'],
+            'unshared_authenticators': unshared['authenticators'],
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print('%-28s %9s %9s %15s %17s %15s' % (
+        'path', 'requests', 'clients', 'authenticators', 'unshared clients', 'unshared auths'))
+    for result in results:
+        print('%-28s %9s %9s %15s %17s %15s' % (
+            result['path'], result['requests'], result['clients'], result['authenticators'],
+            result['unshared_clients'], result['unshared_authenticators']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# (C) Copyright IBM Corp. 2022.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure the cold start of the modules, one representative module per service.
+
+Every run starts a fresh interpreter and imports the module through its
+collection name, which is what the AnsiballZ wrapper does before calling
+`main()`. The report shows the wall time of the whole process, the import time
+of the module and the SDK packages that got loaded, so a module that suddenly
+pulls in another service SDK shows up as a regression.
+
+Usage:
+    python tests/benchmarks/module_startup.py [--runs N] [--json] [module ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+COLLECTION_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+SERVICE_MODULES = {
+    'catalog_management': 'ibm_cm_catalog',
+    'iam_access_groups': 'ibm_iam_access_groups_info',
+    'iam_identity': 'ibm_iam_service_id_info',
+    'resource_controller': 'ibm_resource_key_info',
+    'resource_manager': 'ibm_resource_group_info',
+    'schematics': 'ibm_schematics_job_info',
+}
+
+SDK_PACKAGES = ['ibm_cloud_sdk_core', 'ibm_platform_services', 'ibm_schematics']
+
+PROBE = '''
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module('ansible_collections.ibm.cloud.plugins.modules.' + sys.argv[1])
+import_time = time.perf_counter() - start
+print(json.dumps({
+    'import_time': import_time,
+    'sdk_packages': [name for name in %r if name in sys.modules],
+}))
+''' % (SDK_PACKAGES,)
+
+
+def collections_path() -> str:
+    """Return a collections path that resolves `ibm.cloud` to this checkout."""
+    parts = COLLECTION_ROOT.split(os.sep)
+    if parts[-3:-2] == ['ansible_collections']:
+        return os.sep.join(parts[:-3])
+
+    path = tempfile.mkdtemp(prefix='ibm_cloud_bench')
+    os.makedirs(os.path.join(path, 'ansible_collections', 'ibm'))
+    os.symlink(COLLECTION_ROOT, os.path.join(path, 'ansible_collections', 'ibm', 'cloud'))
+    return path
+
+
+def measure(module: str, runs: int, env: dict) -> dict:
+    """Start `module` in `runs` fresh interpreters and collect the timings."""
+    wall_times, import_times, sdk_packages = [], [], []
+    for dummy in range(runs):
+        start = time.perf_counter()
+        output = subprocess.check_output([sys.executable, '-c', PROBE, module], env=env)
+        wall_times.append(time.perf_counter() - start)
+        probe = json.loads(output)
+        import_times.append(probe['import_time'])
+        sdk_packages = probe['sdk_packages']
+
+    return {
+        'module': module,
+        'wall_median_ms': round(statistics.median(wall_times) * 1000, 1),
+        'wall_min_ms': round(min(wall_times) * 1000, 1),
+        'import_median_ms': round(statistics.median(import_times) * 1000, 1),
+        'import_min_ms': round(min(import_times) * 1000, 1),
+        'sdk_packages': sdk_packages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', help='modules to measure, one per service by default')
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters per module')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=collections_path(), PYTHONDONTWRITEBYTECODE='')
+    modules = args.modules or list(SERVICE_MODULES.values())
+    results = [measure(module, args.runs, env) for module in modules]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print('%-32s %12s %12s %12s  %s' % ('module', 'wall (ms)', 'import (ms)', 'import min', 'SDK packages'))
+    for result in results:
+        print('%-32s %12s %12s %12s  %s' % (
+            result['module'], result['wall_median_ms'], result['import_median_ms'],
+            result['import_min_ms'], ', '.join(result['sdk_packages'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the IAM tokens, catalog lookups and rate limits cached by each test out of the user's cache."""
+    monkeypatch.setenv('IC_CACHE_DIR', str(tmp_path / 'ibm_cloud'))
@@ -0,0 +1,100 @@
+# (C) Copyright IBM Corp. 2022.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import jwt
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+
+from plugins.module_utils import auth
+
+
+def token_response(issued_at: int, lifetime: int = 3600) -> dict:
+    """Returns a token response with an unsigned JWT access token."""
+    access_token = jwt.encode({'iat': issued_at, 'exp': issued_at + lifetime}, 'secret', algorithm='HS256')
+    return {
+        'access_token': access_token,
+        'refresh_token': 'testRefreshToken',
+        'token_type': 'Bearer',
+        'expires_in': lifetime,
+        'expiration': issued_at + lifetime,
+    }
+
+
+class TestCachedIAMTokenManager(unittest.TestCase):
+    """
+    Test class for the cross-process IAM token cache.
+    """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        patcher = patch('plugins.module_utils.auth.IAMTokenManager.request_token')
+        self.request_token_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_is_shared_between_managers(self):
+        """Test that a second manager reuses the token requested by the first one."""
+        self.request_token_mock.return_value = token_response(int(time.time()))
+
+        first = auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir)
+        second = auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir)
+
+        assert first.get_token() == second.get_token()
+        self.request_token_mock.assert_called_once()
+
+    def test_refresh_token_is_not_cached(self):
+        """Test that the refresh token is not written to disk."""
+        self.request_token_mock.return_value = token_response(int(time.time()))
+
+        manager = auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir)
+        manager.get_token()
+
+        with open(manager.cache_path, 'r') as cache_file:
+            assert 'testRefreshToken' not in cache_file.read()
+
+    def test_token_is_refreshed_early(self):
+        """Test that a cached token inside the refresh window is not reused."""
+        now = int(time.time())
+        # 85% of the lifetime has passed, so the token must be refreshed.
+        self.request_token_mock.side_effect = [
+            token_response(now - 3060),
+            token_response(now),
+        ]
+
+        first = auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir)
+        first.get_token()
+        second = auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir)
+        second.get_token()
+
+        assert self.request_token_mock.call_count == 2
+
+    def test_cache_is_keyed_by_apikey_and_url(self):
+        """Test that different API keys and IAM endpoints don't share tokens."""
+        self.request_token_mock.return_value = token_response(int(time.time()))
+
+        managers = [
+            auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir),
+            auth.CachedIAMTokenManager('otherApiKey', cache_dir=self.cache_dir),
+            auth.CachedIAMTokenManager('testApiKey', cache_dir=self.cache_dir, url='https://iam.test.cloud.ibm.com'),
+        ]
+        for manager in managers:
+            manager.get_token()
+
+        assert len({manager.cache_path for manager in managers}) == 3
+        assert self.request_token_mock.call_count == 3
+
+    def test_cache_can_be_disabled(self):
+        """Test that `IC_CACHE=false` falls back to the plain IAM token manager."""
+        os.environ['IC_CACHE'] = 'false'
+        try:
+            authenticator = auth.get_iam_authenticator('testApiKey')
+        finally:
+            del os.environ['IC_CACHE']
+
+        assert not isinstance(authenticator.token_manager, auth.CachedIAMTokenManager)
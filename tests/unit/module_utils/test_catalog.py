@@ -0,0 +1,152 @@
+# (C) Copyright IBM Corp. 2022.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+
+from plugins.module_utils import catalog
+from ..modules.common import DetailedResponseMock
+
+
+SERVICE = {'id': 'testServiceId', 'name': 'cloud-object-storage'}
+SERVICE_TREE = {
+    'id': 'testServiceId',
+    'name': 'cloud-object-storage',
+    'children': [
+        {'id': 'testLitePlanId', 'name': 'lite', 'children': [
+            {'catalog_crn': 'testLiteCRN', 'metadata': {'deployment': {'location': 'global'}}},
+        ]},
+        {'id': 'testStandardPlanId', 'name': 'standard', 'children': [
+            {'catalog_crn': 'testEuDeCRN', 'metadata': {'deployment': {'location': 'eu-de'}}},
+            {'catalog_crn': 'testUsSouthCRN', 'metadata': {'deployment': {'location': 'us-south'}}},
+        ]},
+    ],
+}
+
+
+class TestCatalogResolutionCache(unittest.TestCase):
+    """
+    Test class for the on-disk cache of the Global Catalog lookups.
+    """
+
+    def setUp(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        env_patcher = patch.dict(os.environ, {'IC_CACHE_DIR': cache_dir, 'IC_API_KEY': 'noAuthAPIKey'})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+        patcher = patch('plugins.module_utils.catalog.config.get_global_catalog_sdk')
+        self.sdk = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        self.sdk.list_catalog_entries.return_value = DetailedResponseMock({'resources': [SERVICE]})
+        self.sdk.get_catalog_entry.return_value = DetailedResponseMock(SERVICE_TREE)
+
+    def test_resolution_is_cached(self):
+        """Test that repeated resolutions only hit the catalog once."""
+        for dummy in range(3):
+            result = catalog.get_serviceID_targetCRN_planID('cloud-object-storage', 'standard', 'us-south')
+            assert result == ('testServiceId', 'testUsSouthCRN', 'testStandardPlanId')
+
+        self.sdk.list_catalog_entries.assert_called_once()
+        self.sdk.get_catalog_entry.assert_called_once_with(id='testServiceId', complete=True, depth=2)
+
+    def test_index_resolves_every_plan_and_location(self):
+        """Test that one index answers the lookups of all plans and locations."""
+        assert catalog.get_serviceID_targetCRN_planID('cloud-object-storage', 'standard', 'eu-de') == \
+            ('testServiceId', 'testEuDeCRN', 'testStandardPlanId')
+        assert catalog.get_serviceID_targetCRN_planID('cloud-object-storage', 'lite', 'global') == \
+            ('testServiceId', 'testLiteCRN', 'testLitePlanId')
+        assert catalog.get_planID('cloud-object-storage', 'standard') == ('testServiceId', 'testStandardPlanId')
+
+        self.sdk.list_catalog_entries.assert_called_once()
+        self.sdk.get_catalog_entry.assert_called_once()
+
+    def test_deployments_without_metadata(self):
+        """Test that the deployments with a null metadata or deployment are skipped."""
+        tree = dict(SERVICE_TREE, children=[
+            {'id': 'testLitePlanId', 'name': 'lite', 'children': [
+                {'catalog_crn': 'testNullCRN', 'metadata': None},
+                {'catalog_crn': 'testNullDeploymentCRN', 'metadata': {'deployment': None}},
+                {'catalog_crn': 'testLiteCRN', 'metadata': {'deployment': {'location': 'global'}}},
+            ]},
+        ])
+        self.sdk.get_catalog_entry.return_value = DetailedResponseMock(tree)
+
+        assert catalog.get_service_index('cloud-object-storage')['plans']['lite']['locations'] == {'global': 'testLiteCRN'}
+
+    def test_prewarm(self):
+        """Test that prewarmed services are resolved without catalog requests."""
+        result = catalog.prewarm(['cloud-object-storage'])
+
+        assert result['cloud-object-storage']['plans']['standard']['locations'] == {
+            'eu-de': 'testEuDeCRN',
+            'us-south': 'testUsSouthCRN',
+        }
+
+        catalog.get_serviceID_targetCRN_planID('cloud-object-storage', 'standard', 'us-south')
+        self.sdk.get_catalog_entry.assert_called_once()
+
+    def test_zero_ttl_disables_the_cache(self):
+        """Test that a zero TTL disables the cache."""
+        with patch.dict(os.environ, {'IC_CATALOG_CACHE_TTL': '0'}):
+            catalog.get_serviceID('cloud-object-storage')
+            catalog.get_serviceID('cloud-object-storage')
+
+        assert self.sdk.list_catalog_entries.call_count == 2
+
+    def test_unknown_plan_refreshes_the_index(self):
+        """Test that a cached index missing the plan is fetched again before failing."""
+        catalog.get_planID('cloud-object-storage', 'standard')
+
+        with self.assertRaises(ValueError):
+            catalog.get_planID('cloud-object-storage', 'unknown')
+
+        assert self.sdk.get_catalog_entry.call_count == 2
+
+    def test_failed_resolutions_are_not_cached(self):
+        """Test that a not found service is looked up on every call."""
+        self.sdk.list_catalog_entries.return_value = DetailedResponseMock({'resources': []})
+
+        for dummy in range(2):
+            with self.assertRaises(ValueError):
+                catalog.get_serviceID('unknown')
+
+        assert self.sdk.list_catalog_entries.call_count == 2
+
+    def test_invalidate_cache(self):
+        """Test the explicit invalidation, per service and as a whole."""
+        catalog.get_service_index('cloud-object-storage')
+        catalog.get_serviceID('databases-for-postgresql')
+
+        # Both the service ID and the index of cloud-object-storage are removed.
+        assert catalog.invalidate_cache('cloud-object-storage') == 2
+        catalog.get_serviceID('cloud-object-storage')
+        catalog.get_serviceID('databases-for-postgresql')
+        assert self.sdk.list_catalog_entries.call_count == 3
+
+        assert catalog.invalidate_cache() == 2
+        catalog.get_serviceID('databases-for-postgresql')
+        assert self.sdk.list_catalog_entries.call_count == 4
+
+    def test_invalidate_cache_lock_files(self):
+        """Test that the invalidation also removes the lock files of the entries."""
+        catalog.get_serviceID('cloud-object-storage')
+        catalog.get_serviceID('databases-for-postgresql')
+        cache_dir = catalog.cache.get_cache_dir(catalog.CATALOG_CACHE_NAME)
+        assert len(os.listdir(cache_dir)) == 4
+
+        catalog.invalidate_cache('cloud-object-storage')
+        assert len(os.listdir(cache_dir)) == 2
+
+        # A lock file left without its entry is removed with all the entries.
+        open(os.path.join(cache_dir, 'orphan.json.lock'), 'w').close()
+        catalog.invalidate_cache()
+        assert os.listdir(cache_dir) == []
@@ -0,0 +1,79 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+import unittest
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+
+from plugins.module_utils import config
+
+
+class TestMemoizedClients(unittest.TestCase):
+    """
+    Test class for the per-process SDK clients.
+    """
+
+    def setUp(self):
+        config.clear_clients()
+        self.addCleanup(config.clear_clients)
+        patcher = patch.dict(os.environ, {'IC_API_KEY': 'firstAPIKey'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clients_are_shared(self):
+        client = config.get_global_catalog_sdk()
+
+        assert config.get_global_catalog_sdk() is client
+        assert config.get_resource_contollerV2_sdk() is not client
+
+    def test_clients_share_the_authenticator(self):
+        catalog = config.get_global_catalog_sdk()
+        controller = config.get_resource_contollerV2_sdk()
+
+        assert catalog.authenticator is controller.authenticator
+
+    def test_clients_are_keyed_by_api_key(self):
+        client = config.get_global_catalog_sdk()
+        os.environ['IC_API_KEY'] = 'secondAPIKey'
+
+        other = config.get_global_catalog_sdk()
+
+        assert other is not client
+        assert other.authenticator is not client.authenticator
+
+    def test_clear_clients(self):
+        client = config.get_global_catalog_sdk()
+        config.clear_clients()
+
+        assert config.get_global_catalog_sdk() is not client
+
+    def test_missing_api_key_is_not_cached(self):
+        del os.environ['IC_API_KEY']
+
+        with self.assertRaises(ValueError):
+            config.get_global_catalog_sdk()
+
+        os.environ['IC_API_KEY'] = 'firstAPIKey'
+        assert config.get_global_catalog_sdk() is not None
+
+    def test_client_from_environment(self):
+        with patch.dict(os.environ, {'RESOURCE_MANAGER_AUTH_TYPE': 'noAuth', 'RESOURCE_MANAGER_URL': 'https://first.fake'}):
+            client = config.get_resource_manager_sdk_from_environment()
+
+            assert config.get_resource_manager_sdk_from_environment() is client
+            assert client.service_url == 'https://first.fake'
+            # Configured by sessions.configure_service, which also limits the rate of its calls.
+            assert 'send' in vars(client)
+
+            os.environ['RESOURCE_MANAGER_URL'] = 'https://second.fake'
+            assert config.get_resource_manager_sdk_from_environment().service_url == 'https://second.fake'
+
+    def test_client_from_environment_without_authenticator(self):
+        del os.environ['IC_API_KEY']
+        # The module tests leave their authentication type in the environment.
+        os.environ.pop('RESOURCE_MANAGER_AUTH_TYPE', None)
+
+        with self.assertRaises(ValueError):
+            config.get_resource_manager_sdk_from_environment()
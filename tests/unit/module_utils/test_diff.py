@@ -0,0 +1,64 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import unittest
+
+from plugins.module_utils import diff
+
+
+ACTUAL = {
+    'id': 'testString',
+    'crn': 'crn:v1:testString',
+    'etag': 'W/"1-2"',
+    'created_at': '2023-01-01T00:00:00Z',
+    'name': 'testString',
+    'tags': ['a', 'b'],
+    'parameters': {'plan': 'lite', 'size': 10, 'options': {'tls': True}},
+    'conditions': [{'claim': 'group', 'operator': 'EQUALS', 'value': 'admins', 'weight': 1}],
+}
+
+
+class TestGetPatch(unittest.TestCase):
+    """
+    Test class for the desired-vs-actual diff of resources.
+    """
+
+    def test_unchanged(self):
+        """No patch when all given fields match, regardless of unset and server fields."""
+        desired = {
+            'id': 'otherString',
+            'name': 'testString',
+            'description': None,
+            'tags': ['b', 'a'],
+            'parameters': {'size': 10},
+            'conditions': [{'claim': 'group', 'operator': 'EQUALS', 'value': 'admins'}],
+        }
+
+        assert diff.get_patch(desired, ACTUAL) == {}
+
+    def test_changed_fields(self):
+        """Only the differing fields are in the patch, nested dicts only with their differing keys."""
+        desired = {
+            'name': 'newString',
+            'tags': ['a'],
+            'parameters': {'size': 20, 'options': {'tls': True}},
+            'description': 'testString',
+        }
+
+        assert diff.get_patch(desired, ACTUAL) == {
+            'name': 'newString',
+            'tags': ['a'],
+            'parameters': {'size': 20},
+            'description': 'testString',
+        }
+
+    def test_changed_list_of_dicts(self):
+        """A list of dicts is replaced as a whole when an item differs."""
+        conditions = [{'claim': 'group', 'operator': 'EQUALS', 'value': 'managers'}]
+
+        assert diff.get_patch({'conditions': conditions}, ACTUAL) == {'conditions': conditions}
+
+    def test_missing_resource(self):
+        """Every given field is in the patch of a resource that wasn't read."""
+        assert diff.get_patch({'name': 'testString', 'description': None}, None) == {'name': 'testString'}
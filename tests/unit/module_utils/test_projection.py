@@ -0,0 +1,53 @@
+# (C) Copyright IBM Corp. 2022.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import unittest
+
+from plugins.module_utils import projection
+
+
+RESULT = {
+    'rows_count': 2,
+    'resources': [
+        {'id': 'id1', 'name': 'first', 'extensions': {'endpoints': {'public': 'a'}}},
+        {'id': 'id2', 'name': 'second', 'extensions': {'endpoints': {'public': 'b'}}},
+    ],
+}
+
+
+class TestProjectFields(unittest.TestCase):
+    """
+    Test class for the fields projection of info results.
+    """
+
+    def test_no_fields(self):
+        """The whole result is returned without fields."""
+        assert projection.project_fields(RESULT, None) is RESULT
+        assert projection.project_fields(RESULT, []) is RESULT
+
+    def test_top_level_fields(self):
+        """Top level fields keep their whole value."""
+        assert projection.project_fields(RESULT, ['rows_count']) == {'rows_count': 2}
+
+    def test_list_items(self):
+        """A path through a list is applied to every item."""
+        result = projection.project_fields(RESULT, ['resources.id', 'resources.extensions.endpoints.public'])
+
+        assert result == {
+            'resources': [
+                {'id': 'id1', 'extensions': {'endpoints': {'public': 'a'}}},
+                {'id': 'id2', 'extensions': {'endpoints': {'public': 'b'}}},
+            ],
+        }
+
+    def test_missing_keys(self):
+        """Missing keys and paths below scalars are ignored."""
+        result = projection.project_fields(RESULT, ['missing', 'rows_count.value', 'resources.missing'])
+
+        assert result == {'rows_count': 2, 'resources': [{}, {}]}
+
+    def test_parent_and_child_fields(self):
+        """A parent path keeps its whole value, also when one of its children is selected."""
+        for fields in (['resources', 'resources.id'], ['resources.id', 'resources']):
+            assert projection.project_fields(RESULT, fields) == {'resources': RESULT['resources']}
@@ -0,0 +1,199 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from plugins.module_utils import ratelimit
+from plugins.module_utils.ratelimit import SharedTokenBucket, TokenBucket
+
+
+class FakeClock:
+    """A clock that only moves when sleep is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert clock.sleeps == []
+
+
+def test_token_bucket_waits_for_tokens():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=1, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 0.5
+    assert clock.now == 1.0
+
+
+def test_token_bucket_refills_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(1, burst=2, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() == 1.0
+
+
+def test_token_bucket_without_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(None, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(100)] == [0] * 100
+    assert clock.sleeps == []
+
+
+def too_many_requests(retry_after=None):
+    response = requests.Response()
+    response.status_code = 429
+    response._content = b'{"message": "Too many requests"}'
+    response.headers['Content-Type'] = 'application/json'
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return ApiException(429, http_response=response)
+
+
+class FakeService:
+    """An SDK client that answers the queued results or exceptions."""
+
+    DEFAULT_SERVICE_NAME = 'fake_service'
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+class TestSharedTokenBucket(unittest.TestCase):
+    """
+    Test class for the rate limits that the module processes share.
+    """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        patcher = patch.dict(os.environ, {'IC_CACHE_DIR': self.cache_dir, 'IC_CACHE': 'true'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(ratelimit._limiters.clear)
+        self.clock = FakeClock()
+
+    def bucket(self, rate=None, burst=1):
+        return SharedTokenBucket('fake_service', rate, burst=burst, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_budget_is_shared(self):
+        """Test that the buckets of two processes take their tokens from the same budget."""
+        first, second = self.bucket(2), self.bucket(2)
+
+        assert first.acquire() == 0
+        assert second.acquire() == 0.5
+        assert first.acquire() == 0.5
+        assert self.clock.now == 1.0
+
+    def test_throttle_blocks_all_buckets(self):
+        """Test that a 429 seen by one process makes the others wait, even without a budget."""
+        first, second = self.bucket(), self.bucket()
+
+        first.throttle(5)
+
+        assert second.acquire() == 5
+        assert second.acquire() == 0
+
+    def test_throttle_slows_down_and_recovers(self):
+        """Test that the rate is cut in half on a 429 and recovers to the budget."""
+        bucket = self.bucket(10, burst=10)
+
+        bucket.throttle(0)
+        assert bucket.acquire() == 0.2
+        assert ratelimit.cache.read_json(bucket.path)['rate'] < 10
+
+        self.clock.now += ratelimit.RECOVERY_TIME
+        bucket.acquire()
+        assert ratelimit.cache.read_json(bucket.path)['rate'] == 10
+
+    def test_without_cache(self):
+        """Test that the bucket is kept in the process when the cache is disabled."""
+        with patch.dict(os.environ, {'IC_CACHE': 'false'}):
+            bucket = self.bucket(2)
+
+        assert bucket.path is None
+        assert [bucket.acquire() for _ in range(3)] == [0, 0.5, 0.5]
+        assert os.listdir(self.cache_dir) == []
+
+    def test_get_rate_limits(self):
+        with patch.dict(os.environ, {'IC_RATE_LIMITS': 'resource_controller=20, iam_access_groups=2.5,broken,zero=0'}):
+            assert ratelimit.get_rate_limits() == {'resource_controller': 20, 'iam_access_groups': 2.5}
+
+    def test_get_retry_after(self):
+        assert ratelimit.get_retry_after(too_many_requests('7').http_response) == 7
+        assert ratelimit.get_retry_after(too_many_requests('Wed, 21 Oct 2015 07:28:00 GMT').http_response) == 0
+        assert ratelimit.get_retry_after(too_many_requests('100000').http_response) == ratelimit.MAX_RETRY_AFTER
+        assert ratelimit.get_retry_after(too_many_requests('soon').http_response) is None
+        assert ratelimit.get_retry_after(too_many_requests().http_response) is None
+
+    def test_idempotent_calls_are_retried(self):
+        """Test that a GET is retried after a 429, and that the other processes are throttled."""
+        result = DetailedResponse(response={}, status_code=200)
+        service = ratelimit.limit_service(FakeService(too_many_requests('0'), too_many_requests('0'), result))
+
+        assert service.send({'method': 'GET', 'url': 'https://fake'}) is result
+        assert len(service.requests) == 3
+        assert 'blocked_until' in ratelimit.cache.read_json(ratelimit.get_limiter('fake_service').path)
+
+    def test_other_calls_are_not_retried(self):
+        service = ratelimit.limit_service(FakeService(too_many_requests('0')))
+
+        with self.assertRaises(ApiException):
+            service.send({'method': 'POST', 'url': 'https://fake'})
+        assert len(service.requests) == 1
+
+    def test_streamed_calls_are_not_retried(self):
+        """Test that a PUT is not retried after a 429 when its body was a stream."""
+        service = ratelimit.limit_service(FakeService(too_many_requests('0')))
+
+        with self.assertRaises(ApiException):
+            service.send({'method': 'PUT', 'url': 'https://fake', 'data': io.BytesIO(b'{}')})
+        assert len(service.requests) == 1
+
+    def test_retries_are_limited(self):
+        with patch.dict(os.environ, {'IC_RATE_LIMIT_RETRIES': '1'}):
+            service = ratelimit.limit_service(FakeService(*[too_many_requests('0')] * 3))
+
+            with self.assertRaises(ApiException) as context:
+                service.send({'method': 'DELETE', 'url': 'https://fake'})
+
+        assert context.exception.status_code == 429
+        assert len(service.requests) == 2
@@ -0,0 +1,34 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from plugins.module_utils import schematics_argspec
+
+
+def test_variable_data_spec():
+    spec = schematics_argspec.variable_data_spec()
+
+    assert spec['type'] == 'list'
+    assert spec['elements'] == 'dict'
+    assert list(spec['options']) == ['name', 'value', 'use_default', 'metadata', 'link']
+    metadata = spec['options']['metadata']['options']
+    assert metadata['type'] == dict(type='str', choices=schematics_argspec.VARIABLE_TYPES, required=False)
+    assert metadata['min_value'] == dict(type='int', required=False)
+    assert 'secure' in metadata
+
+
+def test_credential_spec():
+    spec = schematics_argspec.variable_data_spec(credential=True, single=True)
+
+    assert spec['type'] == 'dict'
+    assert 'elements' not in spec
+    metadata = spec['options']['metadata']['options']
+    assert metadata['type']['choices'] == ['string', 'link']
+    assert not set(metadata) & {'secure', 'options', 'min_value', 'max_value', 'min_length', 'max_length', 'matches'}
+
+
+def test_specs_are_shared():
+    assert schematics_argspec.variable_data_spec() is schematics_argspec.variable_data_spec()
+    assert schematics_argspec.variable_data_spec() is not schematics_argspec.variable_data_spec(credential=True)
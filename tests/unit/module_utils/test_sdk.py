@@ -0,0 +1,34 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+COLLECTION_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# Run in a fresh interpreter, since the test process has already loaded the SDK packages.
+PROBE = '''
+import sys
+from plugins.module_utils import sdk
+
+ResourceControllerV2 = sdk.import_service('ibm_platform_services.resource_controller_v2', 'ResourceControllerV2')
+assert ResourceControllerV2.__name__ == 'ResourceControllerV2'
+assert 'ibm_platform_services.iam_identity_v1' not in sys.modules
+
+from ibm_platform_services import IamIdentityV1, ResourceControllerV2 as Imported
+assert IamIdentityV1.__module__ == 'ibm_platform_services.iam_identity_v1'
+assert Imported is ResourceControllerV2
+'''
+
+
+class TestImportService(unittest.TestCase):
+    """
+    Test class for the import of the SDK services.
+    """
+
+    def test_import_service(self):
+        """Test that only the module of the service is loaded, and that the package still works as a whole."""
+        subprocess.check_call([sys.executable, '-c', PROBE], cwd=COLLECTION_ROOT)
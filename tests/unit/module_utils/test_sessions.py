@@ -0,0 +1,82 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+import unittest
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_platform_services import GlobalCatalogV1, ResourceControllerV2
+
+from plugins.module_utils import auth
+from plugins.module_utils import sessions
+
+
+class TestSessions(unittest.TestCase):
+    """
+    Test class for the shared HTTP sessions.
+    """
+
+    def setUp(self):
+        sessions.close_sessions()
+        self.addCleanup(sessions.close_sessions)
+        patcher = patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in (sessions.POOL_SIZE_ENV, sessions.CONNECT_TIMEOUT_ENV, sessions.READ_TIMEOUT_ENV):
+            os.environ.pop(name, None)
+
+    def test_session_is_shared_per_host(self):
+        session = sessions.get_session('https://resource-controller.cloud.ibm.com/v2/resource_instances')
+
+        assert sessions.get_session('https://resource-controller.cloud.ibm.com') is session
+        assert sessions.get_session('https://globalcatalog.cloud.ibm.com/api/v1') is not session
+
+    def test_pool_size_from_environment(self):
+        os.environ[sessions.POOL_SIZE_ENV] = '25'
+
+        adapter = sessions.get_session('https://iam.cloud.ibm.com').get_adapter('https://iam.cloud.ibm.com')
+
+        assert adapter._pool_maxsize == 25
+
+    def test_invalid_settings_use_defaults(self):
+        os.environ[sessions.POOL_SIZE_ENV] = 'many'
+        os.environ[sessions.READ_TIMEOUT_ENV] = '-1'
+
+        assert sessions.get_pool_size() == sessions.DEFAULT_POOL_SIZE
+        assert sessions.get_http_config() == {
+            'timeout': (sessions.DEFAULT_CONNECT_TIMEOUT, sessions.DEFAULT_READ_TIMEOUT)}
+
+    def test_clients_of_a_host_share_the_session(self):
+        os.environ[sessions.CONNECT_TIMEOUT_ENV] = '5'
+        os.environ[sessions.READ_TIMEOUT_ENV] = '120'
+
+        first = sessions.configure_service(ResourceControllerV2(authenticator=NoAuthAuthenticator()))
+        second = sessions.configure_service(ResourceControllerV2(authenticator=NoAuthAuthenticator()))
+        catalog = sessions.configure_service(GlobalCatalogV1(authenticator=NoAuthAuthenticator()))
+
+        assert first.get_http_client() is second.get_http_client()
+        assert catalog.get_http_client() is not first.get_http_client()
+        assert first.http_config == {'timeout': (5.0, 120.0)}
+
+    def test_client_with_retries_keeps_its_session(self):
+        service = ResourceControllerV2(authenticator=NoAuthAuthenticator())
+        service.enable_retries()
+        own_session = service.get_http_client()
+
+        sessions.configure_service(service)
+
+        assert service.get_http_client() is own_session
+
+    def test_token_requests_use_the_shared_session(self):
+        manager = auth.PooledIAMTokenManager('apikey')
+        session = sessions.get_session(manager.url)
+
+        with patch.object(session, 'request') as request_mock:
+            request_mock.return_value.status_code = 200
+            request_mock.return_value.json.return_value = {'access_token': 'token'}
+            assert manager.request_token() == {'access_token': 'token'}
+
+        request_mock.assert_called_once()
+        assert request_mock.call_args.kwargs['url'].startswith(manager.url)
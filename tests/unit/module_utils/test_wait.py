@@ -0,0 +1,59 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import itertools
+import unittest
+
+from plugins.module_utils import wait
+
+
+class FakeClock:
+    """A clock that only moves when it sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestWaitFor(unittest.TestCase):
+    """
+    Test class for polling with backoff.
+    """
+
+    def test_done(self):
+        """The polls stop once the result is done."""
+        clock = FakeClock()
+        results = iter(['pending', 'running', 'done'])
+
+        result, polls, elapsed = wait.wait_for(
+            lambda: next(results), lambda result: result == 'done', delays=[1, 2, 4], sleep=clock.sleep, clock=clock)
+
+        assert (result, polls, elapsed) == ('done', 3, 3)
+        assert clock.sleeps == [1, 2]
+
+    def test_timeout(self):
+        """The last result is raised once the timeout is reached, without sleeping past it."""
+        clock = FakeClock()
+
+        with self.assertRaises(wait.WaitTimeoutError) as error:
+            wait.wait_for(lambda: 'pending', lambda result: False, timeout=10,
+                          delays=itertools.repeat(4), sleep=clock.sleep, clock=clock)
+
+        assert error.exception.result == 'pending'
+        assert error.exception.polls == 4
+        assert clock.sleeps == [4, 4, 2]
+
+    def test_delays(self):
+        """The delays grow exponentially with jitter, up to the maximum."""
+        delays = list(itertools.islice(wait.get_delays(initial=2, maximum=10, factor=2), 6))
+
+        for delay, bound in zip(delays, [2, 4, 8, 10, 10, 10]):
+            assert 1 <= delay <= bound
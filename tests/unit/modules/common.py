@@ -8,9 +8,14 @@ __metaclass__ = type
 class DetailedResponseMock:
     """Mock class for the DetailedResponse object."""
 
-    def __init__(self, result=None):
+    def __init__(self, result=None, headers=None):
         self.result = result
+        self.headers = headers or {}
 
     def get_result(self):
         """Returns the set value."""
         return self.result
+
+    def get_headers(self):
+        """Returns the set headers."""
+        return self.headers
@@ -0,0 +1,154 @@
+# (C) Copyright IBM Corp. 2023.
+#
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+from plugins.modules import ibm_catalog_index
+
+try:
+    from ibm_cloud_sdk_core import ApiException
+except ImportError as imp_exc:
+    MISSING_IMPORT_EXC = imp_exc
+else:
+    MISSING_IMPORT_EXC = None
+
+
+def mock_operations(func):
+    def wrapper(self):
+        # Make sure the imports are correct in both test and module packages.
+        self.assertIsNone(MISSING_IMPORT_EXC)
+        self.assertIsNone(ibm_catalog_index.MISSING_IMPORT_EXC)
+
+        # Set-up mocks for each operation.
+        self.prewarm_patcher = patch('plugins.modules.ibm_catalog_index.catalog.prewarm')
+        self.prewarm_mock = self.prewarm_patcher.start()
+        self.invalidate_patcher = patch('plugins.modules.ibm_catalog_index.catalog.invalidate_cache')
+        self.invalidate_mock = self.invalidate_patcher.start()
+        self.enabled_patcher = patch('plugins.modules.ibm_catalog_index.catalog.cache_enabled')
+        self.enabled_mock = self.enabled_patcher.start()
+        self.enabled_mock.return_value = True
+
+        # Run the actual function.
+        func(self)
+
+        # Stop the patchers.
+        self.prewarm_patcher.stop()
+        self.invalidate_patcher.stop()
+        self.enabled_patcher.stop()
+
+    return wrapper
+
+
+class TestCatalogIndexModule(ModuleTestCase):
+    """
+    Test class for CatalogIndex module testing.
+    """
+
+    @mock_operations
+    def test_prewarm_ibm_catalog_index_success(self):
+        """Test the "prewarm" path - successful."""
+        index = {
+            'cloud-object-storage': {
+                'id': 'testServiceId',
+                'plans': {'standard': {'id': 'testPlanId', 'locations': {'global': 'testCRN'}}},
+            },
+        }
+        self.prewarm_mock.return_value = index
+
+        set_module_args({
+            'services': ['cloud-object-storage'],
+            'refresh': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_index.main()
+
+        self.assertFalse(result.exception.args[0].get('changed'))
+        self.assertEqual(result.exception.args[0].get('msg'), index)
+        self.prewarm_mock.assert_called_once_with(['cloud-object-storage'], refresh=True)
+
+    @mock_operations
+    def test_prewarm_ibm_catalog_index_failed(self):
+        """Test the "prewarm" path - failed."""
+        self.prewarm_mock.side_effect = ApiException(400, message='Get catalog entry error')
+
+        set_module_args({
+            'services': ['cloud-object-storage'],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_index.main()
+
+        self.assertEqual(result.exception.args[0].get('msg'), 'Get catalog entry error')
+
+    @mock_operations
+    def test_prewarm_ibm_catalog_index_not_found(self):
+        """Test the "prewarm" path - service not found."""
+        self.prewarm_mock.side_effect = ValueError('[ERROR] service name is invalid or not found')
+
+        set_module_args({
+            'services': ['unknown'],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_index.main()
+
+        self.assertEqual(result.exception.args[0].get('msg'), '[ERROR] service name is invalid or not found')
+
+    @mock_operations
+    def test_prewarm_ibm_catalog_index_cache_disabled(self):
+        """Test the "prewarm" path - the cache is disabled."""
+        self.enabled_mock.return_value = False
+
+        set_module_args({
+            'services': ['cloud-object-storage'],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_index.main()
+
+        self.assertIn('cache is disabled', result.exception.args[0].get('msg'))
+        self.prewarm_mock.assert_not_called()
+
+    @mock_operations
+    def test_invalidate_ibm_catalog_index_success(self):
+        """Test the "invalidate" path - successful."""
+        self.invalidate_mock.return_value = 2
+
+        set_module_args({
+            'services': ['cloud-object-storage'],
+            'state': 'absent',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_catalog_index.main()
+
+        self.assertTrue(result.exception.args[0].get('changed'))
+        self.assertEqual(result.exception.args[0].get('msg'), {'removed': 2})
+        self.invalidate_mock.assert_called_once_with('cloud-object-storage')
+        self.prewarm_mock.assert_not_called()
+
+    @mock_operations
+    def test_invalidate_ibm_catalog_index_all(self):
+        """Test the "invalidate" path - all entries, nothing cached."""
+        self.invalidate_mock.return_value = 0
+
+        set_module_args({
+            'state': 'absent',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_catalog_index.main()
+
+        self.assertFalse(result.exception.args[0].get('changed'))
+        self.invalidate_mock.assert_called_once_with()
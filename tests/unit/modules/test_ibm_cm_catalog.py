@@ -78,7 +78,7 @@ class TestCatalogModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -176,12 +176,12 @@ class TestCatalogModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.create_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_catalog')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
 
         set_module_args({
@@ -238,11 +238,11 @@ class TestCatalogModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.create_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_catalog')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_cm_catalog error')
@@ -422,14 +422,14 @@ class TestCatalogModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.replace_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.replace_catalog')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
-        get_catalog_mock.return_value = DetailedResponseMock(resource)
+        get_catalog_mock.return_value = DetailedResponseMock(dict(resource, label='old-label'))
 
         set_module_args({
             'catalog_identifier': 'testString',
@@ -566,15 +566,15 @@ class TestCatalogModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.replace_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.replace_catalog')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_cm_catalog error')
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
-        get_catalog_mock.return_value = DetailedResponseMock(resource)
+        get_catalog_mock.return_value = DetailedResponseMock(dict(resource, label='old-label'))
 
         set_module_args({
             'catalog_identifier': 'testString',
@@ -641,12 +641,12 @@ class TestCatalogModule(ModuleTestCase):
     def test_delete_ibm_cm_catalog_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.delete_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_catalog')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
         get_catalog_mock.return_value = DetailedResponseMock()
 
@@ -694,12 +694,12 @@ class TestCatalogModule(ModuleTestCase):
     def test_delete_ibm_cm_catalog_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.delete_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_catalog')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
         get_catalog_mock.side_effect = ApiException(404)
 
@@ -744,13 +744,13 @@ class TestCatalogModule(ModuleTestCase):
     def test_delete_ibm_cm_catalog_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.delete_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_catalog')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_cm_catalog error')
 
         get_catalog_patcher = patch(
-            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
         get_catalog_mock.return_value = DetailedResponseMock()
 
@@ -78,7 +78,7 @@ class TestOfferingModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -322,12 +322,12 @@ class TestOfferingModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.create_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_offering')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
 
         set_module_args({
@@ -440,11 +440,11 @@ class TestOfferingModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.create_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_offering')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_cm_offering error')
@@ -736,12 +736,12 @@ class TestOfferingModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.update_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.update_offering')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
         get_offering_mock.return_value = DetailedResponseMock(resource)
 
@@ -807,13 +807,13 @@ class TestOfferingModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.update_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.update_offering')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_cm_offering error')
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
         get_offering_mock.return_value = DetailedResponseMock(resource)
 
@@ -865,12 +865,12 @@ class TestOfferingModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.delete_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
         get_offering_mock.return_value = DetailedResponseMock()
 
@@ -923,12 +923,12 @@ class TestOfferingModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.delete_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
         get_offering_mock.side_effect = ApiException(404)
 
@@ -978,13 +978,13 @@ class TestOfferingModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.delete_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_cm_offering error')
 
         get_offering_patcher = patch(
-            'plugins.modules.ibm_cm_offering.CatalogManagementV1.get_offering')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering')
         get_offering_mock = get_offering_patcher.start()
         get_offering_mock.return_value = DetailedResponseMock()
 
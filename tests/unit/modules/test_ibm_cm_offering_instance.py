@@ -78,7 +78,7 @@ class TestOfferingInstanceModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -138,12 +138,12 @@ class TestOfferingInstanceModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.create_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_offering_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
 
         set_module_args({
@@ -214,11 +214,11 @@ class TestOfferingInstanceModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.create_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.create_offering_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_cm_offering_instance error')
@@ -329,12 +329,12 @@ class TestOfferingInstanceModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.put_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.put_offering_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
         get_offering_instance_mock.return_value = DetailedResponseMock(
             resource)
@@ -450,13 +450,13 @@ class TestOfferingInstanceModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.put_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.put_offering_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_cm_offering_instance error')
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
         get_offering_instance_mock.return_value = DetailedResponseMock(
             resource)
@@ -540,12 +540,12 @@ class TestOfferingInstanceModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_instance_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.delete_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
         get_offering_instance_mock.return_value = DetailedResponseMock()
 
@@ -595,12 +595,12 @@ class TestOfferingInstanceModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_instance_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.delete_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
         get_offering_instance_mock.side_effect = ApiException(404)
 
@@ -647,13 +647,13 @@ class TestOfferingInstanceModule(ModuleTestCase):
     def test_delete_ibm_cm_offering_instance_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.delete_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_offering_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_cm_offering_instance error')
 
         get_offering_instance_patcher = patch(
-            'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
         get_offering_instance_mock.return_value = DetailedResponseMock()
 
@@ -78,7 +78,7 @@ class TestVersionModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -120,12 +120,12 @@ class TestVersionModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.import_offering_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.import_offering_version')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_version_patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         get_version_mock = get_version_patcher.start()
 
         set_module_args({
@@ -176,11 +176,11 @@ class TestVersionModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_version_patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         get_version_mock = get_version_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.import_offering_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.import_offering_version')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_cm_version error')
@@ -231,12 +231,12 @@ class TestVersionModule(ModuleTestCase):
     def test_delete_ibm_cm_version_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.delete_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_version')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_version_patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         get_version_mock = get_version_patcher.start()
         get_version_mock.return_value = DetailedResponseMock()
 
@@ -284,12 +284,12 @@ class TestVersionModule(ModuleTestCase):
     def test_delete_ibm_cm_version_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.delete_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_version')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_version_patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         get_version_mock = get_version_patcher.start()
         get_version_mock.side_effect = ApiException(404)
 
@@ -334,13 +334,13 @@ class TestVersionModule(ModuleTestCase):
     def test_delete_ibm_cm_version_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.delete_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.delete_version')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_cm_version error')
 
         get_version_patcher = patch(
-            'plugins.modules.ibm_cm_version.CatalogManagementV1.get_version')
+            'ibm_platform_services.catalog_management_v1.CatalogManagementV1.get_version')
         get_version_mock = get_version_patcher.start()
         get_version_mock.return_value = DetailedResponseMock()
 
@@ -78,7 +78,7 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -118,12 +118,12 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.create_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.create_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
 
         set_module_args({
@@ -162,11 +162,11 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.create_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.create_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_iam_access_group error')
@@ -213,14 +213,14 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.update_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.update_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
-        get_access_group_mock.return_value = DetailedResponseMock(resource)
+        get_access_group_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'access_group_id': 'testString',
@@ -279,15 +279,15 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.update_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.update_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_iam_access_group error')
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
-        get_access_group_mock.return_value = DetailedResponseMock(resource)
+        get_access_group_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'access_group_id': 'testString',
@@ -338,12 +338,12 @@ class TestCreateGroupRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.delete_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.delete_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
         get_access_group_mock.return_value = DetailedResponseMock()
 
@@ -397,12 +397,12 @@ class TestCreateGroupRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.delete_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.delete_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
         get_access_group_mock.side_effect = ApiException(404)
 
@@ -453,13 +453,13 @@ class TestCreateGroupRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.delete_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.delete_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_iam_access_group error')
 
         get_access_group_patcher = patch(
-            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
         get_access_group_mock.return_value = DetailedResponseMock()
 
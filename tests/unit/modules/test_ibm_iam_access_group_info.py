@@ -26,7 +26,7 @@ class TestGroupModuleInfo(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_info.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(datasource)
 
@@ -54,7 +54,7 @@ class TestGroupModuleInfo(ModuleTestCase):
     def test_read_ibm_iam_access_group_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_info.IamAccessGroupsV2.get_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Read ibm_iam_access_group error')
@@ -78,7 +78,7 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     #     """Test the inner "read" path in this module with a server error response."""
 
     #     patcher = patch(
-    #         'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+    #         'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
     #     mock = patcher.start()
     #     print("*****[ApiException]*****")
     #     mock.side_effect = ApiException(500, message='Something went wrong...')
@@ -131,12 +131,12 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.add_members_to_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         list_access_group_members_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
 
         set_module_args({
@@ -173,11 +173,11 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         list_access_group_members_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.add_members_to_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_iam_access_group_members error')
@@ -230,12 +230,12 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     #     }
 
     #     patcher = patch(
-    #         'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.add_members_to_access_group')
+    #         'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
     #     mock = patcher.start()
     #     mock.return_value = DetailedResponseMock(resource)
 
     #     list_access_group_members_patcher = patch(
-    #         'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+    #         'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
     #     list_access_group_members_mock = list_access_group_members_patcher.start()
     #     list_access_group_members_mock.return_value = DetailedResponseMock(
     #         resource)
@@ -301,13 +301,13 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     #     }
 
     #     patcher = patch(
-    #         'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.add_members_to_access_group')
+    #         'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
     #     mock = patcher.start()
     #     mock.side_effect = ApiException(
     #         400, message='Update ibm_iam_access_group_members error')
 
     #     list_access_group_members_patcher = patch(
-    #         'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+    #         'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
     #     list_access_group_members_mock = list_access_group_members_patcher.start()
     #     list_access_group_members_mock.return_value = DetailedResponseMock(
     #         resource)
@@ -362,12 +362,12 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_members_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.remove_member_from_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_member_from_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         list_access_group_members_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
         list_access_group_members_mock.return_value = DetailedResponseMock()
 
@@ -426,12 +426,12 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_members_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.remove_member_from_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_member_from_access_group')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         list_access_group_members_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
         list_access_group_members_mock.side_effect = ApiException(404)
 
@@ -487,13 +487,13 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_members_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.remove_member_from_access_group')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_member_from_access_group')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_iam_access_group_members error')
 
         list_access_group_members_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
         list_access_group_members_mock.return_value = DetailedResponseMock()
 
@@ -544,3 +544,81 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
 
         list_access_group_members_patcher.stop()
         patcher.stop()
+
+    def test_sync_ibm_iam_access_group_members_success(self):
+        """Test the "sync" path - only the differences are added and removed."""
+        pages = {
+            0: {'total_count': 3, 'limit': 2, 'members': [{'iam_id': 'IBMid-user1'}, {'iam_id': 'IBMid-user2'}]},
+            2: {'total_count': 3, 'limit': 2, 'members': [{'iam_id': 'IBMid-user3'}]},
+        }
+
+        list_access_group_members_patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
+        list_access_group_members_mock = list_access_group_members_patcher.start()
+        list_access_group_members_mock.side_effect = lambda offset=None, **kwargs: DetailedResponseMock(pages[offset])
+
+        add_patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
+        add_mock = add_patcher.start()
+
+        remove_patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_members_from_access_group')
+        remove_mock = remove_patcher.start()
+
+        members = [{'iam_id': 'IBMid-user%d' % number, 'type': 'user'} for number in range(2, 55)]
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'members': members,
+            'purge': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == {
+            'added': [member['iam_id'] for member in members[2:]],
+            'removed': ['IBMid-user1'],
+        }
+
+        assert list_access_group_members_mock.call_count == 2
+        assert list_access_group_members_mock.call_args.kwargs['membership_type'] == 'static'
+        assert [len(call.kwargs['members']) for call in add_mock.call_args_list] == [50, 1]
+        remove_mock.assert_called_once_with(access_group_id='testString', members=['IBMid-user1'], transaction_id=None)
+
+        remove_patcher.stop()
+        add_patcher.stop()
+        list_access_group_members_patcher.stop()
+
+    def test_sync_ibm_iam_access_group_members_unchanged(self):
+        """Test the "sync" path - nothing is written when the members match."""
+        list_access_group_members_patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
+        list_access_group_members_mock = list_access_group_members_patcher.start()
+        list_access_group_members_mock.return_value = DetailedResponseMock(
+            {'total_count': 1, 'limit': 100, 'members': [{'iam_id': 'IBMid-user1'}]})
+
+        add_patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_members_to_access_group')
+        add_mock = add_patcher.start()
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'members': [{'iam_id': 'IBMid-user1', 'type': 'user'}],
+            'purge': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == {'added': [], 'removed': []}
+        add_mock.assert_not_called()
+
+        add_patcher.stop()
+        list_access_group_members_patcher.stop()
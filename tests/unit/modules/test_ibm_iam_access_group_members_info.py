@@ -20,7 +20,7 @@ class TestGroupMembersListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_members_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members_info.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -48,7 +48,7 @@ class TestGroupMembersListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_members_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_members_info.IamAccessGroupsV2.list_access_group_members')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_iam_access_group_members error')
@@ -73,3 +73,63 @@ class TestGroupMembersListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_iam_access_group_members_fetch_all_success(self):
+        """Test the "list" path - all pages."""
+        def list_access_group_members(**kwargs):
+            offset, limit = kwargs['offset'], kwargs['limit']
+            members = [{'iam_id': 'IBMid-%d' % i} for i in range(offset, min(offset + limit, 5))]
+            return DetailedResponseMock({'limit': limit, 'offset': offset, 'total_count': 5, 'members': members})
+
+        patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
+        mock = patcher.start()
+        mock.side_effect = list_access_group_members
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'limit': 2,
+            'fetch_all': True,
+            'parallelism': 2,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members_info.main()
+
+        msg = result.exception.args[0]['msg']
+        assert [member['iam_id'] for member in msg['members']] == ['IBMid-%d' % i for i in range(5)]
+        assert msg['total_count'] == 5
+
+        assert mock.call_count == 3
+        assert sorted(call.kwargs['offset'] for call in mock.call_args_list) == [0, 2, 4]
+
+        patcher.stop()
+
+    def test_list_ibm_iam_access_group_members_fetch_all_failed(self):
+        """Test the "list" path - all pages, a page failed."""
+        def list_access_group_members(**kwargs):
+            if kwargs['offset'] > 0:
+                raise ApiException(500, message='List ibm_iam_access_group_members error')
+            return DetailedResponseMock({'limit': 2, 'offset': 0, 'total_count': 5, 'members': [{}, {}]})
+
+        patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_members')
+        mock = patcher.start()
+        mock.side_effect = list_access_group_members
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'limit': 2,
+            'fetch_all': True,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members_info.main()
+
+        assert result.exception.args[0]['msg'] == 'List ibm_iam_access_group_members error'
+
+        patcher.stop()
@@ -78,7 +78,7 @@ class TestRuleRequestModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -126,12 +126,12 @@ class TestRuleRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.add_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_access_group_rule')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
 
         set_module_args({
@@ -174,11 +174,11 @@ class TestRuleRequestModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.add_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.add_access_group_rule')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_iam_access_group_rule error')
@@ -244,15 +244,14 @@ class TestRuleRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.replace_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.replace_access_group_rule')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
-        get_access_group_rule_mock.return_value = DetailedResponseMock(
-            resource)
+        get_access_group_rule_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'access_group_id': 'testString',
@@ -326,16 +325,15 @@ class TestRuleRequestModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.replace_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.replace_access_group_rule')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_iam_access_group_rule error')
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
-        get_access_group_rule_mock.return_value = DetailedResponseMock(
-            resource)
+        get_access_group_rule_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'access_group_id': 'testString',
@@ -392,12 +390,12 @@ class TestRuleRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_rule_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.remove_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_access_group_rule')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
         get_access_group_rule_mock.return_value = DetailedResponseMock()
 
@@ -451,12 +449,12 @@ class TestRuleRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_rule_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.remove_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_access_group_rule')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
         get_access_group_rule_mock.side_effect = ApiException(404)
 
@@ -507,13 +505,13 @@ class TestRuleRequestModule(ModuleTestCase):
     def test_delete_ibm_iam_access_group_rule_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.remove_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.remove_access_group_rule')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_iam_access_group_rule error')
 
         get_access_group_rule_patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
         get_access_group_rule_mock.return_value = DetailedResponseMock()
 
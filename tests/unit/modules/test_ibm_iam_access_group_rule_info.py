@@ -20,7 +20,7 @@ class TestRuleModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_rule_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule_info.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -44,7 +44,7 @@ class TestRuleModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_rule_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rule_info.IamAccessGroupsV2.get_access_group_rule')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.get_access_group_rule')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_iam_access_group_rule error')
@@ -0,0 +1,161 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from .common import DetailedResponseMock
+from plugins.modules import ibm_iam_access_group_rules
+
+
+REALM = 'https://idp.example.org/SAML2'
+
+CURRENT_RULES = {
+    'rules': [
+        {
+            'id': 'rule1',
+            'name': 'Managers',
+            'expiration': 24,
+            'realm_name': REALM,
+            'conditions': [
+                {'claim': 'isManager', 'operator': 'EQUALS', 'value': 'true'},
+                {'claim': 'department', 'operator': 'EQUALS', 'value': '"sales"'},
+            ],
+        },
+        {
+            'id': 'rule2',
+            'name': 'Admins',
+            'expiration': 12,
+            'realm_name': REALM,
+            'conditions': [{'claim': 'groups', 'operator': 'CONTAINS', 'value': '"admins"'}],
+        },
+        {
+            'id': 'rule3',
+            'name': 'Contractors',
+            'expiration': 1,
+            'realm_name': REALM,
+            'conditions': [{'claim': 'contractor', 'operator': 'EQUALS', 'value': 'true'}],
+        },
+    ],
+}
+
+RULES = [
+    {
+        'name': 'Managers',
+        'expiration': 24,
+        'realm_name': REALM,
+        'conditions': [
+            {'claim': 'department', 'operator': 'EQUALS', 'value': '"sales"'},
+            {'claim': 'isManager', 'operator': 'EQUALS', 'value': 'true'},
+        ],
+    },
+    {
+        'name': 'Admins',
+        'expiration': 8,
+        'realm_name': REALM,
+        'conditions': [{'claim': 'groups', 'operator': 'CONTAINS', 'value': '"admins"'}],
+    },
+    {
+        'name': 'Auditors',
+        'expiration': 24,
+        'realm_name': REALM,
+        'conditions': [{'claim': 'groups', 'operator': 'CONTAINS', 'value': '"auditors"'}],
+    },
+]
+
+
+class TestAccessGroupRulesModule(ModuleTestCase):
+    """
+    Test class for the bulk access group rules module testing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+
+        self.sdk = MagicMock()
+        self.sdk.list_access_group_rules.return_value = DetailedResponseMock(CURRENT_RULES)
+        self.sdk.get_access_group_rule.return_value = DetailedResponseMock({}, headers={'ETag': '1-etag'})
+        self.sdk.add_access_group_rule.return_value = DetailedResponseMock({'id': 'rule4'})
+
+        self.patcher = patch('plugins.modules.ibm_iam_access_group_rules.config.get_iam_access_group_sdk', return_value=self.sdk)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        super().tearDown()
+
+    def test_sync_rules(self):
+        """Only the changed rules are added, replaced and removed."""
+        set_module_args({
+            'access_group_id': 'testString',
+            'rules': RULES,
+            'parallelism': 2,
+            'purge': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_iam_access_group_rules.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert [(res['name'], res['id'], res['status']) for res in result.exception.args[0]['msg']] == [
+            ('Managers', 'rule1', 'unchanged'),
+            ('Admins', 'rule2', 'replaced'),
+            ('Auditors', 'rule4', 'added'),
+            ('Contractors', 'rule3', 'removed'),
+        ]
+
+        self.sdk.list_access_group_rules.assert_called_once()
+        self.sdk.get_access_group_rule.assert_called_once_with(access_group_id='testString', rule_id='rule2', transaction_id=None)
+        assert self.sdk.replace_access_group_rule.call_args.kwargs['if_match'] == '1-etag'
+        assert self.sdk.replace_access_group_rule.call_args.kwargs['expiration'] == 8
+        self.sdk.add_access_group_rule.assert_called_once()
+        self.sdk.remove_access_group_rule.assert_called_once_with(access_group_id='testString', rule_id='rule3', transaction_id=None)
+
+    def test_sync_rules_without_purge(self):
+        """The unmatched rules are kept without purge, the default."""
+        set_module_args({
+            'access_group_id': 'testString',
+            'rules': RULES[:1],
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_iam_access_group_rules.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert [res['status'] for res in result.exception.args[0]['msg']] == ['unchanged']
+        self.sdk.remove_access_group_rule.assert_not_called()
+
+    def test_sync_rules_failed(self):
+        """The module fails with the results of all rules when a call fails."""
+        self.sdk.add_access_group_rule.side_effect = ApiException(400, message='Add rule error')
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'rules': RULES,
+            'purge': True,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_iam_access_group_rules.main()
+
+        assert result.exception.args[0]['msg'] == 'Failed to apply 1 of 4 access group rules'
+        assert result.exception.args[0]['results'][2] == {'name': 'Auditors', 'id': None, 'status': 'failed', 'error': 'Add rule error'}
+
+    def test_list_rules_failed(self):
+        """The module fails when the current rules can't be listed."""
+        self.sdk.list_access_group_rules.side_effect = ApiException(404, message='Access group not found')
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'rules': RULES,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_iam_access_group_rules.main()
+
+        assert result.exception.args[0]['msg'] == 'Access group not found'
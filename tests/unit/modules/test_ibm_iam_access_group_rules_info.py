@@ -20,7 +20,7 @@ class TestRulesListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_rules_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rules_info.IamAccessGroupsV2.list_access_group_rules')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_rules')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -43,7 +43,7 @@ class TestRulesListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_group_rules_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_group_rules_info.IamAccessGroupsV2.list_access_group_rules')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_group_rules')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_iam_access_group_rules error')
@@ -20,7 +20,7 @@ class TestGroupsListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_groups_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_groups_info.IamAccessGroupsV2.list_access_groups')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_groups')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -49,7 +49,7 @@ class TestGroupsListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_access_groups_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_access_groups_info.IamAccessGroupsV2.list_access_groups')
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_groups')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_iam_access_groups error')
@@ -75,3 +75,35 @@ class TestGroupsListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_iam_access_groups_fetch_all_success(self):
+        """Test the "list" path - all pages."""
+        def list_access_groups(**kwargs):
+            offset, limit = kwargs['offset'], kwargs['limit'] or 50
+            groups = [{'id': 'AccessGroupId-%d' % i} for i in range(offset, min(offset + limit, 120))]
+            return DetailedResponseMock({'limit': limit, 'offset': offset, 'total_count': 120, 'groups': groups})
+
+        patcher = patch(
+            'ibm_platform_services.iam_access_groups_v2.IamAccessGroupsV2.list_access_groups')
+        mock = patcher.start()
+        mock.side_effect = list_access_groups
+
+        set_module_args({
+            'account_id': 'testString',
+            'fetch_all': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_groups_info.main()
+
+        msg = result.exception.args[0]['msg']
+        assert [group['id'] for group in msg['groups']] == ['AccessGroupId-%d' % i for i in range(120)]
+        assert msg['total_count'] == 120
+
+        # The page size comes from the first page, since no limit was given.
+        assert mock.call_count == 3
+        assert sorted(call.kwargs['offset'] for call in mock.call_args_list) == [0, 50, 100]
+
+        patcher.stop()
@@ -78,7 +78,7 @@ class TestServiceIdModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -127,12 +127,12 @@ class TestServiceIdModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.create_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.create_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
 
         set_module_args({
@@ -175,11 +175,11 @@ class TestServiceIdModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.create_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.create_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_iam_service_id error')
@@ -237,14 +237,14 @@ class TestServiceIdModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.update_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.update_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
-        get_service_id_mock.return_value = DetailedResponseMock(resource)
+        get_service_id_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -301,15 +301,15 @@ class TestServiceIdModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.update_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.update_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_iam_service_id error')
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
-        get_service_id_mock.return_value = DetailedResponseMock(resource)
+        get_service_id_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -359,12 +359,12 @@ class TestServiceIdModule(ModuleTestCase):
     def test_delete_ibm_iam_service_id_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.delete_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.delete_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
         get_service_id_mock.return_value = DetailedResponseMock()
 
@@ -414,12 +414,12 @@ class TestServiceIdModule(ModuleTestCase):
     def test_delete_ibm_iam_service_id_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.delete_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.delete_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
         get_service_id_mock.side_effect = ApiException(404)
 
@@ -466,13 +466,13 @@ class TestServiceIdModule(ModuleTestCase):
     def test_delete_ibm_iam_service_id_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.delete_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.delete_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_iam_service_id error')
 
         get_service_id_patcher = patch(
-            'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
         get_service_id_mock.return_value = DetailedResponseMock()
 
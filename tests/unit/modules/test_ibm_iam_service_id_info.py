@@ -26,7 +26,7 @@ class TestServiceIdModuleInfo(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id_info.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(datasource)
 
@@ -54,7 +54,7 @@ class TestServiceIdModuleInfo(ModuleTestCase):
     def test_read_ibm_iam_service_id_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_id_info.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Read ibm_iam_service_id error')
@@ -26,7 +26,7 @@ class TestServiceIdListModuleInfo(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(datasource)
 
@@ -54,7 +54,7 @@ class TestServiceIdListModuleInfo(ModuleTestCase):
     def test_read_ibm_iam_service_ids_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.get_service_id')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.get_service_id')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Read ibm_iam_service_ids error')
@@ -83,7 +83,7 @@ class TestServiceIdListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_service_ids_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.list_service_ids')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.list_service_ids')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -101,7 +101,7 @@ class TestServiceIdListModuleInfo(ModuleTestCase):
     def test_list_ibm_iam_service_ids_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.list_service_ids')
+            'ibm_platform_services.iam_identity_v1.IamIdentityV1.list_service_ids')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_iam_service_ids error')
@@ -78,7 +78,7 @@ class TestResourceAliasPostModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -113,12 +113,12 @@ class TestResourceAliasPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.create_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_alias')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
 
         set_module_args({
@@ -155,11 +155,11 @@ class TestResourceAliasPostModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.create_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_alias')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_resource_alias error')
@@ -201,14 +201,14 @@ class TestResourceAliasPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.update_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_alias')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
-        get_resource_alias_mock.return_value = DetailedResponseMock(resource)
+        get_resource_alias_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -248,6 +248,43 @@ class TestResourceAliasPostModule(ModuleTestCase):
         get_resource_alias_patcher.stop()
         patcher.stop()
 
+    def test_update_ibm_resource_alias_unchanged(self):
+        """Test the "update" path - no update when nothing differs."""
+        resource = {
+            'id': 'testString',
+            'crn': 'testString',
+            'name': 'my-new-alias-name',
+            'created_at': '2023-01-01T00:00:00Z',
+        }
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_alias')
+        mock = patcher.start()
+
+        get_resource_alias_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
+        get_resource_alias_mock = get_resource_alias_patcher.start()
+        get_resource_alias_mock.return_value = DetailedResponseMock(resource)
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-new-alias-name',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_alias.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == resource
+
+        mock.assert_not_called()
+        get_resource_alias_mock.assert_called_once()
+
+        get_resource_alias_patcher.stop()
+        patcher.stop()
+
     def test_update_ibm_resource_alias_failed(self):
         """Test the "update" path - failed."""
         resource = {
@@ -256,15 +293,15 @@ class TestResourceAliasPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.update_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_alias')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_resource_alias error')
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
-        get_resource_alias_mock.return_value = DetailedResponseMock(resource)
+        get_resource_alias_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -307,12 +344,12 @@ class TestResourceAliasPostModule(ModuleTestCase):
     def test_delete_ibm_resource_alias_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.delete_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_alias')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
         get_resource_alias_mock.return_value = DetailedResponseMock()
 
@@ -360,12 +397,12 @@ class TestResourceAliasPostModule(ModuleTestCase):
     def test_delete_ibm_resource_alias_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.delete_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_alias')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
         get_resource_alias_mock.side_effect = ApiException(404)
 
@@ -410,13 +447,13 @@ class TestResourceAliasPostModule(ModuleTestCase):
     def test_delete_ibm_resource_alias_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.delete_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_alias')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_resource_alias error')
 
         get_resource_alias_patcher = patch(
-            'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
         get_resource_alias_mock.return_value = DetailedResponseMock()
 
@@ -24,7 +24,7 @@ class TestResourceAliasModuleInfo(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_alias_info.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(datasource)
 
@@ -48,7 +48,7 @@ class TestResourceAliasModuleInfo(ModuleTestCase):
     def test_read_ibm_resource_alias_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_alias_info.ResourceControllerV2.get_resource_alias')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_alias')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Read ibm_resource_alias error')
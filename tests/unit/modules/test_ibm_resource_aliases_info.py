@@ -20,7 +20,7 @@ class TestResourceAliasesListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_aliases_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_resource_aliases_info.ResourceControllerV2.list_resource_aliases_for_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_aliases_for_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -44,7 +44,7 @@ class TestResourceAliasesListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_aliases_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_aliases_info.ResourceControllerV2.list_resource_aliases_for_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_aliases_for_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_resource_aliases error')
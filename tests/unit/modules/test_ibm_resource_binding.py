@@ -78,7 +78,7 @@ class TestResourceBindingPostModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -120,12 +120,12 @@ class TestResourceBindingPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.create_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_binding')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
 
         set_module_args({
@@ -166,11 +166,11 @@ class TestResourceBindingPostModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.create_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_binding')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_resource_binding error')
@@ -220,14 +220,14 @@ class TestResourceBindingPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.update_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_binding')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
-        get_resource_binding_mock.return_value = DetailedResponseMock(resource)
+        get_resource_binding_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -275,15 +275,15 @@ class TestResourceBindingPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.update_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_binding')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_resource_binding error')
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
-        get_resource_binding_mock.return_value = DetailedResponseMock(resource)
+        get_resource_binding_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -326,12 +326,12 @@ class TestResourceBindingPostModule(ModuleTestCase):
     def test_delete_ibm_resource_binding_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.delete_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_binding')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
         get_resource_binding_mock.return_value = DetailedResponseMock()
 
@@ -379,12 +379,12 @@ class TestResourceBindingPostModule(ModuleTestCase):
     def test_delete_ibm_resource_binding_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.delete_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_binding')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
         get_resource_binding_mock.side_effect = ApiException(404)
 
@@ -429,13 +429,13 @@ class TestResourceBindingPostModule(ModuleTestCase):
     def test_delete_ibm_resource_binding_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.delete_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_binding')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_resource_binding error')
 
         get_resource_binding_patcher = patch(
-            'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
         get_resource_binding_mock.return_value = DetailedResponseMock()
 
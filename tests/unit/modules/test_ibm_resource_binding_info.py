@@ -24,7 +24,7 @@ class TestResourceBindingModuleInfo(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_binding_info.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(datasource)
 
@@ -48,7 +48,7 @@ class TestResourceBindingModuleInfo(ModuleTestCase):
     def test_read_ibm_resource_binding_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_binding_info.ResourceControllerV2.get_resource_binding')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_binding')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Read ibm_resource_binding error')
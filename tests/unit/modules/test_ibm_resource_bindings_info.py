@@ -20,7 +20,7 @@ class TestResourceBindingsListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_bindings_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_resource_bindings_info.ResourceControllerV2.list_resource_bindings')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_bindings')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -38,7 +38,7 @@ class TestResourceBindingsListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_bindings_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_bindings_info.ResourceControllerV2.list_resource_bindings')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_bindings')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_resource_bindings error')
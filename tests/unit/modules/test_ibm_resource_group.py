@@ -81,13 +81,13 @@ def mock_operations(func):
         self.assertIsNone(ibm_resource_group.MISSING_IMPORT_EXC)
 
         # Set-up mocks for each operation.
-        self.read_patcher = patch('plugins.modules.ibm_resource_group.ResourceManagerV2.get_resource_group')
+        self.read_patcher = patch('ibm_platform_services.resource_manager_v2.ResourceManagerV2.get_resource_group')
         self.read_mock = self.read_patcher.start()
-        self.create_patcher = patch('plugins.modules.ibm_resource_group.ResourceManagerV2.create_resource_group')
+        self.create_patcher = patch('ibm_platform_services.resource_manager_v2.ResourceManagerV2.create_resource_group')
         self.create_mock = self.create_patcher.start()
-        self.update_patcher = patch('plugins.modules.ibm_resource_group.ResourceManagerV2.update_resource_group')
+        self.update_patcher = patch('ibm_platform_services.resource_manager_v2.ResourceManagerV2.update_resource_group')
         self.update_mock = self.update_patcher.start()
-        self.delete_patcher = patch('plugins.modules.ibm_resource_group.ResourceManagerV2.delete_resource_group')
+        self.delete_patcher = patch('ibm_platform_services.resource_manager_v2.ResourceManagerV2.delete_resource_group')
         self.delete_mock = self.delete_patcher.start()
 
         # Run the actual function.
@@ -195,7 +195,7 @@ class TestResCreateResourceGroupModule(ModuleTestCase):
             'state': 'testString',
         }
 
-        self.read_mock.return_value = DetailedResponseMock(resource)
+        self.read_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
         self.update_mock.return_value = DetailedResponseMock(resource)
 
         set_module_args({
@@ -241,7 +241,7 @@ class TestResCreateResourceGroupModule(ModuleTestCase):
             'state': 'testString',
         }
 
-        self.read_mock.return_value = DetailedResponseMock(resource)
+        self.read_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
         self.update_mock.side_effect = ApiException(400, message='Update ibm_resource_group error')
 
         set_module_args({
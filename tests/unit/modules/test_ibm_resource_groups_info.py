@@ -27,7 +27,7 @@ def mock_operations(func):
         self.assertIsNone(ibm_resource_groups_info.MISSING_IMPORT_EXC)
 
         # Set-up mocks for each operation.
-        self.list_patcher = patch('plugins.modules.ibm_resource_groups_info.ResourceManagerV2.list_resource_groups')
+        self.list_patcher = patch('ibm_platform_services.resource_manager_v2.ResourceManagerV2.list_resource_groups')
         self.list_mock = self.list_patcher.start()
 
         # Run the actual function.
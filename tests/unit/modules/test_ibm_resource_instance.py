@@ -78,7 +78,7 @@ class TestResourceInstancePostModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -120,12 +120,12 @@ class TestResourceInstancePostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.create_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
 
         set_module_args({
@@ -174,11 +174,11 @@ class TestResourceInstancePostModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.create_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_resource_instance error')
@@ -224,6 +224,129 @@ class TestResourceInstancePostModule(ModuleTestCase):
         get_resource_instance_patcher.stop()
         patcher.stop()
 
+    def test_create_ibm_resource_instance_wait_success(self):
+        """Test the "create" path - waits until the instance is active."""
+        def instance(state):
+            return {'id': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/account:guid::', 'guid': 'guid', 'state': state}
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(instance('provisioning'))
+
+        get_resource_instance_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.side_effect = [
+            DetailedResponseMock(instance('provisioning')),
+            DetailedResponseMock(instance('active')),
+        ]
+
+        delays_patcher = patch('plugins.module_utils.wait.get_delays', return_value=[0])
+        delays_patcher.start()
+
+        set_module_args({
+            'name': 'my-instance',
+            'resource_group': '5c49eabc-f5e8-5881-a37e-2d100a33b3df',
+            'wait': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            os.environ['GLOBAL_CATALOG_AUTH_TYPE'] = 'noAuth'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == instance('active')
+        assert result.exception.args[0]['polls'] == 2
+        assert sorted(result.exception.args[0]['timings']) == ['provisioning', 'request']
+
+        assert get_resource_instance_mock.call_count == 2
+        get_resource_instance_mock.assert_called_with(id='guid')
+
+        delays_patcher.stop()
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_wait(self):
+        """Test the "update" path - waits until the update of the active instance is done."""
+        def instance(plan, operation):
+            return {'id': 'testString', 'guid': 'guid', 'state': 'active', 'resource_plan_id': plan,
+                    'last_operation': {'type': 'update', 'state': operation}}
+
+        get_resource_instance_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.side_effect = [
+            DetailedResponseMock(instance('old-plan', 'succeeded')),
+            DetailedResponseMock(instance('new-plan', 'in progress')),
+            DetailedResponseMock(instance('new-plan', 'succeeded')),
+        ]
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(instance('new-plan', 'in progress'))
+
+        delays_patcher = patch('plugins.module_utils.wait.get_delays', return_value=[0])
+        delays_patcher.start()
+
+        set_module_args({
+            'id': 'testString',
+            'plan': 'new-plan',
+            'wait': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == instance('new-plan', 'succeeded')
+        assert result.exception.args[0]['polls'] == 2
+        mock.assert_called_once()
+
+        delays_patcher.stop()
+        patcher.stop()
+        get_resource_instance_patcher.stop()
+
+    def test_create_ibm_resource_instance_wait_failed(self):
+        """Test the "create" path - the task fails when provisioning fails."""
+        failed = {'id': 'testString', 'state': 'failed', 'last_operation': {'state': 'failed'}}
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({'id': 'testString', 'state': 'provisioning'})
+
+        get_resource_instance_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock(failed)
+
+        set_module_args({
+            'name': 'my-instance',
+            'resource_group': '5c49eabc-f5e8-5881-a37e-2d100a33b3df',
+            'wait': True,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            os.environ['GLOBAL_CATALOG_AUTH_TYPE'] = 'noAuth'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['msg'] == 'The resource instance testString ended in the state failed'
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['instance'] == failed
+
+        get_resource_instance_mock.assert_called_once_with(id='testString')
+
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
     def test_update_ibm_resource_instance_success(self):
         """Test the "update" path - successful."""
         resource = {
@@ -235,12 +358,12 @@ class TestResourceInstancePostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
         get_resource_instance_mock.return_value = DetailedResponseMock(
             resource)
@@ -290,6 +413,106 @@ class TestResourceInstancePostModule(ModuleTestCase):
         get_resource_instance_patcher.stop()
         patcher.stop()
 
+    def test_update_ibm_resource_instance_unchanged(self):
+        """Test the "update" path - no update when nothing differs."""
+        resource = {
+            'id': 'testString',
+            'name': 'my-new-instance-name',
+            'parameters': {'key1': 'testString', 'key2': 'testString'},
+            'resource_plan_id': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+            'allow_cleanup': True,
+        }
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+
+        get_resource_instance_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock(
+            resource)
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-new-instance-name',
+            'parameters': {'key1': 'testString'},
+            'plan': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+            'allow_cleanup': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            os.environ['GLOBAL_CATALOG_AUTH_TYPE'] = 'noAuth'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == resource
+
+        mock.assert_not_called()
+        get_resource_instance_mock.assert_called_once()
+
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_plan_name(self):
+        """Test the "update" path - a plan name of the service is compared and updated by its ID."""
+        resource = {
+            'id': 'testString',
+            'name': 'my-new-instance-name',
+            'resource_plan_id': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+        }
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(dict(resource, resource_plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d'))
+
+        get_resource_instance_patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock(resource)
+
+        catalog_patcher = patch('plugins.modules.ibm_resource_instance.catalog.get_planID')
+        catalog_mock = catalog_patcher.start()
+        plans = {'lite': 'a8dff6d3-d287-4668-a81d-c87c55c2656d', 'standard': '744bfc56-d12c-4866-88d5-dac9139e0e5d'}
+        catalog_mock.side_effect = lambda service, plan: ('service-id', plans[plan])
+
+        os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+        os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-new-instance-name',
+            'service': 'cloud-object-storage',
+            'plan': 'lite',
+            'location': 'global',
+        })
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is False
+        mock.assert_not_called()
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-new-instance-name',
+            'service': 'cloud-object-storage',
+            'plan': 'standard',
+            'location': 'global',
+        })
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert mock.call_args.kwargs['resource_plan_id'] == '744bfc56-d12c-4866-88d5-dac9139e0e5d'
+        catalog_mock.assert_called_with('cloud-object-storage', 'standard')
+
+        catalog_patcher.stop()
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
     def test_update_ibm_resource_instance_failed(self):
         """Test the "update" path - failed."""
         resource = {
@@ -301,13 +524,13 @@ class TestResourceInstancePostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_resource_instance error')
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
         get_resource_instance_mock.return_value = DetailedResponseMock(
             resource)
@@ -360,12 +583,12 @@ class TestResourceInstancePostModule(ModuleTestCase):
     def test_delete_ibm_resource_instance_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.delete_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
         get_resource_instance_mock.return_value = DetailedResponseMock()
 
@@ -416,12 +639,12 @@ class TestResourceInstancePostModule(ModuleTestCase):
     def test_delete_ibm_resource_instance_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.delete_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
         get_resource_instance_mock.side_effect = ApiException(404)
 
@@ -469,13 +692,13 @@ class TestResourceInstancePostModule(ModuleTestCase):
     def test_delete_ibm_resource_instance_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.delete_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_resource_instance error')
 
         get_resource_instance_patcher = patch(
-            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         get_resource_instance_mock = get_resource_instance_patcher.start()
         get_resource_instance_mock.return_value = DetailedResponseMock()
 
@@ -20,7 +20,7 @@ class TestResourceInstanceModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_instance_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instance_info.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -42,7 +42,7 @@ class TestResourceInstanceModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_instance_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instance_info.ResourceControllerV2.get_resource_instance')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_instance')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_resource_instance error')
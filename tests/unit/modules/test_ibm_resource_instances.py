@@ -0,0 +1,162 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from .common import DetailedResponseMock
+from plugins.modules import ibm_resource_instances
+
+
+EXISTING_INSTANCES = {
+    'resources': [
+        {'id': 'crn-1', 'guid': 'guid-1', 'name': 'cos-tenant-a', 'region_id': 'global', 'state': 'active'},
+        {'id': 'crn-2', 'guid': 'guid-2', 'name': 'cos-tenant-b', 'region_id': 'us-south', 'state': 'active'},
+    ],
+    'next_url': None,
+}
+
+BASE_ARGS = {
+    'service': 'cloud-object-storage',
+    'plan': 'standard',
+    'location': 'global',
+    'resource_group': 'group-1',
+}
+
+
+class TestResourceInstancesModule(ModuleTestCase):
+    """
+    Test class for the bulk ResourceInstance module testing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+
+        self.sdk = MagicMock()
+        self.sdk.list_resource_instances.return_value = DetailedResponseMock(EXISTING_INSTANCES)
+        self.sdk.create_resource_instance.side_effect = lambda name, **kwargs: DetailedResponseMock(
+            {'id': 'crn-' + name, 'guid': 'guid-' + name, 'name': name, 'state': 'provisioning'})
+        self.sdk.delete_resource_instance.return_value = DetailedResponseMock(None)
+
+        self.patcher = patch('plugins.modules.ibm_resource_instances.config.get_resource_contollerV2_sdk', return_value=self.sdk)
+        self.patcher.start()
+        self.catalog_patcher = patch(
+            'plugins.modules.ibm_resource_instances.catalog.get_serviceID_targetCRN_planID',
+            return_value=('service-id', 'catalog-crn', 'plan-id'))
+        self.catalog_mock = self.catalog_patcher.start()
+        self.delays_patcher = patch('plugins.module_utils.wait.get_delays', return_value=[0] * 10)
+        self.delays_patcher.start()
+
+    def tearDown(self):
+        self.delays_patcher.stop()
+        self.catalog_patcher.stop()
+        self.patcher.stop()
+        super().tearDown()
+
+    def test_create_missing_instances(self):
+        """The catalog is resolved once and only the missing instances are created."""
+        set_module_args(dict(BASE_ARGS, instances=[
+            {'name': 'cos-tenant-a'},
+            {'name': 'cos-tenant-b', 'tags': ['tenant:b']},
+            {'name': 'cos-tenant-c', 'parameters': {'key': 'value'}},
+        ]))
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_instances.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert [(item['name'], item['status']) for item in result.exception.args[0]['msg']] == [
+            ('cos-tenant-a', 'exists'), ('cos-tenant-b', 'created'), ('cos-tenant-c', 'created')]
+
+        self.catalog_mock.assert_called_once_with('cloud-object-storage', 'standard', 'global')
+        self.sdk.list_resource_instances.assert_called_once_with(resource_group_id='group-1', resource_plan_id='plan-id', start=None)
+        assert self.sdk.create_resource_instance.call_count == 2
+        self.sdk.create_resource_instance.assert_any_call(
+            name='cos-tenant-b', target='catalog-crn', resource_group='group-1', resource_plan_id='plan-id',
+            tags=['tenant:b'], parameters=None)
+        self.sdk.get_resource_instance.assert_not_called()
+
+    def test_create_and_wait(self):
+        """Each created instance is polled until it's active, a failed one fails the task."""
+        states = {'guid-cos-tenant-c': ['provisioning', 'active'], 'guid-cos-tenant-d': ['failed']}
+        self.sdk.get_resource_instance.side_effect = lambda id: DetailedResponseMock(
+            {'id': id, 'state': states[id].pop(0)})
+
+        set_module_args(dict(BASE_ARGS, wait=True, rate_limit=100, instances=[
+            {'name': 'cos-tenant-c'},
+            {'name': 'cos-tenant-d'},
+        ]))
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_resource_instances.main()
+
+        assert result.exception.args[0]['msg'] == 'Failed to create 1 of 2 resource instances'
+        assert result.exception.args[0]['changed'] is True
+        created, failed = result.exception.args[0]['results']
+        assert created['status'] == 'created'
+        assert created['state'] == 'active'
+        assert failed['status'] == 'failed'
+        assert failed['error'] == 'The instance ended in the state failed'
+        assert self.sdk.get_resource_instance.call_count == 3
+
+    def test_create_all_before_waiting(self):
+        """All the instances are created before the first poll, even with a single worker."""
+        states = {'guid-cos-%d' % index: ['provisioning', 'active'] for index in range(3)}
+        self.sdk.get_resource_instance.side_effect = lambda id: DetailedResponseMock(
+            {'id': id, 'state': states[id].pop(0)})
+
+        set_module_args(dict(BASE_ARGS, wait=True, parallelism=1, instances=[
+            {'name': 'cos-%d' % index} for index in range(3)]))
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_instances.main()
+
+        assert [item['state'] for item in result.exception.args[0]['msg']] == ['active'] * 3
+        calls = [name for name, _args, _kwargs in self.sdk.method_calls if name != 'list_resource_instances']
+        assert calls == ['create_resource_instance'] * 3 + ['get_resource_instance'] * 6
+
+    def test_wait_timeout(self):
+        """The instances that aren't active within the timeout are reported as failed."""
+        self.sdk.get_resource_instance.side_effect = lambda id: DetailedResponseMock({'id': id, 'state': 'provisioning'})
+
+        set_module_args(dict(BASE_ARGS, wait=True, wait_timeout=0, instances=[{'name': 'cos-tenant-c'}]))
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_resource_instances.main()
+
+        failed = result.exception.args[0]['results'][0]
+        assert failed['status'] == 'failed'
+        assert failed['error'] == 'Timed out after 0 seconds'
+        assert failed['state'] == 'provisioning'
+
+    def test_delete_instances(self):
+        """Only the existing instances are deleted."""
+        set_module_args(dict(BASE_ARGS, state='absent', recursive=True, instances=[
+            {'name': 'cos-tenant-a'},
+            {'name': 'cos-tenant-b'},
+        ]))
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_instances.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert [(item['name'], item['status']) for item in result.exception.args[0]['msg']] == [
+            ('cos-tenant-a', 'deleted'), ('cos-tenant-b', 'not_found')]
+        self.sdk.delete_resource_instance.assert_called_once_with(id='guid-1', recursive=True)
+
+    def test_create_failed(self):
+        """A failed create is reported and fails the task."""
+        self.sdk.create_resource_instance.side_effect = ApiException(400, message='Quota exceeded')
+
+        set_module_args(dict(BASE_ARGS, instances=[{'name': 'cos-tenant-c'}]))
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_resource_instances.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['results'] == [{'name': 'cos-tenant-c', 'status': 'failed', 'error': 'Quota exceeded'}]
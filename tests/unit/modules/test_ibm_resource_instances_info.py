@@ -2,7 +2,10 @@
 # GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 
+import json
 import os
+import shutil
+import tempfile
 
 from ibm_cloud_sdk_core import ApiException
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
@@ -20,7 +23,7 @@ class TestResourceInstancesListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_instances_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -38,7 +41,7 @@ class TestResourceInstancesListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_instances_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_resource_instances error')
@@ -53,3 +56,124 @@ class TestResourceInstancesListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_resource_instances_all_pages_success(self):
+        """Test the "list" path - all pages."""
+        pages = [
+            {'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page2', 'resources': [{'id': '1'}, {'id': '2'}]},
+            {'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page3', 'resources': [{'id': '3'}, {'id': '4'}]},
+            {'rows_count': 1, 'next_url': None, 'resources': [{'id': '5'}]},
+        ]
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.side_effect = [DetailedResponseMock(page) for page in pages]
+
+        set_module_args({
+            'limit': 2,
+            'all_pages': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        msg = result.exception.args[0]['msg']
+        assert [resource['id'] for resource in msg['resources']] == ['1', '2', '3', '4', '5']
+        assert msg['rows_count'] == 5
+        assert msg['truncated'] is False
+
+        assert mock.call_count == 3
+        assert [call.kwargs['start'] for call in mock.call_args_list] == [None, 'page2', 'page3']
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_all_pages_max_items(self):
+        """Test the "list" path - all pages, capped by max_items."""
+        pages = [
+            {'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page2', 'resources': [{'id': '1'}, {'id': '2'}]},
+            {'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page3', 'resources': [{'id': '3'}, {'id': '4'}]},
+        ]
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.side_effect = [DetailedResponseMock(page) for page in pages]
+
+        set_module_args({
+            'limit': 2,
+            'all_pages': True,
+            'max_items': 3,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        msg = result.exception.args[0]['msg']
+        assert [resource['id'] for resource in msg['resources']] == ['1', '2', '3']
+        assert msg['truncated'] is True
+        assert msg['next_url'] is None
+
+        assert mock.call_count == 2
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_all_pages_invalid_max_items(self):
+        """Test the "list" path - all pages, max_items below 1."""
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+
+        set_module_args({
+            'all_pages': True,
+            'max_items': 0,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert result.exception.args[0]['msg'] == 'max_items must be at least 1, got 0'
+
+        mock.assert_not_called()
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_all_pages_dest(self):
+        """Test the "list" path - all pages, written to a file."""
+        pages = [
+            {'rows_count': 1, 'next_url': '/v2/resource_instances?start=page2', 'resources': [{'id': '1'}]},
+            {'rows_count': 1, 'next_url': None, 'resources': [{'id': '2'}]},
+        ]
+
+        patcher = patch(
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.side_effect = [DetailedResponseMock(page) for page in pages]
+
+        dest = os.path.join(tempfile.mkdtemp(), 'instances.jsonl')
+        set_module_args({
+            'all_pages': True,
+            'dest': dest,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        msg = result.exception.args[0]['msg']
+        assert msg['dest'] == dest
+        assert msg['rows_count'] == 2
+        assert 'resources' not in msg
+
+        with open(dest) as dest_file:
+            assert [json.loads(line)['id'] for line in dest_file] == ['1', '2']
+
+        shutil.rmtree(os.path.dirname(dest))
+        patcher.stop()
@@ -78,7 +78,7 @@ class TestResourceKeyPostModule(ModuleTestCase):
         """Test the inner "read" path in this module with a server error response."""
 
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         mock = patcher.start()
         mock.side_effect = ApiException(500, message='Something went wrong...')
 
@@ -119,12 +119,12 @@ class TestResourceKeyPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.create_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_key')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
 
         set_module_args({
@@ -163,11 +163,11 @@ class TestResourceKeyPostModule(ModuleTestCase):
         """Test the "create" path - failed."""
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
 
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.create_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.create_resource_key')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Create ibm_resource_key error')
@@ -215,14 +215,14 @@ class TestResourceKeyPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.update_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_key')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock(resource)
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
-        get_resource_key_mock.return_value = DetailedResponseMock(resource)
+        get_resource_key_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -270,15 +270,15 @@ class TestResourceKeyPostModule(ModuleTestCase):
         }
 
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.update_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.update_resource_key')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Update ibm_resource_key error')
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
-        get_resource_key_mock.return_value = DetailedResponseMock(resource)
+        get_resource_key_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'id': 'testString',
@@ -321,12 +321,12 @@ class TestResourceKeyPostModule(ModuleTestCase):
     def test_delete_ibm_resource_key_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.delete_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_key')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
         get_resource_key_mock.return_value = DetailedResponseMock()
 
@@ -374,12 +374,12 @@ class TestResourceKeyPostModule(ModuleTestCase):
     def test_delete_ibm_resource_key_not_exists(self):
         """Test the "delete" path - not exists."""
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.delete_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_key')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock()
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
         get_resource_key_mock.side_effect = ApiException(404)
 
@@ -424,13 +424,13 @@ class TestResourceKeyPostModule(ModuleTestCase):
     def test_delete_ibm_resource_key_failed(self):
         """Test the "delete" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.delete_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.delete_resource_key')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='Delete ibm_resource_key error')
 
         get_resource_key_patcher = patch(
-            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
         get_resource_key_mock.return_value = DetailedResponseMock()
 
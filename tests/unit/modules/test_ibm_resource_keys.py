@@ -0,0 +1,188 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import os
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from .common import DetailedResponseMock
+from plugins.modules import ibm_resource_keys
+
+
+def source_crn(guid: str) -> str:
+    return 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:%s::' % guid
+
+
+EXISTING_KEYS = {
+    'resources': [
+        {'id': 'key1', 'name': 'old-key', 'state': 'active', 'source_crn': source_crn('instance1')},
+        {'id': 'key2', 'name': 'new-key', 'state': 'active', 'source_crn': source_crn('instance2')},
+        {'id': 'key3', 'name': 'other-key', 'state': 'active', 'source_crn': source_crn('instance3')},
+        {'id': 'key4', 'name': 'old-key', 'state': 'removed', 'source_crn': source_crn('instance2')},
+    ],
+    'next_url': None,
+}
+
+
+class TestResourceKeysModule(ModuleTestCase):
+    """
+    Test class for the bulk ResourceKey module testing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+
+        self.sdk = MagicMock()
+        self.sdk.list_resource_keys.return_value = DetailedResponseMock(EXISTING_KEYS)
+        self.sdk.create_resource_key.side_effect = lambda name, source, **kwargs: DetailedResponseMock(
+            {'id': 'created-' + source, 'name': name, 'credentials': {'apikey': 'secret'}})
+        self.sdk.delete_resource_key.return_value = DetailedResponseMock(None)
+        self.sdk.get_resource_alias.side_effect = ApiException(404, message='Alias not found')
+
+        self.patcher = patch('plugins.modules.ibm_resource_keys.config.get_resource_contollerV2_sdk', return_value=self.sdk)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        super().tearDown()
+
+    def test_create_missing_keys(self):
+        """Only the keys that don't exist are created."""
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': 'instance1', 'role': 'Writer'},
+                {'name': 'new-key', 'source': 'instance2', 'role': 'Writer'},
+            ],
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        assert result.exception.args[0]['changed'] is True
+        results = result.exception.args[0]['msg']
+        assert [(res['source'], res['status'], res['id']) for res in results] == [
+            ('instance1', 'created', 'created-instance1'),
+            ('instance2', 'exists', 'key2'),
+        ]
+        self.sdk.list_resource_keys.assert_called_once()
+        self.sdk.create_resource_key.assert_called_once_with(name='new-key', source='instance1', parameters=None, role='Writer')
+        self.sdk.delete_resource_key.assert_not_called()
+
+    def test_purge_keys(self):
+        """With purge, the other keys of the given sources are deleted."""
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': 'instance1'},
+                {'name': 'new-key', 'source': 'instance2'},
+            ],
+            'purge': True,
+            'parallelism': 2,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        results = result.exception.args[0]['msg']
+        assert [(res['name'], res['source'], res['status']) for res in results] == [
+            ('new-key', 'instance1', 'created'),
+            ('new-key', 'instance2', 'exists'),
+            ('old-key', 'instance1', 'deleted'),
+        ]
+        self.sdk.delete_resource_key.assert_called_once_with(id='key1')
+
+    def test_delete_keys(self):
+        """Only the existing keys are deleted."""
+        set_module_args({
+            'keys': [
+                {'name': 'old-key', 'source': 'instance1'},
+                {'name': 'old-key', 'source': 'instance2'},
+            ],
+            'state': 'absent',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        assert result.exception.args[0]['changed'] is True
+        results = result.exception.args[0]['msg']
+        assert [res['status'] for res in results] == ['deleted', 'not_found']
+        self.sdk.delete_resource_key.assert_called_once_with(id='key1')
+        self.sdk.create_resource_key.assert_not_called()
+
+    def test_no_changes(self):
+        """Nothing is changed when all keys exist."""
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': 'instance2'},
+            ],
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        assert result.exception.args[0]['changed'] is False
+
+    def test_source_by_crn(self):
+        """A source given by the CRN of its instance matches the existing keys."""
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': source_crn('instance2')},
+                {'name': 'new-key', 'source': source_crn('instance3')},
+            ],
+            'purge': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        results = result.exception.args[0]['msg']
+        assert [(res['name'], res['source'], res['status']) for res in results] == [
+            ('new-key', source_crn('instance2'), 'exists'),
+            ('new-key', source_crn('instance3'), 'created'),
+            ('other-key', 'instance3', 'deleted'),
+        ]
+        self.sdk.get_resource_alias.assert_not_called()
+        self.sdk.create_resource_key.assert_called_once_with(
+            name='new-key', source=source_crn('instance3'), parameters=None, role=None)
+        self.sdk.delete_resource_key.assert_called_once_with(id='key3')
+
+    def test_source_by_alias(self):
+        """A source given by an alias ID is resolved to the instance of the alias."""
+        self.sdk.get_resource_alias.side_effect = None
+        self.sdk.get_resource_alias.return_value = DetailedResponseMock(
+            {'id': 'alias1', 'resource_instance_id': source_crn('instance2')})
+
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': 'alias1'},
+            ],
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_resource_keys.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'][0]['id'] == 'key2'
+        self.sdk.get_resource_alias.assert_called_once_with(id='alias1')
+        self.sdk.create_resource_key.assert_not_called()
+
+    def test_failed_keys(self):
+        """The module fails with the results of all keys when a call fails."""
+        self.sdk.create_resource_key.side_effect = ApiException(400, message='Create ibm_resource_key error')
+
+        set_module_args({
+            'keys': [
+                {'name': 'new-key', 'source': 'instance1'},
+                {'name': 'new-key', 'source': 'instance2'},
+            ],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            ibm_resource_keys.main()
+
+        assert result.exception.args[0]['msg'] == 'Failed to create or delete 1 of 2 resource keys'
+        assert result.exception.args[0]['results'][0]['error'] == 'Create ibm_resource_key error'
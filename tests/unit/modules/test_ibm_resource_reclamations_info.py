@@ -20,7 +20,7 @@ class TestReclamationsListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_reclamations_success(self):
         """Test the "list" path - successful."""
         patcher = patch(
-            'plugins.modules.ibm_resource_reclamations_info.ResourceControllerV2.list_reclamations')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_reclamations')
         mock = patcher.start()
         mock.return_value = DetailedResponseMock([])
 
@@ -38,7 +38,7 @@ class TestReclamationsListModuleInfo(ModuleTestCase):
     def test_list_ibm_resource_reclamations_failed(self):
         """Test the "list" path - failed."""
         patcher = patch(
-            'plugins.modules.ibm_resource_reclamations_info.ResourceControllerV2.list_reclamations')
+            'ibm_platform_services.resource_controller_v2.ResourceControllerV2.list_reclamations')
         mock = patcher.start()
         mock.side_effect = ApiException(
             400, message='List ibm_resource_reclamations error')
@@ -235,7 +235,7 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
         get_inventory_patcher = patch(
             'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
         get_inventory_mock = get_inventory_patcher.start()
-        get_inventory_mock.return_value = DetailedResponseMock(resource)
+        get_inventory_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'inventory_id': 'testString',
@@ -307,7 +307,7 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
         get_inventory_patcher = patch(
             'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
         get_inventory_mock = get_inventory_patcher.start()
-        get_inventory_mock.return_value = DetailedResponseMock(resource)
+        get_inventory_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'inventory_id': 'testString',
@@ -4,7 +4,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
 import os
+import tempfile
 
 from .common import DetailedResponseMock
 from plugins.modules import ibm_schematics_job
@@ -769,6 +771,152 @@ class TestJobModule(ModuleTestCase):
         get_job_patcher.stop()
         patcher.stop()
 
+    def test_create_ibm_schematics_job_wait_success(self):
+        """Test the "create" path - waits until the job is finished."""
+        def job(status_code):
+            return {'id': 'testString', 'status': {'workspace_job_status': {'status_code': status_code}}}
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.create_job')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(job('job_pending'))
+
+        get_job_patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.get_job')
+        get_job_mock = get_job_patcher.start()
+        get_job_mock.side_effect = [
+            DetailedResponseMock(job('job_pending')),
+            DetailedResponseMock(job('job_in_progress')),
+            DetailedResponseMock(job('job_finished')),
+        ]
+
+        delays_patcher = patch('plugins.module_utils.wait.get_delays', return_value=[0, 0])
+        delays_patcher.start()
+
+        set_module_args({
+            'command_object': 'workspace',
+            'command_object_id': 'testString',
+            'command_name': 'workspace_plan',
+            'wait': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_job.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == job('job_finished')
+        assert result.exception.args[0]['job_status'] == 'job_finished'
+        assert result.exception.args[0]['polls'] == 3
+
+        mock.assert_called_once()
+        assert get_job_mock.call_count == 3
+        get_job_mock.assert_called_with(job_id='testString', profile=None)
+
+        delays_patcher.stop()
+        get_job_patcher.stop()
+        patcher.stop()
+
+    def test_create_ibm_schematics_job_wait_failed(self):
+        """Test the "create" path - the task fails when the job fails."""
+        job = {'id': 'testString', 'status': {'action_job_status': {'status_code': 'job_failed'}}}
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.create_job')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({'id': 'testString'})
+
+        get_job_patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.get_job')
+        get_job_mock = get_job_patcher.start()
+        get_job_mock.return_value = DetailedResponseMock(job)
+
+        set_module_args({
+            'command_object': 'action',
+            'command_object_id': 'testString',
+            'command_name': 'ansible_playbook_run',
+            'wait': True,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_job.main()
+
+        assert result.exception.args[0]['msg'] == 'The job testString ended with the status job_failed'
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['job'] == job
+
+        get_job_patcher.stop()
+        patcher.stop()
+
+    def test_create_ibm_schematics_job_log_dest(self):
+        """Test the "create" path - tails the job log to a file."""
+        def job(status_code):
+            return {'id': 'testString', 'status': {'workspace_job_status': {'status_code': status_code}}}
+
+        def job_log(text):
+            return DetailedResponseMock({'job_id': 'testString', 'details': base64.b64encode(text).decode()})
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.create_job')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(job('job_pending'))
+
+        get_job_patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.get_job')
+        get_job_mock = get_job_patcher.start()
+        get_job_mock.side_effect = [
+            DetailedResponseMock(job('job_pending')),
+            DetailedResponseMock(job('job_in_progress')),
+            DetailedResponseMock(job('job_finished')),
+        ]
+
+        list_job_logs_patcher = patch(
+            'plugins.modules.ibm_schematics_job.SchematicsV1.list_job_logs')
+        list_job_logs_mock = list_job_logs_patcher.start()
+        list_job_logs_mock.side_effect = [
+            ApiException(404, message='Not found'),
+            job_log(b'init\n'),
+            job_log(b'init\nplan\ndone\n'),
+        ]
+
+        delays_patcher = patch('plugins.module_utils.wait.get_delays', return_value=[0, 0])
+        delays_patcher.start()
+
+        log_dir = tempfile.mkdtemp()
+        log_dest = os.path.join(log_dir, 'job.log')
+        with open(log_dest, 'w') as log_file:
+            log_file.write('previous job\n')
+
+        set_module_args({
+            'command_object': 'workspace',
+            'command_object_id': 'testString',
+            'command_name': 'workspace_plan',
+            'log_dest': log_dest,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_job.main()
+
+        assert result.exception.args[0]['job_status'] == 'job_finished'
+        assert result.exception.args[0]['log_bytes'] == len(b'init\nplan\ndone\n')
+        with open(log_dest, 'rb') as log_file:
+            assert log_file.read() == b'init\nplan\ndone\n'
+
+        assert list_job_logs_mock.call_count == 3
+        list_job_logs_mock.assert_called_with(job_id='testString')
+
+        os.remove(log_dest)
+        os.rmdir(log_dir)
+        delays_patcher.stop()
+        list_job_logs_patcher.stop()
+        get_job_patcher.stop()
+        patcher.stop()
+
     def test_update_ibm_schematics_job_success(self):
         """Test the "update" path - successful."""
         variable_metadata_model = {
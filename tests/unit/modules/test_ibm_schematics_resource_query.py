@@ -251,7 +251,7 @@ class TestResourceQueryRecordModule(ModuleTestCase):
         get_resources_query_patcher = patch(
             'plugins.modules.ibm_schematics_resource_query.SchematicsV1.get_resources_query')
         get_resources_query_mock = get_resources_query_patcher.start()
-        get_resources_query_mock.return_value = DetailedResponseMock(resource)
+        get_resources_query_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'query_id': 'testString',
@@ -325,7 +325,7 @@ class TestResourceQueryRecordModule(ModuleTestCase):
         get_resources_query_patcher = patch(
             'plugins.modules.ibm_schematics_resource_query.SchematicsV1.get_resources_query')
         get_resources_query_mock = get_resources_query_patcher.start()
-        get_resources_query_mock.return_value = DetailedResponseMock(resource)
+        get_resources_query_mock.return_value = DetailedResponseMock(dict(resource, name='old-name'))
 
         set_module_args({
             'query_id': 'testString',
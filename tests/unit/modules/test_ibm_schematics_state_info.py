@@ -4,7 +4,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import gzip
+import hashlib
 import os
+import tempfile
 
 from .common import DetailedResponseMock
 from plugins.modules import ibm_schematics_state_info
@@ -17,6 +20,24 @@ except ImportError:
     pass
 
 
+STATE = b'{"version": 4, "resources": []}'
+
+
+class StreamedResponseMock:
+    """Mock class for a streamed requests response."""
+
+    def __init__(self, content):
+        self.content = content
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), 8):
+            yield self.content[start:start + 8]
+
+    def close(self):
+        self.closed = True
+
+
 class TestTemplateStateStoreModuleInfo(ModuleTestCase):
     """
     Test class for TemplateStateStore module testing.
@@ -67,3 +88,77 @@ class TestTemplateStateStoreModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_schematics_state_dest(self):
+        """Test the "list" path - the statefile is streamed to a gzip file."""
+        response = StreamedResponseMock(STATE)
+        patcher = patch(
+            'plugins.modules.ibm_schematics_state_info.SchematicsV1.get_workspace_template_state')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(response)
+
+        dest_dir = tempfile.mkdtemp()
+        dest = os.path.join(dest_dir, 'terraform.tfstate.gz')
+
+        set_module_args({
+            'w_id': 'testString',
+            't_id': 'testString',
+            'dest': dest,
+            'gzip': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_state_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'dest': dest,
+            'size': len(STATE),
+            'checksum': hashlib.sha256(STATE).hexdigest(),
+        }
+        assert result.exception.args[0]['changed'] is True
+        with gzip.open(dest, 'rb') as state_file:
+            assert state_file.read() == STATE
+        assert os.listdir(dest_dir) == ['terraform.tfstate.gz']
+        assert response.closed
+
+        mock.assert_called_once_with(w_id='testString', t_id='testString', stream=True)
+
+        # The same statefile leaves the file as it is.
+        mock.return_value = DetailedResponseMock(StreamedResponseMock(STATE))
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_schematics_state_info.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert os.listdir(dest_dir) == ['terraform.tfstate.gz']
+
+        os.remove(dest)
+        os.rmdir(dest_dir)
+        patcher.stop()
+
+    def test_list_ibm_schematics_state_checksum_only(self):
+        """Test the "list" path - only the checksum of the statefile is returned."""
+        patcher = patch(
+            'plugins.modules.ibm_schematics_state_info.SchematicsV1.get_workspace_template_state')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(StreamedResponseMock(STATE))
+
+        set_module_args({
+            'w_id': 'testString',
+            't_id': 'testString',
+            'checksum_only': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_state_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'size': len(STATE),
+            'checksum': hashlib.sha256(STATE).hexdigest(),
+        }
+
+        mock.assert_called_once_with(w_id='testString', t_id='testString', stream=True)
+        patcher.stop()
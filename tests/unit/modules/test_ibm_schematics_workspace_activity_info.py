@@ -0,0 +1,133 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+
+from .common import DetailedResponseMock
+from plugins.modules import ibm_schematics_workspace_activity_info
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleExitJson, set_module_args
+
+
+def activity(action_id, performed_at):
+    return {'action_id': action_id, 'name': 'PLAN', 'status': 'COMPLETED', 'performed_at': performed_at}
+
+
+class TestWorkspaceActivityModuleInfo(ModuleTestCase):
+    """
+    Test class for WorkspaceActivity module testing.
+    """
+
+    def test_read_ibm_schematics_workspace_activity_success(self):
+        """Test the "read" path - successful."""
+        resource = activity('testString', '2023-04-01T12:00:00Z')
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_workspace_activity_info.SchematicsV1.get_workspace_activity')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(resource)
+
+        set_module_args({
+            'w_id': 'testString',
+            'activity_id': 'testString',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_workspace_activity_info.main()
+
+        assert result.exception.args[0]['msg'] == resource
+
+        mock.assert_called_once_with(w_id='testString', activity_id='testString')
+        patcher.stop()
+
+    def test_list_ibm_schematics_workspace_activity_since(self):
+        """Test the "list" path - stops at the page that reaches the timestamp."""
+        patcher = patch(
+            'plugins.modules.ibm_schematics_workspace_activity_info.SchematicsV1.list_workspace_activities')
+        mock = patcher.start()
+        mock.side_effect = [
+            DetailedResponseMock({'actions': [activity('a3', '2023-04-03T00:00:00Z'), activity('a2', '2023-04-02T00:00:00Z')]}),
+            DetailedResponseMock({'actions': [activity('a1', '2023-04-01T00:00:00Z'), activity('a0', '2023-03-31T00:00:00Z')]}),
+            DetailedResponseMock({'actions': [activity('old', '2023-03-30T00:00:00Z')]}),
+        ]
+
+        patch_size = patch('plugins.modules.ibm_schematics_workspace_activity_info.ACTIVITIES_PAGE_SIZE', 2)
+        patch_size.start()
+
+        set_module_args({
+            'w_id': 'testString',
+            'since': '2023-04-01T00:00:00Z',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_workspace_activity_info.main()
+
+        assert [item['action_id'] for item in result.exception.args[0]['msg']['actions']] == ['a3', 'a2']
+        assert result.exception.args[0]['msg']['cursor'] == {'activity_id': 'a3', 'performed_at': '2023-04-03T00:00:00Z'}
+        assert result.exception.args[0]['changed'] is False
+
+        assert mock.call_count == 2
+        mock.assert_called_with(w_id='testString', offset=2, limit=2)
+
+        patch_size.stop()
+        patcher.stop()
+
+    def test_list_ibm_schematics_workspace_activity_state_file(self):
+        """Test the "list" path - the cursor is read from and saved to the state file."""
+        patcher = patch(
+            'plugins.modules.ibm_schematics_workspace_activity_info.SchematicsV1.list_workspace_activities')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({'actions': [
+            activity('a3', '2023-04-03T00:00:00Z'),
+            activity('a2', '2023-04-02T00:00:00Z'),
+            activity('a1', '2023-04-01T00:00:00Z'),
+        ]})
+
+        state_dir = tempfile.mkdtemp()
+        state_file = os.path.join(state_dir, 'activities.json')
+        other = {'activity_id': 'b1', 'performed_at': '2023-01-01T00:00:00Z'}
+        with open(state_file, 'w') as f:
+            json.dump({
+                'testString': {'activity_id': 'a2', 'performed_at': '2023-04-02T00:00:00Z'},
+                'other': other,
+            }, f)
+
+        set_module_args({
+            'w_id': 'testString',
+            'state_file': state_file,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_workspace_activity_info.main()
+
+        assert [item['action_id'] for item in result.exception.args[0]['msg']['actions']] == ['a3']
+        assert result.exception.args[0]['changed'] is True
+
+        with open(state_file) as f:
+            assert json.load(f) == {
+                'testString': {'activity_id': 'a3', 'performed_at': '2023-04-03T00:00:00Z'},
+                'other': other,
+            }
+
+        # Nothing is new on the next run.
+        with self.assertRaises(AnsibleExitJson) as result:
+            ibm_schematics_workspace_activity_info.main()
+
+        assert result.exception.args[0]['msg']['actions'] == []
+        assert result.exception.args[0]['msg']['cursor'] == {'activity_id': 'a3', 'performed_at': '2023-04-03T00:00:00Z'}
+        assert result.exception.args[0]['changed'] is False
+
+        os.remove(state_file)
+        os.rmdir(state_dir)
+        patcher.stop()
@@ -50,6 +50,36 @@ class TestWorkspaceResponseModuleInfo(ModuleTestCase):
 
         patcher.stop()
 
+    def test_read_ibm_schematics_workspace_fields(self):
+        """Test the "read" path - only the given fields are returned."""
+        datasource = {
+            'id': 'testString',
+            'name': 'testWorkspace',
+            'template_data': [{'id': 'testTemplate', 'variablestore': [{'name': 'var'}]}],
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_workspace_info.SchematicsV1.get_workspace')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(datasource)
+
+        set_module_args({
+            'w_id': 'testString',
+            'fields': ['name', 'template_data.id'],
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_workspace_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'name': 'testWorkspace',
+            'template_data': [{'id': 'testTemplate'}],
+        }
+
+        patcher.stop()
+
     def test_read_ibm_schematics_workspace_failed(self):
         """Test the "read" path - failed."""
         patcher = patch(
@@ -0,0 +1,90 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import sys
+import unittest
+
+from ansible.module_utils import basic
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from plugins.action.ibm_cloud import ActionModule
+
+
+class FakeModule:
+    """A module that returns its arguments and the API key of its environment."""
+
+    def __init__(self, error=None):
+        self.error = error
+
+    def main(self):
+        if self.error:
+            raise self.error
+        args = json.loads(basic._ANSIBLE_ARGS)['ANSIBLE_MODULE_ARGS']
+        print(json.dumps({'changed': False, 'args': args, 'apikey': os.environ.get('IC_API_KEY')}))
+        sys.exit(0)
+
+
+class TestControllerExecution(unittest.TestCase):
+    """
+    Test class for the action plugin that runs the modules in the controller.
+    """
+
+    def setUp(self):
+        task = MagicMock()
+        task.action = 'ibm.cloud.ibm_resource_keys'
+        task.resolved_action = 'ibm.cloud.ibm_resource_keys'
+        task.args = {'keys': []}
+        task.async_val = 0
+        task.environment = [{'IC_API_KEY': 'taskAPIKey'}]
+        connection = MagicMock()
+        connection.transport = 'local'
+        templar = MagicMock()
+        templar.template.side_effect = lambda value: value
+
+        self.action = ActionModule(task, connection, MagicMock(), MagicMock(), templar, MagicMock())
+
+        for patcher in (
+            patch('ansible.plugins.action.ActionBase.run', return_value={}),
+            patch.object(ActionModule, '_update_module_args'),
+            patch('plugins.action.ibm_cloud.NormalActionModule.run', return_value={'executed': 'remote'}),
+            patch.dict(os.environ, {'IC_API_KEY': 'controllerAPIKey'}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_runs_in_controller(self):
+        with patch('plugins.action.ibm_cloud.importlib.import_module', return_value=FakeModule()) as import_mock:
+            result = self.action.run(task_vars={'ibm_cloud_controller_execution': 'true'})
+
+        assert result == {'changed': False, 'args': {'keys': []}, 'apikey': 'taskAPIKey'}
+        import_mock.assert_called_once_with('ansible_collections.ibm.cloud.plugins.modules.ibm_resource_keys')
+        assert os.environ['IC_API_KEY'] == 'controllerAPIKey'
+
+    def test_module_failure(self):
+        with patch('plugins.action.ibm_cloud.importlib.import_module', return_value=FakeModule(ValueError('boom'))):
+            result = self.action.run(task_vars={'ibm_cloud_controller_execution': True})
+
+        assert result['failed'] is True
+        assert result['msg'] == 'MODULE FAILURE: boom'
+        assert 'ValueError' in result['exception']
+        assert os.environ['IC_API_KEY'] == 'controllerAPIKey'
+
+    def test_disabled_by_default(self):
+        with patch('plugins.action.ibm_cloud.importlib.import_module') as import_mock:
+            result = self.action.run(task_vars={})
+
+        assert result == {'executed': 'remote'}
+        import_mock.assert_not_called()
+
+    def test_remote_and_async_tasks_run_as_usual(self):
+        self.action._connection.transport = 'ssh'
+        assert self.action.run(task_vars={'ibm_cloud_controller_execution': True}) == {'executed': 'remote'}
+
+        self.action._connection.transport = 'local'
+        self.action._task.async_val = 60
+        assert self.action.run(task_vars={'ibm_cloud_controller_execution': True}) == {'executed': 'remote'}
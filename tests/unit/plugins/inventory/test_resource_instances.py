@@ -0,0 +1,155 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import unittest
+
+from ansible.inventory.data import InventoryData
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from plugins.inventory.resource_instances import InventoryModule
+from ...modules.common import DetailedResponseMock
+
+
+OPTIONS = {
+    'resource_group_id': None,
+    'resource_id': None,
+    'state': 'active',
+    'hostname': 'name',
+    'include_tags': True,
+    'parallelism': 2,
+    'strict': False,
+    'compose': {},
+    'groups': {},
+    'keyed_groups': [],
+}
+
+PAGES = {
+    None: {
+        'resources': [
+            {
+                'name': 'cos-instance',
+                'guid': 'guid1',
+                'crn': 'crn:v1:bluemix:public:cloud-object-storage:global:a/account::guid1::',
+                'region_id': 'global',
+                'resource_group_id': 'group1',
+            },
+        ],
+        'next_url': '/v2/resource_instances?start=token2',
+    },
+    'token2': {
+        'resources': [
+            {
+                'name': 'db-instance',
+                'guid': 'guid2',
+                'crn': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/account::guid2::',
+                'region_id': 'us-south',
+                'resource_group_id': 'unknown',
+            },
+        ],
+        'next_url': None,
+    },
+}
+
+TAGS = {
+    'guid1': ['env:prod'],
+    'guid2': [],
+}
+
+
+class TestResourceInstancesInventory(unittest.TestCase):
+    """
+    Test class for the resource_instances inventory plugin.
+    """
+
+    def setUp(self):
+        self.plugin = InventoryModule()
+        self.plugin.inventory = InventoryData()
+        self.options = dict(OPTIONS)
+        self.plugin.get_option = MagicMock(side_effect=lambda option: self.options[option])
+
+        controller = MagicMock()
+        controller.list_resource_instances.side_effect = lambda start=None, **kwargs: DetailedResponseMock(copy.deepcopy(PAGES[start]))
+        manager = MagicMock()
+        manager.list_resource_groups.return_value = DetailedResponseMock({'resources': [{'id': 'group1', 'name': 'Default'}]})
+        tagging = MagicMock()
+        tagging.list_tags.side_effect = lambda attached_to, **kwargs: DetailedResponseMock(
+            {'items': [{'name': tag} for tag in TAGS[attached_to.split(':')[8]]]})
+        self.controller = controller
+        self.tagging = tagging
+
+        self.patchers = [
+            patch('plugins.inventory.resource_instances.config.get_resource_contollerV2_sdk', return_value=controller),
+            patch('plugins.inventory.resource_instances.config.get_resource_manager_sdk', return_value=manager),
+            patch('plugins.inventory.resource_instances.config.get_global_tagging_sdk', return_value=tagging),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_verify_file(self):
+        """Only the configuration files of this plugin are accepted."""
+        with patch('ansible.plugins.inventory.BaseInventoryPlugin.verify_file', return_value=True):
+            assert self.plugin.verify_file('/inventory/resource_instances.yml')
+            assert self.plugin.verify_file('/inventory/prod.resource_instances.yaml')
+            assert not self.plugin.verify_file('/inventory/hosts.yml')
+
+    def test_populate(self):
+        """The instances of all pages are grouped by resource group, service, region and tag."""
+        self.plugin._populate(self.plugin._fetch_instances())
+
+        groups = self.plugin.inventory.groups
+        assert [host.name for host in groups['resource_group_Default'].get_hosts()] == ['cos-instance']
+        assert [host.name for host in groups['resource_group_unknown'].get_hosts()] == ['db-instance']
+        assert [host.name for host in groups['service_cloud_object_storage'].get_hosts()] == ['cos-instance']
+        assert [host.name for host in groups['region_us_south'].get_hosts()] == ['db-instance']
+        assert [host.name for host in groups['tag_env_prod'].get_hosts()] == ['cos-instance']
+
+        host = self.plugin.inventory.get_host('cos-instance')
+        assert host.vars['guid'] == 'guid1'
+        assert host.vars['tags'] == ['env:prod']
+        assert host.vars['resource_group_name'] == 'Default'
+        assert host.vars['service_name'] == 'cloud-object-storage'
+
+        assert self.controller.list_resource_instances.call_count == 2
+        assert self.tagging.list_tags.call_count == 2
+
+    def test_populate_without_tags(self):
+        """No tag requests are made without include_tags, and hosts can be named by GUID."""
+        self.options.update(include_tags=False, hostname='guid')
+
+        self.plugin._populate(self.plugin._fetch_instances())
+
+        assert sorted(self.plugin.inventory.hosts) == ['guid1', 'guid2']
+        assert 'tags' not in self.plugin.inventory.get_host('guid1').vars
+        self.tagging.list_tags.assert_not_called()
+
+    def test_parse_from_cache(self):
+        """The cached instances are used without listing the account."""
+        self.options['cache'] = True
+        cached = PAGES[None]['resources']
+
+        with patch.object(InventoryModule, '_read_config_data'), \
+                patch.object(InventoryModule, 'get_cache_key', return_value='key'):
+            self.plugin._cache = {'key': cached}
+            self.plugin.parse(self.plugin.inventory, MagicMock(), '/inventory/resource_instances.yml')
+
+        assert list(self.plugin.inventory.hosts) == ['cos-instance']
+        self.controller.list_resource_instances.assert_not_called()
+
+    def test_parse_updates_cache(self):
+        """The cache is filled when it's empty."""
+        self.options['cache'] = True
+
+        with patch.object(InventoryModule, '_read_config_data'), \
+                patch.object(InventoryModule, 'get_cache_key', return_value='key'):
+            self.plugin._cache = {}
+            self.plugin.parse(self.plugin.inventory, MagicMock(), '/inventory/resource_instances.yml')
+
+        assert [instance['name'] for instance in self.plugin._cache['key']] == ['cos-instance', 'db-instance']
@@ -0,0 +1,108 @@
+# (C) Copyright IBM Corp. 2023.
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest
+
+from ansible.inventory.data import InventoryData
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from plugins.inventory.schematics_inventory import InventoryModule, parse_inventory_ini
+from ...modules.common import DetailedResponseMock
+
+
+INVENTORIES_INI = '''
+bastion ansible_host=10.0.0.1
+
+[web]
+web1 ansible_host=10.0.1.1 http_port=8080
+web2
+
+[web:vars]
+ansible_user=root
+
+[app:children]
+web
+'''
+
+QUERIES = {
+    'query1': {'name': 'db-servers'},
+    'query2': {'name': 'cache-servers'},
+}
+
+QUERY_OUTPUTS = {
+    'query1': {'response': [{'query_type': 'workspaces', 'query_output': [{'name': 'ip', 'value': '10.0.2.1'}, {'name': 'ip', 'value': '10.0.2.2'}]}]},
+    'query2': {'response': [{'query_type': 'workspaces', 'query_output': [{'name': 'ip', 'value': '10.0.3.1'}]}]},
+}
+
+
+class TestSchematicsInventory(unittest.TestCase):
+    """
+    Test class for the schematics_inventory inventory plugin.
+    """
+
+    def setUp(self):
+        self.plugin = InventoryModule()
+        self.plugin.inventory = InventoryData()
+        self.options = {
+            'inventory_id': 'testString',
+            'parallelism': 2,
+            'strict': False,
+            'compose': {},
+            'groups': {},
+            'keyed_groups': [],
+        }
+        self.plugin.get_option = MagicMock(side_effect=lambda option: self.options[option])
+
+        sdk = MagicMock()
+        sdk.get_inventory.return_value = DetailedResponseMock({
+            'inventories_ini': INVENTORIES_INI,
+            'resource_queries': ['query1', 'query2'],
+        })
+        sdk.get_resources_query.side_effect = lambda query_id: DetailedResponseMock(QUERIES[query_id])
+        sdk.execute_resource_query.side_effect = lambda query_id: DetailedResponseMock(QUERY_OUTPUTS[query_id])
+        self.sdk = sdk
+
+        self.patcher = patch('plugins.inventory.schematics_inventory.config.get_schematicsv1_sdk', return_value=sdk)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_parse_inventory_ini(self):
+        """The groups, children and variables of the INI inventory are parsed."""
+        groups = parse_inventory_ini(INVENTORIES_INI)
+
+        assert groups['ungrouped']['hosts'] == {'bastion': {'ansible_host': '10.0.0.1'}}
+        assert groups['web']['hosts'] == {'web1': {'ansible_host': '10.0.1.1', 'http_port': '8080'}, 'web2': {}}
+        assert groups['web']['vars'] == {'ansible_user': 'root'}
+        assert groups['app']['children'] == ['web']
+
+    def test_populate(self):
+        """The static groups and the resource query outputs become groups of hosts."""
+        self.plugin._populate(self.plugin._resolve_inventory('testString'))
+
+        groups = self.plugin.inventory.groups
+        assert sorted(host.name for host in groups['web'].get_hosts()) == ['web1', 'web2']
+        assert sorted(host.name for host in groups['app'].get_hosts()) == ['web1', 'web2']
+        assert sorted(host.name for host in groups['db_servers'].get_hosts()) == ['10.0.2.1', '10.0.2.2']
+        assert [host.name for host in groups['cache_servers'].get_hosts()] == ['10.0.3.1']
+        assert groups['web'].get_vars() == {'ansible_user': 'root'}
+        assert self.plugin.inventory.get_host('web1').vars['http_port'] == '8080'
+
+        self.sdk.get_inventory.assert_called_once_with(inventory_id='testString')
+        assert self.sdk.execute_resource_query.call_count == 2
+
+    def test_parse_from_cache(self):
+        """The cached groups are used without running the resource queries."""
+        self.options['cache'] = True
+
+        with patch.object(InventoryModule, '_read_config_data'), \
+                patch.object(InventoryModule, 'get_cache_key', return_value='key'):
+            self.plugin._cache = {'key': {'db-servers': {'hosts': {'10.0.2.1': {}}, 'children': [], 'vars': {}}}}
+            self.plugin.parse(self.plugin.inventory, MagicMock(), '/inventory/schematics_inventory.yml')
+
+        assert list(self.plugin.inventory.hosts) == ['10.0.2.1']
+        self.sdk.get_inventory.assert_not_called()